@@ -6,7 +6,6 @@ Integrates SerpApi data with Mapbox for geographic visualization
 
 import os
 import sys
-import sqlite3
 import json
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -14,6 +13,8 @@ from datetime import datetime
 # Add SerpApi path for database access
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../SerpApi'))
 
+from DB.analytics_db import analytics_connection
+
 # Mapbox API key (you'll need to set this)
 MAPBOX_ACCESS_TOKEN = os.getenv('MAPBOX_ACCESS_TOKEN', 'pk.eyJ1IjoiZGVmYXVsdCIsImEiOiJjbGV4YW1wbGUifQ.example')
 
@@ -30,8 +31,8 @@ class MiamiDataVisualization:
         self.miami_center = MIAMI_CENTER
     
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get a read-only snapshot connection (never blocks or waits on ingestion)"""
+        return analytics_connection(self.db_path)
     
     def get_business_locations(self) -> Dict:
         """
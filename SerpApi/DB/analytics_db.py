@@ -0,0 +1,139 @@
+"""
+SerpApi Analytics Read Path
+Read-only connections for reports, so long aggregations and ingestion never
+wait on each other: each connection reads one WAL snapshot of the live
+database, or (optionally) a copy refreshed with the SQLite backup API
+"""
+
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Dict
+
+# Read path defaults (override via environment)
+# Seconds between refreshes of the backup copy; 0 reads the live database
+DEFAULT_SNAPSHOT_SECONDS = float(os.getenv('SERPAPI_ANALYTICS_SNAPSHOT_SECONDS', '0'))
+DEFAULT_BUSY_TIMEOUT_MS = int(os.getenv('SERPAPI_ANALYTICS_BUSY_TIMEOUT_MS', '5000'))
+DEFAULT_CACHE_SIZE_KB = int(os.getenv('SERPAPI_ANALYTICS_CACHE_KB', '32768'))
+
+def _uri(db_path: str, **params) -> str:
+    query = '&'.join(f"{key}={value}" for key, value in params.items())
+    return f"{pathlib.Path(os.path.abspath(db_path)).as_uri()}?{query}"
+
+def connect_readonly(db_path: str, immutable: bool = False) -> sqlite3.Connection:
+    """
+    Open a read-only connection holding a single snapshot
+
+    A read transaction is started immediately, so every query on the
+    connection sees the same state of the database until it is closed. In WAL
+    mode that snapshot costs writers nothing; they keep appending to the WAL.
+
+    Args:
+        db_path: Database file (must exist; read-only connections cannot create it)
+        immutable: The file never changes while open (backup copies); skips locking
+    """
+    params = {'mode': 'ro', 'immutable': 1} if immutable else {'mode': 'ro'}
+    conn = sqlite3.connect(_uri(db_path, **params), uri=True, isolation_level=None,
+                           timeout=DEFAULT_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+    conn.execute(f"PRAGMA busy_timeout = {DEFAULT_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size = -{DEFAULT_CACHE_SIZE_KB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("BEGIN")
+    return conn
+
+class SnapshotCopy:
+    """
+    A copy of the database refreshed every refresh_seconds with the backup API
+
+    The copy is written to a temporary file and renamed into place, so open
+    report connections keep reading the previous copy undisturbed. Only one
+    caller refreshes at a time; the others keep using the current copy.
+    """
+
+    def __init__(self, db_path: str, refresh_seconds: float, copy_path: str = None):
+        self.db_path = db_path
+        self.refresh_seconds = refresh_seconds
+        self.copy_path = copy_path or f"{os.path.splitext(db_path)[0]}.analytics.db"
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._counters = {'refreshes': 0, 'refresh_errors': 0}
+
+    def refresh(self):
+        """Copy the live database (one consistent read; writers are not blocked)"""
+        temp_path = f"{self.copy_path}.tmp"
+        source = connect_readonly(self.db_path)
+        try:
+            target = sqlite3.connect(temp_path)
+            try:
+                # One step copies the whole file inside one read transaction;
+                # stepped backups restart whenever a writer commits
+                source.backup(target)
+                # Rollback journal: the copy is opened immutable, without -wal/-shm files
+                target.execute("PRAGMA journal_mode = DELETE")
+            finally:
+                target.close()
+        finally:
+            source.close()
+        os.replace(temp_path, self.copy_path)
+        self._refreshed_at = time.monotonic()
+        self._counters['refreshes'] += 1
+
+    def _ensure_fresh(self):
+        have_copy = os.path.exists(self.copy_path)
+        if have_copy and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+
+        # Without a copy we must wait; with a stale one, let another caller refresh
+        if not self._lock.acquire(blocking=not have_copy):
+            return
+        try:
+            if os.path.exists(self.copy_path) and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+                return
+            try:
+                self.refresh()
+            except sqlite3.Error as e:
+                self._counters['refresh_errors'] += 1
+                if not os.path.exists(self.copy_path):
+                    raise
+                print(f"Warning: Analytics snapshot refresh failed, using previous copy: {e}")
+        finally:
+            self._lock.release()
+
+    def connect(self) -> sqlite3.Connection:
+        self._ensure_fresh()
+        return connect_readonly(self.copy_path, immutable=True)
+
+    def stats(self) -> Dict:
+        stats = dict(self._counters)
+        stats['copy_path'] = self.copy_path
+        stats['age_seconds'] = round(time.monotonic() - self._refreshed_at, 1) if self._refreshed_at else None
+        return stats
+
+# Backup copies by database path
+_copies: Dict[str, SnapshotCopy] = {}
+_copies_lock = threading.Lock()
+
+def analytics_connection(db_path: str, snapshot_seconds: float = None) -> sqlite3.Connection:
+    """
+    Read-only snapshot connection for reports
+
+    Args:
+        db_path: Live database file
+        snapshot_seconds: Read from a backup copy at most this old instead of
+            the live file (default: DEFAULT_SNAPSHOT_SECONDS; 0 = live WAL snapshot)
+
+    Callers close the connection when the report is done, which ends the snapshot.
+    """
+    snapshot_seconds = DEFAULT_SNAPSHOT_SECONDS if snapshot_seconds is None else snapshot_seconds
+    if not snapshot_seconds:
+        return connect_readonly(db_path)
+
+    key = os.path.abspath(db_path)
+    with _copies_lock:
+        copy = _copies.get(key)
+        if copy is None or copy.refresh_seconds != snapshot_seconds:
+            copy = _copies[key] = SnapshotCopy(db_path, snapshot_seconds)
+    return copy.connect()
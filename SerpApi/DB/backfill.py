@@ -0,0 +1,316 @@
+"""
+SerpApi Raw Response Backfill
+Re-derives the normalized tables from the responses stored with each call,
+so a change to the row builders (SAVE_SPECS) can be applied to past data
+without paying for fresh calls
+
+The stored payload is the engine function's parsed result, not SerpApi's
+upstream JSON, so changes to the parse_* functions cannot be replayed;
+they only reach calls made after the change.
+
+Run from the SerpApi directory:
+    python -m DB.backfill --endpoint "Local Businesses (Maps)" --workers 4
+"""
+
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from DB.db_manager import SAVE_SPECS, DELTA_SPECS, decode_payload
+
+# api_calls.api_endpoint -> SAVE_SPECS kind (endpoint names as logged by
+# api_server.py and test_all_apis_miami_movers.py)
+BACKFILL_ENDPOINTS = {
+    'Google Search': 'search_results',
+    'Local Pack (3-pack)': 'local_pack',
+    'Local Businesses (Maps)': 'local_businesses',
+    'Keyword Suggestions': 'keyword_suggestions',
+    'Related Searches': 'related_searches',
+    'People Also Ask': 'people_also_ask',
+    'Keyword Difficulty': 'keyword_difficulty',
+    'SERP Analysis': 'serp_analysis',
+    'Image Search': 'images',
+    'News Search': 'news',
+    'Shopping Search': 'shopping',
+    'Yelp Business Search': 'yelp_businesses',
+    'YouTube Search': 'youtube_videos',
+    'Google Jobs': 'job_listings',
+    'Keyword Volume History': 'keyword_volume_history',
+    'Regional Interest': 'regional_interest',
+}
+
+# Backfill defaults (override via environment)
+DEFAULT_BACKFILL_WORKERS = int(os.getenv('SERPAPI_BACKFILL_WORKERS', str(os.cpu_count() or 1)))
+DEFAULT_BACKFILL_BATCH_SIZE = int(os.getenv('SERPAPI_BACKFILL_BATCH_SIZE', '200'))
+
+_INSERT_TABLE = re.compile(r'INTO\s+(\w+)')
+
+def _target_table(kind: str) -> str:
+    return _INSERT_TABLE.search(SAVE_SPECS[kind][0]).group(1)
+
+def _created_at(value) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+    except ValueError:
+        return None
+
+def build_call_rows(kind: str, calls: List[tuple]) -> List[tuple]:
+    """
+    Decode stored payloads and build their rows (runs in the worker processes)
+
+    Args:
+        kind: Key of SAVE_SPECS
+        calls: (api_call_id, created_at, session_id, encoding, payload, legacy_json) tuples
+
+    Returns:
+        (api_call_id, rows) per call; rows is None when the payload could not
+        be rebuilt, in which case the call's existing rows are left alone
+    """
+    _, build_rows = SAVE_SPECS[kind]
+    built = []
+    for api_call_id, created_at, session_id, encoding, payload, legacy_json in calls:
+        try:
+            raw_json = decode_payload(encoding, payload) if payload is not None else legacy_json
+            data = json.loads(raw_json) if raw_json else None
+            if not isinstance(data, dict) or data.get('status') != 'success':
+                built.append((api_call_id, None))
+                continue
+            # Rows keep the time of the original call, not the time of the backfill
+            built.append((api_call_id, build_rows(data, session_id, api_call_id,
+                                                  _created_at(created_at) or datetime.now())))
+        except Exception as e:
+            print(f"Warning: Could not rebuild {kind} rows for API call {api_call_id}: {e}")
+            built.append((api_call_id, None))
+    return built
+
+class Backfill:
+    """
+    Replays stored responses of one or more endpoints through SAVE_SPECS
+
+    Calls are read newest first and built in a process pool. Every batch
+    deletes and re-inserts the rows of its calls and advances the checkpoint
+    in one transaction, so stopping at any point loses nothing and a rerun
+    with the same name continues below the last written call.
+
+    Tables saved with INSERT OR REPLACE (e.g. local_businesses by place_id)
+    are rebuilt with INSERT OR IGNORE instead: the newest call containing an
+    entity writes it first and older calls cannot overwrite it, which is the
+    state live ingestion leaves behind. session_id is kept from each call's
+    existing rows (api_calls does not record it).
+
+    For the SERP delta kinds (search_results, local_pack, yelp_businesses)
+    only calls that have stored rows are rebuilt: unchanged SERPs were never
+    stored in full and stay that way (reported as skipped_delta_only).
+    serp_current and serp_changes are not touched.
+    """
+
+    def __init__(self, db, endpoints: List[str] = None, name: str = 'default',
+                 workers: int = None, batch_size: int = None):
+        unknown = [e for e in endpoints or [] if e not in BACKFILL_ENDPOINTS]
+        if unknown:
+            raise ValueError(f"No backfill for endpoints: {', '.join(unknown)} "
+                             f"(available: {', '.join(BACKFILL_ENDPOINTS)})")
+
+        self.db = db
+        self.endpoints = endpoints or list(BACKFILL_ENDPOINTS)
+        self.name = name
+        self.workers = workers or DEFAULT_BACKFILL_WORKERS
+        self.batch_size = batch_size or DEFAULT_BACKFILL_BATCH_SIZE
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def _checkpoint(self, endpoint: str) -> Optional[int]:
+        """Lowest call id already written, or None if this backfill has not started"""
+        row = self.db.get_connection().execute("""
+            SELECT last_api_call_id FROM backfill_checkpoints
+            WHERE name = ? AND api_endpoint = ?
+        """, (self.name, endpoint)).fetchone()
+        return row[0] if row else None
+
+    def reset(self, endpoint: str = None):
+        """Forget progress so the next run starts again from the newest call"""
+        with self.db.transaction() as conn:
+            for name in [endpoint] if endpoint else self.endpoints:
+                conn.execute("DELETE FROM backfill_checkpoints WHERE name = ? AND api_endpoint = ?",
+                             (self.name, name))
+
+    # ------------------------------------------------------------------
+    # Reading and writing
+    # ------------------------------------------------------------------
+
+    def _pending_where(self, kind: str, table: str, rows_stored: bool = True) -> str:
+        """
+        Calls below a checkpoint with a stored payload; for delta kinds only
+        those with stored rows (rows_stored=False selects the others)
+        """
+        where = """
+            api_endpoint = ? AND status = 'success' AND id < ?
+            AND (raw_response_hash IS NOT NULL OR raw_response IS NOT NULL)
+        """
+        if kind in DELTA_SPECS:
+            where += f" AND {'' if rows_stored else 'NOT '}EXISTS " \
+                     f"(SELECT 1 FROM {table} t WHERE t.api_call_id = api_calls.id)"
+        return where
+
+    def _read_batches(self, endpoint: str, kind: str, table: str, before_id: int):
+        """Calls with their compressed payloads, newest first, batch_size at a time (decoded in the workers)"""
+        conn = self.db.get_connection()
+        while True:
+            calls = conn.execute(f"""
+                SELECT c.id, c.created_at,
+                       (SELECT MIN(t.session_id) FROM {table} t WHERE t.api_call_id = c.id),
+                       r.encoding, r.payload, c.raw_response
+                FROM (SELECT * FROM api_calls WHERE {self._pending_where(kind, table)}
+                      ORDER BY id DESC LIMIT ?) c
+                LEFT JOIN raw_responses r ON r.content_hash = c.raw_response_hash
+                ORDER BY c.id DESC
+            """, (endpoint, before_id, self.batch_size)).fetchall()
+            if not calls:
+                return
+            yield calls
+            before_id = calls[-1][0]
+
+    def _write(self, endpoint: str, kind: str, table: str, built: List[tuple]) -> Dict:
+        sql = SAVE_SPECS[kind][0].replace('INSERT OR REPLACE', 'INSERT OR IGNORE', 1)
+        rebuilt = [(api_call_id, rows) for api_call_id, rows in built if rows is not None]
+        rows = [row for _, call_rows in rebuilt for row in call_rows]
+        failed = len(built) - len(rebuilt)
+        now = datetime.now()
+
+        with self.db.transaction() as conn:
+            conn.executemany(f"DELETE FROM {table} WHERE api_call_id = ?",
+                             [(api_call_id,) for api_call_id, _ in rebuilt])
+            if rows:
+                conn.executemany(sql, rows)
+            conn.execute("""
+                INSERT INTO backfill_checkpoints (
+                    name, api_endpoint, last_api_call_id, calls_processed, calls_failed,
+                    rows_written, started_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name, api_endpoint) DO UPDATE SET
+                    last_api_call_id = excluded.last_api_call_id,
+                    calls_processed = calls_processed + excluded.calls_processed,
+                    calls_failed = calls_failed + excluded.calls_failed,
+                    rows_written = rows_written + excluded.rows_written,
+                    updated_at = excluded.updated_at,
+                    completed_at = NULL
+            """, (self.name, endpoint, built[-1][0], len(built), failed, len(rows), now, now))
+
+        return {'calls': len(built), 'failed': failed, 'rows': len(rows)}
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
+    def _run_endpoint(self, executor: Optional[ProcessPoolExecutor], endpoint: str, dry_run: bool) -> Dict:
+        kind = BACKFILL_ENDPOINTS[endpoint]
+        table = _target_table(kind)
+        conn = self.db.get_connection()
+        before_id = self._checkpoint(endpoint)
+        report = {'table': table, 'resumed_below_id': before_id}
+        if before_id is None:
+            # Calls logged after the start are saved by the current code anyway
+            before_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM api_calls").fetchone()[0]
+
+        if kind in DELTA_SPECS:
+            report['skipped_delta_only'] = conn.execute(
+                f"SELECT COUNT(*) FROM api_calls WHERE {self._pending_where(kind, table, rows_stored=False)}",
+                (endpoint, before_id)
+            ).fetchone()[0]
+
+        if dry_run:
+            report['pending_calls'] = conn.execute(
+                f"SELECT COUNT(*) FROM api_calls WHERE {self._pending_where(kind, table)}",
+                (endpoint, before_id)
+            ).fetchone()[0]
+            return report
+
+        totals = {'calls': 0, 'failed': 0, 'rows': 0}
+
+        def write(built):
+            for key, value in self._write(endpoint, kind, table, built).items():
+                totals[key] += value
+
+        batches = self._read_batches(endpoint, kind, table, before_id)
+        if executor is None:
+            for calls in batches:
+                write(build_call_rows(kind, calls))
+        else:
+            # Keep a few batches in flight and write them back in call order
+            pending = deque()
+            for calls in batches:
+                pending.append(executor.submit(build_call_rows, kind, calls))
+                if len(pending) >= self.workers * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+
+        with self.db.transaction():
+            conn.execute("""
+                UPDATE backfill_checkpoints SET completed_at = ?
+                WHERE name = ? AND api_endpoint = ?
+            """, (datetime.now(), self.name, endpoint))
+
+        report.update(totals)
+        return report
+
+    def run(self, dry_run: bool = False) -> Dict:
+        """
+        Backfill every selected endpoint
+
+        Args:
+            dry_run: Only count the calls each endpoint would replay
+
+        Returns:
+            Report of calls replayed, calls that failed to rebuild, rows
+            written and (for delta kinds) unchanged calls skipped per endpoint
+        """
+        started = time.perf_counter()
+        report = {'name': self.name, 'dry_run': dry_run, 'endpoints': {}}
+
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 and not dry_run else None
+        try:
+            for endpoint in self.endpoints:
+                report['endpoints'][endpoint] = self._run_endpoint(executor, endpoint, dry_run)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        report['duration_seconds'] = round(time.perf_counter() - started, 2)
+        return report
+
+def run_backfill(db, endpoints: List[str] = None, dry_run: bool = False, **options) -> Dict:
+    """Run a backfill once (see Backfill for options)"""
+    return Backfill(db, endpoints, **options).run(dry_run=dry_run)
+
+if __name__ == "__main__":
+    import argparse
+    from DB.db_manager import get_db
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild normalized tables from stored API responses",
+        epilog="Replays the stored parsed results through the row builders (SAVE_SPECS). "
+               "Changes to the parse_* functions are not applied: the upstream SerpApi "
+               "JSON is not stored. Unchanged SERP calls that only logged a delta are "
+               "skipped and counted as skipped_delta_only.")
+    parser.add_argument('--endpoint', action='append', dest='endpoints',
+                        help="api_calls endpoint to replay (repeatable; default: all)")
+    parser.add_argument('--name', default='default', help="Checkpoint name; reuse to resume")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, help="Calls per batch")
+    parser.add_argument('--restart', action='store_true', help="Ignore saved checkpoints")
+    parser.add_argument('--dry-run', action='store_true', help="Only count pending calls")
+    args = parser.parse_args()
+
+    backfill = Backfill(get_db(), args.endpoints, name=args.name,
+                        workers=args.workers, batch_size=args.batch_size)
+    if args.restart:
+        backfill.reset()
+    print(json.dumps(backfill.run(dry_run=args.dry_run), indent=2, default=str))
@@ -0,0 +1,20 @@
+"""
+SerpApi DB test fixtures
+Shared by the test_*.py modules in this directory
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db_manager import SerpApiDB
+
+@pytest.fixture
+def db(tmp_path):
+    """A fully migrated throwaway database, closed after the test"""
+    database = SerpApiDB(str(tmp_path / 'test.db'))
+    yield database
+    database.close()
@@ -8,8 +8,483 @@ NO MOCK DATA - ALL REAL DATA WITH VALIDATION
 import sqlite3
 import json
 import os
+import re
+import hashlib
+import importlib.util
+import threading
+import weakref
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Connection tuning (override via environment)
+BUSY_TIMEOUT_MS = int(os.getenv('SERPAPI_DB_BUSY_TIMEOUT_MS', '5000'))
+CACHE_SIZE_KB = int(os.getenv('SERPAPI_DB_CACHE_KB', '20000'))
+MMAP_SIZE_BYTES = int(os.getenv('SERPAPI_DB_MMAP_BYTES', str(256 * 1024 * 1024)))
+
+# Compression for raw_responses payloads: zstd when installed, otherwise zlib
+RAW_COMPRESSION = os.getenv('SERPAPI_RAW_COMPRESSION', 'zstd' if zstandard else 'zlib')
+
+# ============================================================================
+# RAW PAYLOAD ENCODING
+# ============================================================================
+
+def encode_payload(raw_json: str) -> Tuple[str, bytes]:
+    """Compress a JSON payload, returning (encoding, blob)"""
+    data = raw_json.encode('utf-8')
+    if RAW_COMPRESSION == 'zstd' and zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=10).compress(data)
+    return 'zlib', zlib.compress(data, 6)
+
+def decode_payload(encoding: str, blob: bytes) -> str:
+    """Decompress a raw_responses payload back to JSON text"""
+    if encoding == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed payload found but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(blob).decode('utf-8')
+    return zlib.decompress(blob).decode('utf-8')
+
+def content_hash(raw_json: str) -> str:
+    return hashlib.sha256(raw_json.encode('utf-8')).hexdigest()
+
+# ============================================================================
+# SCHEMA MIGRATIONS
+# Migration 1 is enhanced_schema.sql; later ones are migrations/NNNN_name.sql
+# or migrations/NNNN_name.py (defining upgrade(conn)). PRAGMA user_version
+# records the last applied migration.
+# ============================================================================
+
+DB_DIR = os.path.dirname(os.path.abspath(__file__))
+MIGRATIONS_DIR = os.path.join(DB_DIR, 'migrations')
+_MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.(sql|py)$')
+
+def load_migrations() -> List[Tuple[int, str, str]]:
+    """List (version, name, path) for every migration, in order"""
+    migrations = [(1, 'enhanced_schema', os.path.join(DB_DIR, 'enhanced_schema.sql'))]
+    if os.path.isdir(MIGRATIONS_DIR):
+        for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+            match = _MIGRATION_FILE.match(filename)
+            if match:
+                migrations.append((int(match.group(1)), match.group(2),
+                                   os.path.join(MIGRATIONS_DIR, filename)))
+    return migrations
+
+def split_sql(script: str) -> List[str]:
+    """Split a SQL script into complete statements (trigger bodies stay whole)"""
+    statements = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ''
+    # Anything left over is trailing comments or whitespace
+    return statements
+
+def apply_migration(conn: sqlite3.Connection, path: str):
+    """Run one migration inside the caller's transaction"""
+    if path.endswith('.py'):
+        spec = importlib.util.spec_from_file_location(f"migration_{os.path.basename(path)[:-3]}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.upgrade(conn)
+        return
+    
+    with open(path, 'r') as f:
+        # Statements run one by one: executescript() would commit the open transaction
+        for statement in split_sql(f.read()):
+            conn.execute(statement)
+
+# ============================================================================
+# ROW BUILDERS
+# Pure functions turning one API result dict into INSERT parameter tuples.
+# Shared by the save_* methods and bulk_save().
+# ============================================================================
+
+def _domain(displayed_link: Optional[str]) -> Optional[str]:
+    return displayed_link.split('/')[0] if displayed_link else None
+
+def search_result_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    keyword = data.get('query', '')
+    location = data.get('location', '')
+    rows = []
+    for result in data.get('organic_results', []):
+        extensions = result.get('rich_snippet', {}).get('top', {}).get('detected_extensions', {})
+        rows.append((
+            keyword, location, result.get('position'), result.get('title'),
+            result.get('link'), result.get('snippet'), _domain(result.get('displayed_link')),
+            extensions.get('rating'), extensions.get('reviews'),
+            session_id, api_call_id, now
+        ))
+    return rows
+
+def keyword_difficulty_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    return [(
+        data.get('keyword'), data.get('location'),
+        data.get('difficulty_score'), data.get('difficulty_level'),
+        session_id, api_call_id, now, now
+    )]
+
+def keyword_suggestion_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    seed_keyword = data.get('seed_keyword', '')
+    return [(seed_keyword, suggestion, None, session_id, api_call_id, now)
+            for suggestion in data.get('suggestions', [])]
+
+def people_also_ask_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    keyword = data.get('keyword', '')
+    return [(
+        keyword, q.get('question'), q.get('answer'),
+        q.get('title'), q.get('link'), i,
+        session_id, api_call_id, now
+    ) for i, q in enumerate(data.get('questions', []), 1)]
+
+def related_search_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    keyword = data.get('query', '')
+    return [(keyword, search.get('query'), search.get('link'), session_id, api_call_id, now)
+            for search in data.get('related_searches', [])]
+
+def serp_feature_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    features = data.get('features', {})
+    return [(
+        data.get('keyword'), data.get('location'),
+        features.get('has_ads'), features.get('num_ads'),
+        features.get('has_featured_snippet'), features.get('has_knowledge_graph'),
+        features.get('has_local_results'), features.get('has_image_results'),
+        features.get('has_video_results'), features.get('has_shopping_results'),
+        features.get('has_people_also_ask'), features.get('has_related_searches'),
+        data.get('organic_results_count'),
+        session_id, api_call_id, now
+    )]
+
+def local_business_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    query = data.get('query', '')
+    location = data.get('location', '')
+    return [(
+        biz.get('title'), biz.get('place_id'), biz.get('address'),
+        biz.get('phone'), biz.get('website'), biz.get('rating'),
+        biz.get('reviews'),
+        biz.get('gps_coordinates', {}).get('latitude'),
+        biz.get('gps_coordinates', {}).get('longitude'),
+        biz.get('hours'), biz.get('type'),
+        json.dumps(biz.get('types', [])),
+        biz.get('price'), json.dumps(biz.get('service_options', {})),
+        query, location, biz.get('position'),
+        session_id, api_call_id, now
+    ) for biz in data.get('businesses', [])]
+
+def local_pack_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    keyword = data.get('keyword', '')
+    location = data.get('location', '')
+    return [(
+        keyword, location, biz.get('title'), biz.get('address'),
+        biz.get('phone'), biz.get('rating'), biz.get('reviews'),
+        biz.get('position'), biz.get('place_id'),
+        biz.get('gps_coordinates', {}).get('latitude'),
+        biz.get('gps_coordinates', {}).get('longitude'),
+        biz.get('hours'), session_id, api_call_id, now
+    ) for biz in data.get('local_pack', [])]
+
+def image_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    query = data.get('query', '')
+    return [(
+        query, img.get('title'), img.get('link'), img.get('original'),
+        img.get('thumbnail'), img.get('source'), img.get('source_link'),
+        img.get('position'), session_id, api_call_id, now
+    ) for img in data.get('images', [])]
+
+def news_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    query = data.get('query', '')
+    return [(
+        query, article.get('title'), article.get('link'),
+        article.get('source'), article.get('date'), article.get('snippet'),
+        article.get('thumbnail'), article.get('position'),
+        session_id, api_call_id, now
+    ) for article in data.get('news', [])]
+
+def shopping_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    query = data.get('query', '')
+    return [(
+        query, product.get('title'), product.get('link'),
+        product.get('product_link'), product.get('product_id'),
+        product.get('source'), product.get('price'),
+        product.get('extracted_price'), product.get('rating'),
+        product.get('reviews'), product.get('thumbnail'),
+        product.get('delivery'), product.get('position'),
+        session_id, api_call_id, now
+    ) for product in data.get('products', [])]
+
+def yelp_business_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    return [(
+        biz.get('business_name'), biz.get('yelp_url'), biz.get('rating'),
+        biz.get('reviews_count'), biz.get('price_range'),
+        json.dumps(biz.get('categories', [])), biz.get('address'),
+        biz.get('phone'), data.get('query'), data.get('location'),
+        biz.get('position'), session_id, api_call_id, now
+    ) for biz in data.get('businesses', [])]
+
+def youtube_video_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    return [(
+        data.get('query'), video.get('video_id'), video.get('title'),
+        video.get('channel_name'), video.get('video_url'), video.get('thumbnail_url'),
+        video.get('description'), video.get('views'), video.get('published_date'),
+        video.get('duration'), video.get('position'),
+        session_id, api_call_id, now
+    ) for video in data.get('videos', [])]
+
+def job_listing_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    return [(
+        data.get('query'), data.get('location'), job.get('job_title'),
+        job.get('company_name'), job.get('job_url'), job.get('description'),
+        job.get('salary'), job.get('posted_date'), job.get('position'),
+        session_id, api_call_id, now
+    ) for job in data.get('jobs', [])]
+
+def keyword_volume_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    """One aggregate-statistics row per date range followed by its timeline points"""
+    keyword = data.get('keyword', '')
+    location = data.get('location', '')
+    rows = []
+    for period in data.get('historical_data', []):
+        date_range = period.get('date_range', '')
+        stats = period.get('statistics', {})
+        
+        rows.append((
+            keyword, location, date_range, None,
+            stats.get('current_interest'), stats.get('avg_interest'),
+            stats.get('max_interest'), stats.get('min_interest'),
+            stats.get('trend'), stats.get('volatility'),
+            session_id, api_call_id, now
+        ))
+        
+        for point in period.get('timeline', []):
+            values = point.get('values', [])
+            if values:
+                rows.append((
+                    keyword, location, date_range, point.get('date', ''),
+                    values[0].get('extracted_value', 0), None, None, None, None, None,
+                    session_id, api_call_id, now
+                ))
+    return rows
+
+def regional_interest_rows(data: Dict, session_id: int, api_call_id: int, now: datetime) -> List[tuple]:
+    keyword = data.get('keyword', '')
+    country = data.get('country', '')
+    return [(
+        keyword, country, region.get('location', ''),
+        region.get('extracted_value', 0), i,
+        session_id, api_call_id, now
+    ) for i, region in enumerate(data.get('all_regions', []), 1)]
+
+# Result kind -> (INSERT statement, row builder)
+SAVE_SPECS = {
+    'search_results': ("""
+        INSERT INTO search_results (
+            keyword, location, position, title, link, snippet, domain,
+            rating, reviews_count, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, search_result_rows),
+    'keyword_difficulty': ("""
+        INSERT OR REPLACE INTO keywords (
+            keyword, location, difficulty_score, difficulty_level,
+            session_id, api_call_id, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, keyword_difficulty_rows),
+    'keyword_suggestions': ("""
+        INSERT INTO keyword_suggestions (
+            seed_keyword, suggested_keyword, relevance_score,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """, keyword_suggestion_rows),
+    'people_also_ask': ("""
+        INSERT INTO people_also_ask (
+            keyword, question, answer, source_title, source_link, position,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, people_also_ask_rows),
+    'related_searches': ("""
+        INSERT INTO related_searches (
+            keyword, related_keyword, link, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """, related_search_rows),
+    'serp_analysis': ("""
+        INSERT INTO serp_features (
+            keyword, location, has_ads, num_ads, has_featured_snippet,
+            has_knowledge_graph, has_local_results, has_images, has_videos,
+            has_shopping, has_people_also_ask, has_related_searches,
+            organic_results_count, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, serp_feature_rows),
+    'local_businesses': ("""
+        INSERT OR REPLACE INTO local_businesses (
+            business_name, place_id, address, phone, website,
+            rating, reviews_count, latitude, longitude, hours,
+            type, types, price_range, service_options,
+            query, location, position, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, local_business_rows),
+    'local_pack': ("""
+        INSERT INTO local_pack (
+            keyword, location, business_name, address, phone,
+            rating, reviews_count, position, place_id,
+            gps_latitude, gps_longitude, hours,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, local_pack_rows),
+    'images': ("""
+        INSERT INTO images (
+            query, title, link, original_url, thumbnail_url,
+            source, source_link, position, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, image_rows),
+    'news': ("""
+        INSERT INTO news_articles (
+            query, title, link, source, published_date, snippet,
+            thumbnail_url, position, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, news_rows),
+    'shopping': ("""
+        INSERT INTO shopping_products (
+            query, title, link, product_link, product_id, source,
+            price, extracted_price, rating, reviews_count,
+            thumbnail_url, delivery_info, position,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, shopping_rows),
+    'yelp_businesses': ("""
+        INSERT OR REPLACE INTO yelp_reviews (
+            business_name, yelp_url, rating, reviews_count, price_range,
+            categories, address, phone, query, location, position,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, yelp_business_rows),
+    'youtube_videos': ("""
+        INSERT OR REPLACE INTO youtube_videos (
+            query, video_id, title, channel_name, video_url, thumbnail_url,
+            description, view_count, published_date, duration, position,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, youtube_video_rows),
+    'job_listings': ("""
+        INSERT INTO job_listings (
+            query, location, job_title, company_name, job_url, description,
+            salary, posted_date, position, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, job_listing_rows),
+    'keyword_volume_history': ("""
+        INSERT INTO keyword_volume_history (
+            keyword, location, date_range, timeline_date,
+            interest_value, avg_interest, max_interest, min_interest,
+            trend_direction, volatility, session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, keyword_volume_rows),
+    'regional_interest': ("""
+        INSERT INTO regional_interest (
+            keyword, country, region, interest_value, rank,
+            session_id, api_call_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, regional_interest_rows),
+}
+
+# ============================================================================
+# SERP DELTAS
+# Result kind -> function returning (keyword, location, observations), each
+# observation being (item_key, title, link, position, rating, reviews_count).
+# Changes are stored by SerpApiDB._record_serp_delta (tables from migration 7).
+# ============================================================================
+
+def search_result_observations(data: Dict) -> Tuple[str, str, List[tuple]]:
+    observations = []
+    for result in data.get('organic_results', []):
+        extensions = result.get('rich_snippet', {}).get('top', {}).get('detected_extensions', {})
+        observations.append((
+            result.get('link') or result.get('title'), result.get('title'), result.get('link'),
+            result.get('position'), extensions.get('rating'), extensions.get('reviews')
+        ))
+    return data.get('query', ''), data.get('location', ''), observations
+
+def local_pack_observations(data: Dict) -> Tuple[str, str, List[tuple]]:
+    return data.get('keyword', ''), data.get('location', ''), [(
+        biz.get('place_id') or biz.get('title'), biz.get('title'), None,
+        biz.get('position'), biz.get('rating'), biz.get('reviews')
+    ) for biz in data.get('local_pack', [])]
+
+def yelp_business_observations(data: Dict) -> Tuple[str, str, List[tuple]]:
+    return data.get('query', ''), data.get('location', ''), [(
+        biz.get('yelp_url') or biz.get('business_name'), biz.get('business_name'), biz.get('yelp_url'),
+        biz.get('position'), biz.get('rating'), biz.get('reviews_count')
+    ) for biz in data.get('businesses', [])]
+
+DELTA_SPECS = {
+    'search_results': search_result_observations,
+    'local_pack': local_pack_observations,
+    'yelp_businesses': yelp_business_observations,
+}
+
+# ============================================================================
+# FULL-TEXT SEARCH
+# Source name -> (FTS5 index, content table, title expression, extra columns).
+# The indexes are created and kept in sync by migration 6.
+# ============================================================================
+
+SEARCH_SOURCES = {
+    'search_results': ('search_results_fts', 'search_results', 't.title',
+                       't.link, t.keyword, t.domain'),
+    'people_also_ask': ('people_also_ask_fts', 'people_also_ask', 't.question',
+                        't.source_link as link, t.keyword'),
+    'news': ('news_articles_fts', 'news_articles', 't.title',
+             't.link, t.source as publisher, t.published_date'),
+    'reviews': ('yelp_review_details_fts', 'yelp_review_details', 't.reviewer_name',
+                't.rating, t.review_date'),
+    'jobs': ('job_listings_fts', 'job_listings', 't.job_title',
+             't.job_url as link, t.company_name, t.location'),
+}
+
+_SEARCH_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+def fts_query(text: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 query
+    
+    Every word must match (the last one as a prefix, for search-as-you-type);
+    quoting each token keeps FTS5 operators in user input from being parsed.
+    """
+    tokens = _SEARCH_TOKEN.findall(text or '')
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"' for token in tokens) + '*'
+
+def freshness_info(row: Optional[Tuple[str, float]]) -> Dict:
+    """Freshness dict from a (last_updated, age_minutes) row, or None when never fetched"""
+    if row:
+        last_updated, age_minutes = row
+        return {
+            'last_updated': last_updated,
+            'age_minutes': int(age_minutes),
+            'is_fresh': age_minutes < 15,  # Fresh if < 15 minutes
+            'needs_refresh': age_minutes >= 15
+        }
+    
+    return {
+        'last_updated': None,
+        'age_minutes': None,
+        'is_fresh': False,
+        'needs_refresh': True
+    }
+
+class _ThreadOwner:
+    """Lives in a thread's locals; its finalizer closes that thread's connection"""
+
+def _release_connection(conn: sqlite3.Connection, connections: set, lock: threading.Lock):
+    """Close a connection whose thread has ended and stop tracking it"""
+    with lock:
+        connections.discard(conn)
+    conn.close()
 
 class SerpApiDB:
     def __init__(self, db_path: str = None):
@@ -18,26 +493,133 @@ class SerpApiDB:
             db_path = os.path.join(db_dir, 'serpapi_data.db')
         
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
         self.init_database()
     
     def init_database(self):
-        """Initialize database with enhanced schema"""
-        schema_path = os.path.join(os.path.dirname(__file__), 'enhanced_schema.sql')
+        """
+        Bring the schema up to date
+        
+        Applies only migrations newer than PRAGMA user_version, so a current
+        database costs a single pragma read at startup.
+        """
+        conn = self.get_connection()
+        if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+            # Only takes effect before the first table exists; lets retention reclaim space in steps
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets readers run alongside the single writer; the mode persists in the file
+        conn.execute("PRAGMA journal_mode = WAL")
+        
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        migrations = load_migrations()
+        if not migrations or migrations[-1][0] <= current:
+            return
         
-        with open(schema_path, 'r') as f:
-            schema_sql = f.read()
+        # IMMEDIATE takes the write lock first, so concurrent starters apply each migration once
+        with self.transaction(immediate=True):
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            for version, name, path in migrations:
+                if version <= current:
+                    continue
+                apply_migration(conn, path)
+                conn.execute(f"PRAGMA user_version = {version}")
+                print(f"✅ Applied migration {version}: {name}")
+        
+        print(f"✅ Database initialized: {self.db_path} (schema version {migrations[-1][0]})")
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection with the performance profile applied"""
+        # Only its own thread uses it, but close() and thread-exit cleanup may run elsewhere
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        # NORMAL is durable in WAL mode except for the last commits on power loss
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # INSERT OR REPLACE must fire DELETE triggers so market_summaries stays exact
+        conn.execute("PRAGMA recursive_triggers = ON")
+        return conn
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's database connection
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.executescript(schema_sql)
-        conn.commit()
-        conn.close()
+        Each thread keeps one connection open for as long as the thread runs
+        instead of reconnecting for every statement; it is closed when the
+        thread ends (e.g. a finished Flask request thread). Callers must not
+        close it.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection()
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.add(conn)
+            self._local.owner = _ThreadOwner()
+            weakref.finalize(self._local.owner, _release_connection,
+                             conn, self._connections, self._connections_lock)
+        elif conn.in_transaction and self._local.depth == 0:
+            # A previous call on this thread failed before committing; drop its partial work
+            conn.rollback()
+        return conn
+    
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless running inside transaction(), which commits once at the end"""
+        if self._local.depth == 0:
+            conn.commit()
+    
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """
+        Group several calls into one transaction
+        
+        Nested transaction() blocks use savepoints, so an inner failure can be
+        rolled back without abandoning the outer block. Usage:
         
-        print(f"✅ Database initialized: {self.db_path}")
+            with db.transaction():
+                api_call_id = db.log_api_call(...)
+                db.save_search_results(data, session_id, api_call_id)
+        
+        immediate=True takes the write lock up front (outermost block only).
+        """
+        conn = self.get_connection()
+        depth = self._local.depth
+        savepoint = f"sp_{depth}"
+        
+        if depth == 0:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        self._local.depth = depth + 1
+        
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth = depth
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        
+        self._local.depth = depth
+        if depth == 0:
+            conn.commit()
+        else:
+            conn.execute(f"RELEASE {savepoint}")
     
-    def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+    def close(self):
+        """Close every thread's connection (e.g. at shutdown)"""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
     
     # ========================================================================
     # SESSION MANAGEMENT
@@ -54,8 +636,7 @@ class SerpApiDB:
         """, (session_name, industry, location))
         
         session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         
         return session_id
     
@@ -73,7 +654,6 @@ class SerpApiDB:
         """, (industry, location))
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return result[0]
@@ -93,174 +673,311 @@ class SerpApiDB:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        raw_json = json.dumps(raw_response) if raw_response else None
+        raw_hash = self.store_raw_response(raw_response) if raw_response else None
         
         cursor.execute("""
             INSERT INTO api_calls (
                 api_endpoint, query, location, status, response_time_ms,
-                error_message, raw_response, created_at
+                error_message, raw_response_hash, created_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (endpoint, query, location, status, response_time_ms, 
-              error_message, raw_json, datetime.now()))
+              error_message, raw_hash, datetime.now()))
         
         api_call_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         
         return api_call_id
     
-    # ========================================================================
-    # GOOGLE SEARCH DATA
-    # ========================================================================
-    
-    def save_search_results(self, data: Dict, session_id: int, api_call_id: int):
-        """Save Google search results"""
-        if data.get('status') != 'success':
-            return
+    def store_raw_response(self, raw_response: Any) -> str:
+        """
+        Store a raw payload once per content hash (compressed)
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        Returns:
+            The content hash referenced by api_calls.raw_response_hash
+        """
+        raw_json = json.dumps(raw_response, default=str)
+        raw_hash = content_hash(raw_json)
         
-        keyword = data.get('query', '')
-        location = data.get('location', '')
-        
-        for result in data.get('organic_results', []):
-            cursor.execute("""
-                INSERT INTO search_results (
-                    keyword, location, position, title, link, snippet, domain,
-                    rating, reviews_count, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                keyword, location, result.get('position'), result.get('title'),
-                result.get('link'), result.get('snippet'), 
-                result.get('displayed_link', '').split('/')[0] if result.get('displayed_link') else None,
-                result.get('rich_snippet', {}).get('top', {}).get('detected_extensions', {}).get('rating'),
-                result.get('rich_snippet', {}).get('top', {}).get('detected_extensions', {}).get('reviews'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        conn = self.get_connection()
+        exists = conn.execute(
+            "SELECT 1 FROM raw_responses WHERE content_hash = ?", (raw_hash,)
+        ).fetchone()
+        if not exists:
+            encoding, payload = encode_payload(raw_json)
+            conn.execute("""
+                INSERT OR IGNORE INTO raw_responses (content_hash, encoding, payload, size_bytes)
+                VALUES (?, ?, ?, ?)
+            """, (raw_hash, encoding, payload, len(raw_json)))
+            self._commit(conn)
+        
+        return raw_hash
     
-    def save_keyword_difficulty(self, data: Dict, session_id: int, api_call_id: int):
-        """Save keyword difficulty analysis"""
-        if data.get('status') != 'success':
-            return
+    def get_raw_response(self, api_call_id: int) -> Optional[Any]:
+        """
+        Get the decoded raw payload logged for an API call
         
+        Reads the compressed blob when the call references one and falls back
+        to the legacy inline raw_response column for older rows.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute("""
-            INSERT OR REPLACE INTO keywords (
-                keyword, location, difficulty_score, difficulty_level,
-                session_id, api_call_id, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data.get('keyword'), data.get('location'),
-            data.get('difficulty_score'), data.get('difficulty_level'),
-            session_id, api_call_id, datetime.now(), datetime.now()
-        ))
+            SELECT r.encoding, r.payload, c.raw_response
+            FROM api_calls c
+            LEFT JOIN raw_responses r ON r.content_hash = c.raw_response_hash
+            WHERE c.id = ?
+        """, (api_call_id,))
         
-        conn.commit()
-        conn.close()
+        result = cursor.fetchone()
+        if not result:
+            return None
+        
+        encoding, payload, legacy_json = result
+        if payload is not None:
+            return json.loads(decode_payload(encoding, payload))
+        return json.loads(legacy_json) if legacy_json else None
     
-    def save_keyword_suggestions(self, data: Dict, session_id: int, api_call_id: int):
-        """Save keyword suggestions"""
-        if data.get('status') != 'success':
-            return
+    def compact_raw_responses(self, batch_size: int = 500) -> int:
+        """
+        Move legacy inline raw_response values into raw_responses
         
+        Returns:
+            Number of api_calls rows converted
+        """
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        seed_keyword = data.get('seed_keyword', '')
-        
-        for suggestion in data.get('suggestions', []):
-            cursor.execute("""
-                INSERT INTO keyword_suggestions (
-                    seed_keyword, suggested_keyword, relevance_score,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (seed_keyword, suggestion, None, session_id, api_call_id, datetime.now()))
-        
-        conn.commit()
-        conn.close()
+        converted = 0
+        
+        while True:
+            rows = conn.execute("""
+                SELECT id, raw_response FROM api_calls
+                WHERE raw_response IS NOT NULL AND raw_response_hash IS NULL
+                LIMIT ?
+            """, (batch_size,)).fetchall()
+            if not rows:
+                return converted
+            
+            with self.transaction():
+                for api_call_id, raw_json in rows:
+                    raw_hash = self.store_raw_response(json.loads(raw_json))
+                    conn.execute("""
+                        UPDATE api_calls SET raw_response_hash = ?, raw_response = NULL
+                        WHERE id = ?
+                    """, (raw_hash, api_call_id))
+            converted += len(rows)
     
-    def save_people_also_ask(self, data: Dict, session_id: int, api_call_id: int):
-        """Save People Also Ask questions"""
+    # ========================================================================
+    # BATCHED SAVES
+    # ========================================================================
+    
+    def _save_rows(self, kind: str, data: Dict, session_id: int, api_call_id: int):
+        """Insert all rows for one successful result with a single executemany"""
         if data.get('status') != 'success':
             return
         
+        sql, build_rows = SAVE_SPECS[kind]
+        rows = build_rows(data, session_id, api_call_id, datetime.now())
+        if not rows:
+            return
+        
         conn = self.get_connection()
-        cursor = conn.cursor()
+        conn.executemany(sql, rows)
+        self._commit(conn)
+    
+    def bulk_save(self, kind: str, results: Iterable[Tuple[Dict, int, int]],
+                  batch_size: int = 5000) -> int:
+        """
+        Save many results of one kind in a single transaction
         
-        keyword = data.get('keyword', '')
+        Args:
+            kind: Key of SAVE_SPECS (e.g. 'search_results', 'local_businesses')
+            results: Iterable of (data, session_id, api_call_id); unsuccessful
+                results are skipped like in the save_* methods
+            batch_size: Rows buffered per executemany call
+            
+        Returns:
+            Number of rows inserted
+        """
+        sql, build_rows = SAVE_SPECS[kind]
+        now = datetime.now()
+        total = 0
+        batch = []
+        
+        with self.transaction() as conn:
+            for data, session_id, api_call_id in results:
+                if data.get('status') != 'success':
+                    continue
+                batch.extend(build_rows(data, session_id, api_call_id, now))
+                if len(batch) >= batch_size:
+                    conn.executemany(sql, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(sql, batch)
+                total += len(batch)
+        
+        return total
+    
+    def _record_serp_delta(self, kind: str, data: Dict, api_call_id: int, now: datetime = None) -> int:
+        """
+        Compare a result set with the stored current state and log the differences
         
-        for i, q in enumerate(data.get('questions', []), 1):
-            cursor.execute("""
-                INSERT INTO people_also_ask (
-                    keyword, question, answer, source_title, source_link, position,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                keyword, q.get('question'), q.get('answer'),
-                q.get('title'), q.get('link'), i,
-                session_id, api_call_id, datetime.now()
-            ))
+        Items are matched by item_key; a change is logged when an item appears,
+        disappears, or its position, rating or review count differs.
         
-        conn.commit()
-        conn.close()
+        Returns:
+            Number of changes logged (0 when the SERP is unchanged)
+        """
+        keyword, location, observations = DELTA_SPECS[kind](data)
+        now = now or datetime.now()
+        set_key = (kind, keyword, location)
+        
+        with self.transaction() as conn:
+            current = {row[0]: row[1:] for row in conn.execute("""
+                SELECT item_key, position, rating, reviews_count FROM serp_current
+                WHERE source = ? AND keyword = ? AND location = ?
+            """, set_key)}
+            
+            changes, upserts, seen = [], [], set()
+            for item_key, title, link, position, rating, reviews_count in observations:
+                if item_key is None or item_key in seen:
+                    continue
+                seen.add(item_key)
+                previous = current.get(item_key)
+                if previous == (position, rating, reviews_count):
+                    continue
+                changes.append((*set_key, item_key, 'changed' if previous else 'added', title, link,
+                                position, rating, reviews_count, previous[0] if previous else None,
+                                now, api_call_id))
+                upserts.append((*set_key, item_key, title, link, position, rating, reviews_count, now, now))
+            
+            removed = [item_key for item_key in current if item_key not in seen]
+            changes.extend((*set_key, item_key, 'removed', None, None, None, None, None,
+                            current[item_key][0], now, api_call_id) for item_key in removed)
+            
+            if changes:
+                conn.executemany("""
+                    INSERT INTO serp_changes (
+                        source, keyword, location, item_key, change_type, title, link,
+                        position, rating, reviews_count, previous_position, observed_at, api_call_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, changes)
+            if upserts:
+                conn.executemany("""
+                    INSERT INTO serp_current (
+                        source, keyword, location, item_key, title, link,
+                        position, rating, reviews_count, first_seen, changed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (source, keyword, location, item_key) DO UPDATE SET
+                        title = excluded.title, link = excluded.link,
+                        position = excluded.position, rating = excluded.rating,
+                        reviews_count = excluded.reviews_count, changed_at = excluded.changed_at
+                """, upserts)
+            if removed:
+                conn.executemany("""
+                    DELETE FROM serp_current
+                    WHERE source = ? AND keyword = ? AND location = ? AND item_key = ?
+                """, [(*set_key, item_key) for item_key in removed])
+            
+            conn.execute("""
+                INSERT INTO serp_sets (source, keyword, location, observations, last_observed_at, last_changed_at)
+                VALUES (?, ?, ?, 1, ?, ?)
+                ON CONFLICT (source, keyword, location) DO UPDATE SET
+                    observations = observations + 1,
+                    last_observed_at = excluded.last_observed_at,
+                    last_changed_at = COALESCE(excluded.last_changed_at, last_changed_at)
+            """, (*set_key, now, now if changes else None))
+        
+        return len(changes)
     
-    def save_related_searches(self, data: Dict, session_id: int, api_call_id: int):
-        """Save related searches"""
+    def _save_serp(self, kind: str, data: Dict, session_id: int, api_call_id: int):
+        """Record SERP changes and insert the full result rows only if anything changed"""
         if data.get('status') != 'success':
             return
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.transaction():
+            if self._record_serp_delta(kind, data, api_call_id):
+                self._save_rows(kind, data, session_id, api_call_id)
+    
+    def get_serp_state(self, source: str, keyword: str, location: str, at: str = None) -> List[Dict]:
+        """
+        The SERP as last observed, or as it was at a past time
         
-        keyword = data.get('query', '')
+        Args:
+            source: Key of DELTA_SPECS ('search_results', 'local_pack', 'yelp_businesses')
+            at: Timestamp (e.g. '2024-05-01 12:00:00'); None for the current state
+            
+        Returns:
+            Items ordered by position with title, link, position, rating and reviews_count
+        """
+        conn = self.get_connection()
         
-        for search in data.get('related_searches', []):
-            cursor.execute("""
-                INSERT INTO related_searches (
-                    keyword, related_keyword, link, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (keyword, search.get('query'), search.get('link'), 
-                  session_id, api_call_id, datetime.now()))
+        if at is None:
+            cursor = conn.execute("""
+                SELECT item_key, title, link, position, rating, reviews_count, changed_at
+                FROM serp_current
+                WHERE source = ? AND keyword = ? AND location = ?
+                ORDER BY position
+            """, (source, keyword, location))
+        else:
+            # Replay the log: each item's latest change at or before `at`
+            cursor = conn.execute("""
+                SELECT item_key, title, link, position, rating, reviews_count, observed_at as changed_at
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY item_key ORDER BY id DESC) as latest
+                    FROM serp_changes
+                    WHERE source = ? AND keyword = ? AND location = ? AND observed_at <= ?
+                )
+                WHERE latest = 1 AND change_type != 'removed'
+                ORDER BY position
+            """, (source, keyword, location, at))
+        
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def get_serp_changes(self, source: str, keyword: str, location: str,
+                         since: str = None, limit: int = 100) -> List[Dict]:
+        """Logged SERP changes, newest first (optionally only those after `since`)"""
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            SELECT item_key, change_type, title, link, position, previous_position,
+                   rating, reviews_count, observed_at, api_call_id
+            FROM serp_changes
+            WHERE source = ? AND keyword = ? AND location = ? AND observed_at > ?
+            ORDER BY observed_at DESC, id DESC
+            LIMIT ?
+        """, (source, keyword, location, since or '', limit))
         
-        conn.commit()
-        conn.close()
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    # ========================================================================
+    # GOOGLE SEARCH DATA
+    # ========================================================================
+    
+    def save_search_results(self, data: Dict, session_id: int, api_call_id: int):
+        """Save Google search results (full rows only when the SERP changed)"""
+        self._save_serp('search_results', data, session_id, api_call_id)
+    
+    def save_keyword_difficulty(self, data: Dict, session_id: int, api_call_id: int):
+        """Save keyword difficulty analysis"""
+        self._save_rows('keyword_difficulty', data, session_id, api_call_id)
+    
+    def save_keyword_suggestions(self, data: Dict, session_id: int, api_call_id: int):
+        """Save keyword suggestions"""
+        self._save_rows('keyword_suggestions', data, session_id, api_call_id)
+    
+    def save_people_also_ask(self, data: Dict, session_id: int, api_call_id: int):
+        """Save People Also Ask questions"""
+        self._save_rows('people_also_ask', data, session_id, api_call_id)
+    
+    def save_related_searches(self, data: Dict, session_id: int, api_call_id: int):
+        """Save related searches"""
+        self._save_rows('related_searches', data, session_id, api_call_id)
     
     def save_serp_analysis(self, data: Dict, session_id: int, api_call_id: int):
         """Save SERP feature analysis"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        features = data.get('features', {})
-        
-        cursor.execute("""
-            INSERT INTO serp_features (
-                keyword, location, has_ads, num_ads, has_featured_snippet,
-                has_knowledge_graph, has_local_results, has_images, has_videos,
-                has_shopping, has_people_also_ask, has_related_searches,
-                organic_results_count, session_id, api_call_id, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            data.get('keyword'), data.get('location'),
-            features.get('has_ads'), features.get('num_ads'),
-            features.get('has_featured_snippet'), features.get('has_knowledge_graph'),
-            features.get('has_local_results'), features.get('has_image_results'),
-            features.get('has_video_results'), features.get('has_shopping_results'),
-            features.get('has_people_also_ask'), features.get('has_related_searches'),
-            data.get('organic_results_count'),
-            session_id, api_call_id, datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('serp_analysis', data, session_id, api_call_id)
     
     # ========================================================================
     # LOCAL BUSINESS DATA
@@ -268,69 +985,11 @@ class SerpApiDB:
     
     def save_local_businesses(self, data: Dict, session_id: int, api_call_id: int):
         """Save local businesses from Google Maps"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = data.get('query', '')
-        location = data.get('location', '')
-        
-        for biz in data.get('businesses', []):
-            cursor.execute("""
-                INSERT OR REPLACE INTO local_businesses (
-                    business_name, place_id, address, phone, website,
-                    rating, reviews_count, latitude, longitude, hours,
-                    type, types, price_range, service_options,
-                    query, location, position, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                biz.get('title'), biz.get('place_id'), biz.get('address'),
-                biz.get('phone'), biz.get('website'), biz.get('rating'),
-                biz.get('reviews'), 
-                biz.get('gps_coordinates', {}).get('latitude'),
-                biz.get('gps_coordinates', {}).get('longitude'),
-                biz.get('hours'), biz.get('type'),
-                json.dumps(biz.get('types', [])),
-                biz.get('price'), json.dumps(biz.get('service_options', {})),
-                query, location, biz.get('position'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('local_businesses', data, session_id, api_call_id)
     
     def save_local_pack(self, data: Dict, session_id: int, api_call_id: int):
-        """Save local pack (3-pack) results"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        keyword = data.get('keyword', '')
-        location = data.get('location', '')
-        
-        for biz in data.get('local_pack', []):
-            cursor.execute("""
-                INSERT INTO local_pack (
-                    keyword, location, business_name, address, phone,
-                    rating, reviews_count, position, place_id,
-                    gps_latitude, gps_longitude, hours,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                keyword, location, biz.get('title'), biz.get('address'),
-                biz.get('phone'), biz.get('rating'), biz.get('reviews'),
-                biz.get('position'), biz.get('place_id'),
-                biz.get('gps_coordinates', {}).get('latitude'),
-                biz.get('gps_coordinates', {}).get('longitude'),
-                biz.get('hours'), session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        """Save local pack (3-pack) results (full rows only when the SERP changed)"""
+        self._save_serp('local_pack', data, session_id, api_call_id)
     
     # ========================================================================
     # MEDIA & CONTENT
@@ -338,243 +997,39 @@ class SerpApiDB:
     
     def save_images(self, data: Dict, session_id: int, api_call_id: int):
         """Save image search results"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = data.get('query', '')
-        
-        for img in data.get('images', []):
-            cursor.execute("""
-                INSERT INTO images (
-                    query, title, link, original_url, thumbnail_url,
-                    source, source_link, position, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                query, img.get('title'), img.get('link'), img.get('original'),
-                img.get('thumbnail'), img.get('source'), img.get('source_link'),
-                img.get('position'), session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('images', data, session_id, api_call_id)
     
     def save_news(self, data: Dict, session_id: int, api_call_id: int):
         """Save news articles"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = data.get('query', '')
-        
-        for article in data.get('news', []):
-            cursor.execute("""
-                INSERT INTO news_articles (
-                    query, title, link, source, published_date, snippet,
-                    thumbnail_url, position, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                query, article.get('title'), article.get('link'),
-                article.get('source'), article.get('date'), article.get('snippet'),
-                article.get('thumbnail'), article.get('position'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('news', data, session_id, api_call_id)
     
     def save_shopping(self, data: Dict, session_id: int, api_call_id: int):
         """Save shopping products"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = data.get('query', '')
-        
-        for product in data.get('products', []):
-            cursor.execute("""
-                INSERT INTO shopping_products (
-                    query, title, link, product_link, product_id, source,
-                    price, extracted_price, rating, reviews_count,
-                    thumbnail_url, delivery_info, position,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                query, product.get('title'), product.get('link'),
-                product.get('product_link'), product.get('product_id'),
-                product.get('source'), product.get('price'),
-                product.get('extracted_price'), product.get('rating'),
-                product.get('reviews'), product.get('thumbnail'),
-                product.get('delivery'), product.get('position'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('shopping', data, session_id, api_call_id)
     
     # ========================================================================
     # NEW API SAVE FUNCTIONS
     # ========================================================================
     
     def save_yelp_businesses(self, data: Dict, session_id: int, api_call_id: int):
-        """Save Yelp business data"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        for biz in data.get('businesses', []):
-            cursor.execute("""
-                INSERT OR REPLACE INTO yelp_reviews (
-                    business_name, yelp_url, rating, reviews_count, price_range,
-                    categories, address, phone, query, location, position,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                biz.get('business_name'), biz.get('yelp_url'), biz.get('rating'),
-                biz.get('reviews_count'), biz.get('price_range'),
-                json.dumps(biz.get('categories', [])), biz.get('address'),
-                biz.get('phone'), data.get('query'), data.get('location'),
-                biz.get('position'), session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        """Save Yelp business data (full rows only when the SERP changed)"""
+        self._save_serp('yelp_businesses', data, session_id, api_call_id)
     
     def save_youtube_videos(self, data: Dict, session_id: int, api_call_id: int):
         """Save YouTube video results"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        for video in data.get('videos', []):
-            cursor.execute("""
-                INSERT OR REPLACE INTO youtube_videos (
-                    query, video_id, title, channel_name, video_url, thumbnail_url,
-                    description, view_count, published_date, duration, position,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get('query'), video.get('video_id'), video.get('title'),
-                video.get('channel_name'), video.get('video_url'), video.get('thumbnail_url'),
-                video.get('description'), video.get('views'), video.get('published_date'),
-                video.get('duration'), video.get('position'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('youtube_videos', data, session_id, api_call_id)
     
     def save_job_listings(self, data: Dict, session_id: int, api_call_id: int):
         """Save job listings"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        for job in data.get('jobs', []):
-            cursor.execute("""
-                INSERT INTO job_listings (
-                    query, location, job_title, company_name, job_url, description,
-                    salary, posted_date, position, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get('query'), data.get('location'), job.get('job_title'),
-                job.get('company_name'), job.get('job_url'), job.get('description'),
-                job.get('salary'), job.get('posted_date'), job.get('position'),
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('job_listings', data, session_id, api_call_id)
     
     def save_keyword_volume_history(self, data: Dict, session_id: int, api_call_id: int):
         """Save detailed keyword volume history with time series data"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        keyword = data.get('keyword', '')
-        location = data.get('location', '')
-        
-        # Save each time period's data
-        for period in data.get('historical_data', []):
-            date_range = period.get('date_range', '')
-            stats = period.get('statistics', {})
-            timeline = period.get('timeline', [])
-            
-            # Save aggregate statistics
-            cursor.execute("""
-                INSERT INTO keyword_volume_history (
-                    keyword, location, date_range, timeline_date,
-                    interest_value, avg_interest, max_interest, min_interest,
-                    trend_direction, volatility, session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                keyword, location, date_range, None,
-                stats.get('current_interest'), stats.get('avg_interest'),
-                stats.get('max_interest'), stats.get('min_interest'),
-                stats.get('trend'), stats.get('volatility'),
-                session_id, api_call_id, datetime.now()
-            ))
-            
-            # Save individual timeline points
-            for point in timeline:
-                timeline_date = point.get('date', '')
-                values = point.get('values', [])
-                if values and len(values) > 0:
-                    interest_val = values[0].get('extracted_value', 0)
-                    
-                    cursor.execute("""
-                        INSERT INTO keyword_volume_history (
-                            keyword, location, date_range, timeline_date,
-                            interest_value, session_id, api_call_id, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        keyword, location, date_range, timeline_date,
-                        interest_val, session_id, api_call_id, datetime.now()
-                    ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('keyword_volume_history', data, session_id, api_call_id)
     
     def save_regional_interest(self, data: Dict, session_id: int, api_call_id: int):
         """Save regional interest data"""
-        if data.get('status') != 'success':
-            return
-        
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        keyword = data.get('keyword', '')
-        country = data.get('country', '')
-        
-        for i, region in enumerate(data.get('all_regions', []), 1):
-            cursor.execute("""
-                INSERT INTO regional_interest (
-                    keyword, country, region, interest_value, rank,
-                    session_id, api_call_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                keyword, country, region.get('location', ''),
-                region.get('extracted_value', 0), i,
-                session_id, api_call_id, datetime.now()
-            ))
-        
-        conn.commit()
-        conn.close()
+        self._save_rows('regional_interest', data, session_id, api_call_id)
     
     def save_keyword_metrics_snapshot(self, keyword: str, location: str, 
                                      difficulty_data: Dict, serp_data: Dict,
@@ -600,63 +1055,105 @@ class SerpApiDB:
             session_id, datetime.now()
         ))
         
-        conn.commit()
-        conn.close()
+        self._commit(conn)
     
     # ========================================================================
     # DATA RETRIEVAL WITH FRESHNESS CHECK
     # ========================================================================
     
-    def get_cached_data(self, table: str, query: str, location: str, max_age_minutes: int = 15) -> Optional[Dict]:
+    def get_cached_response(self, cache_key: str) -> Optional[Dict]:
         """
-        Get cached data from database if fresh enough
+        Get a cached API response by its cache key
         
         Args:
-            table: Table name to query
-            query: Search query
-            location: Location filter
-            max_age_minutes: Maximum age of data in minutes (default: 15)
+            cache_key: Hash of endpoint, engine function and parameters
             
         Returns:
-            Dict with cached data or None if too old/doesn't exist
+            Dict with 'data' and 'created_at' (Unix timestamp) or None if not cached
         """
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        # Check last API call for this query
         cursor.execute("""
-            SELECT created_at, raw_response
-            FROM api_calls
-            WHERE query = ? AND location = ? AND status = 'success'
-            AND created_at > datetime('now', '-' || ? || ' minutes')
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (query, location, max_age_minutes))
+            SELECT response, created_at
+            FROM response_cache
+            WHERE cache_key = ?
+        """, (cache_key,))
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
-            created_at, raw_response = result
+            response, created_at = result
             return {
-                'from_cache': True,
-                'cached_at': created_at,
-                'data': json.loads(raw_response) if raw_response else None
+                'data': json.loads(response),
+                'created_at': created_at
             }
         
         return None
     
+    def save_cached_response(self, cache_key: str, endpoint: str, query: str,
+                             location: str, data: Dict, created_at: float):
+        """Store (or replace) a cached API response"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO response_cache (
+                cache_key, endpoint, query, location, response, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, (cache_key, endpoint, query, location, json.dumps(data, default=str), created_at))
+        
+        self._commit(conn)
+    
+    def get_credit_usage(self, since: datetime) -> int:
+        """
+        Get SerpApi credits used by successful calls since a point in time
+        
+        Args:
+            since: Start of the window (e.g. start of today or of this month)
+            
+        Returns:
+            Total api_credits_used
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT COALESCE(SUM(api_credits_used), 0)
+            FROM api_calls
+            WHERE status = 'success' AND created_at >= ?
+        """, (since,))
+        
+        credits = cursor.fetchone()[0]
+        
+        return credits
+    
     def get_market_summary(self, industry: str, location: str) -> Dict:
-        """Get comprehensive market summary"""
+        """
+        Get comprehensive market summary
+        
+        Reads the market_summaries row that triggers keep current as businesses,
+        keywords, news and API calls are saved (see migration 3), so this is a
+        single-row lookup. Like the view it replaces, it covers all tracked data.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute("""
-            SELECT * FROM v_market_snapshot
+            SELECT 
+                'Miami Moving Companies' as market_name,
+                total_competitors as total_businesses,
+                avg_rating,
+                total_reviews,
+                keywords_tracked,
+                market_difficulty_score as avg_difficulty,
+                news_articles,
+                last_updated
+            FROM market_summaries
+            WHERE industry = 'all' AND location = 'all'
         """)
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             columns = [desc[0] for desc in cursor.description]
@@ -685,7 +1182,6 @@ class SerpApiDB:
                 'created_at': row[4]
             })
         
-        conn.close()
         return results
     
     def get_data_freshness(self, endpoint: str, query: str, location: str) -> Dict:
@@ -707,24 +1203,77 @@ class SerpApiDB:
             LIMIT 1
         """, (endpoint, query, location))
         
-        result = cursor.fetchone()
-        conn.close()
+        return freshness_info(cursor.fetchone())
+    
+    def get_data_freshness_batch(self, endpoints: List[str], query: str, location: str) -> Dict[str, Dict]:
+        """
+        Freshness of several endpoints for one query/location in a single statement
         
-        if result:
-            last_updated, age_minutes = result
-            return {
-                'last_updated': last_updated,
-                'age_minutes': int(age_minutes),
-                'is_fresh': age_minutes < 15,  # Fresh if < 15 minutes
-                'needs_refresh': age_minutes >= 15
-            }
+        Returns:
+            Dict of endpoint -> freshness info (same shape as get_data_freshness)
+        """
+        if not endpoints:
+            return {}
         
-        return {
-            'last_updated': None,
-            'age_minutes': None,
-            'is_fresh': False,
-            'needs_refresh': True
-        }
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        placeholders = ', '.join('?' * len(endpoints))
+        cursor.execute(f"""
+            SELECT api_endpoint, MAX(created_at),
+                   (julianday('now') - julianday(MAX(created_at))) * 24 * 60 as age_minutes
+            FROM api_calls
+            WHERE query = ? AND location = ? AND status = 'success'
+              AND api_endpoint IN ({placeholders})
+            GROUP BY api_endpoint
+        """, (query, location, *endpoints))
+        
+        latest = {row[0]: row[1:] for row in cursor.fetchall()}
+        return {endpoint: freshness_info(latest.get(endpoint)) for endpoint in endpoints}
+    
+    def search_text(self, text: str, sources: List[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Ranked full-text search across stored snippets, questions, news, reviews and jobs
+        
+        Args:
+            text: Free-text query (all words must match, the last as a prefix)
+            sources: Keys of SEARCH_SOURCES to search (default: all)
+            limit: Maximum number of results overall
+            
+        Returns:
+            Results ordered by BM25 relevance, each with source, id, title,
+            a highlighted snippet (<mark>...</mark>), rank and source-specific fields
+        """
+        match = fts_query(text)
+        if match is None:
+            return []
+        
+        conn = self.get_connection()
+        results = []
+        
+        for source in sources or SEARCH_SOURCES:
+            fts_table, table, title, extra = SEARCH_SOURCES[source]
+            cursor = conn.execute(f"""
+                SELECT t.id,
+                       {title} as title,
+                       snippet({fts_table}, -1, '<mark>', '</mark>', '…', 16) as snippet,
+                       bm25({fts_table}) as rank,
+                       t.created_at,
+                       {extra}
+                FROM {fts_table}
+                JOIN {table} t ON t.id = {fts_table}.rowid
+                WHERE {fts_table} MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            """, (match, limit))
+            
+            columns = [desc[0] for desc in cursor.description]
+            for row in cursor.fetchall():
+                results.append({'source': source, **dict(zip(columns, row))})
+        
+        # BM25 is lower-is-better
+        results.sort(key=lambda result: result['rank'])
+        return results[:limit]
     
     def get_keyword_volume_timeline(self, keyword: str, location: str, date_range: str = "today 3-m") -> List[Dict]:
         """Get keyword volume timeline for graphing"""
@@ -745,7 +1294,6 @@ class SerpApiDB:
                 'interest': row[1]
             })
         
-        conn.close()
         return timeline
     
     def get_keyword_historical_stats(self, keyword: str, location: str) -> Dict:
@@ -776,7 +1324,6 @@ class SerpApiDB:
                 'has_local_pack': bool(row[4])
             })
         
-        conn.close()
         return {
             'keyword': keyword,
             'location': location,
@@ -805,7 +1352,6 @@ class SerpApiDB:
                 'rank': row[2]
             })
         
-        conn.close()
         return regions
 
 # Singleton instance
@@ -0,0 +1,251 @@
+"""
+SerpApi DuckDB Analytics Mirror
+Optional columnar copy of the analytics tables, synced incrementally from
+SQLite, so marketing aggregations run in DuckDB instead of Python loops
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from DB.analytics_db import connect_readonly
+
+# Mirror defaults (override via environment)
+# Path of the DuckDB file; empty disables the mirror
+DEFAULT_MIRROR_PATH = os.getenv('SERPAPI_DUCKDB_MIRROR', '')
+DEFAULT_SYNC_SECONDS = float(os.getenv('SERPAPI_DUCKDB_SYNC_SECONDS', '60'))
+DEFAULT_SYNC_BATCH_SIZE = int(os.getenv('SERPAPI_DUCKDB_SYNC_BATCH_SIZE', '50000'))
+
+# Tables read by MarketingAnalytics (deletes and updates are logged by migration 8)
+MIRROR_TABLES = [
+    'local_businesses', 'yelp_reviews', 'keywords', 'news_articles', 'people_also_ask',
+    'related_searches', 'keyword_suggestions', 'shopping_products',
+    'keyword_volume_history', 'regional_interest'
+]
+
+def _duckdb_type(sqlite_type: str) -> str:
+    """DuckDB column type for a declared SQLite type (timestamps stay text, as in SQLite)"""
+    declared = (sqlite_type or '').upper()
+    if 'INT' in declared:
+        return 'BIGINT'
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return 'DOUBLE'
+    if 'BOOL' in declared:
+        return 'BOOLEAN'
+    return 'VARCHAR'
+
+class DuckDBMirror:
+    """
+    Incremental SQLite -> DuckDB mirror
+
+    Each sync reads one read-only snapshot of SQLite and, per table, drops rows
+    logged in mirror_changes since the last sync, then copies rows with a
+    higher id than the last one copied plus the logged rows that still exist.
+    Watermarks live in the DuckDB file, so syncs resume across restarts. A
+    table whose SQLite columns no longer match the mirror (e.g. after a
+    migration added one) is rebuilt.
+    """
+
+    def __init__(self, sqlite_path: str, mirror_path: str, tables: List[str] = None,
+                 batch_size: int = None):
+        if duckdb is None:
+            raise ImportError("duckdb is required for the analytics mirror (pip install duckdb)")
+
+        self.sqlite_path = sqlite_path
+        self.mirror_path = mirror_path
+        self.tables = tables or MIRROR_TABLES
+        self.batch_size = batch_size or DEFAULT_SYNC_BATCH_SIZE
+
+        self._conn = duckdb.connect(mirror_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS mirror_state (
+                table_name VARCHAR PRIMARY KEY,
+                last_id BIGINT,
+                last_change_seq BIGINT,
+                synced_at DOUBLE
+            )
+        """)
+        self._lock = threading.Lock()
+        self._synced_at = 0.0
+        self._counters = {'syncs': 0, 'rows_copied': 0, 'rows_dropped': 0, 'rebuilds': 0}
+
+    def _state(self, table: str):
+        row = self._conn.execute(
+            "SELECT last_id, last_change_seq FROM mirror_state WHERE table_name = ?", [table]
+        ).fetchone()
+        return row if row else (None, None)
+
+    def _source_columns(self, source, table: str) -> List[tuple]:
+        """(name, DuckDB type) of each SQLite column, in table order"""
+        return [(name, _duckdb_type(declared))
+                for _, name, declared, *_ in source.execute(f"PRAGMA table_info({table})").fetchall()]
+
+    def _mirror_columns(self, table: str) -> List[tuple]:
+        """(name, type) of each mirror column, in table order (empty if the table is missing)"""
+        return [tuple(row) for row in self._conn.execute("""
+            SELECT column_name, data_type FROM information_schema.columns
+            WHERE table_name = ? ORDER BY ordinal_position
+        """, [table]).fetchall()]
+
+    def _create_table(self, table: str, columns: List[tuple]):
+        definition = ', '.join(f'"{name}" {column_type}' for name, column_type in columns)
+        self._conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+        self._conn.execute(f'CREATE TABLE "{table}" ({definition})')
+
+    def _insert(self, table: str, columns: List[str], rows: List[tuple]):
+        if not rows:
+            return
+        batch = None
+        if pa is not None:
+            try:
+                batch = pa.Table.from_arrays([pa.array(values) for values in zip(*rows)], names=columns)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # SQLite columns can hold mixed types; let DuckDB cast row by row
+                batch = None
+
+        if batch is not None:
+            self._conn.register('mirror_batch', batch)
+            try:
+                self._conn.execute(f'INSERT INTO "{table}" SELECT * FROM mirror_batch')
+            finally:
+                self._conn.unregister('mirror_batch')
+        else:
+            placeholders = ', '.join('?' * len(columns))
+            self._conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', rows)
+        self._counters['rows_copied'] += len(rows)
+
+    def _sync_table(self, source, table: str, change_seq: int, pruned_through: int):
+        last_id, last_seq = self._state(table)
+        source_columns = self._source_columns(source, table)
+        columns = [name for name, _ in source_columns]
+
+        # First sync, log entries we never applied have been pruned, or the
+        # SQLite schema has changed since the mirror table was created: rebuild
+        if (last_id is None or last_seq < pruned_through
+                or self._mirror_columns(table) != source_columns):
+            if last_id is not None:
+                self._counters['rebuilds'] += 1
+            self._create_table(table, source_columns)
+            last_id, last_seq, changed = 0, change_seq, []
+        else:
+            changed = sorted({row[0] for row in source.execute("""
+                SELECT row_id FROM mirror_changes
+                WHERE table_name = ? AND seq > ? AND seq <= ?
+            """, (table, last_seq, change_seq))})
+
+        column_list = ', '.join(f'"{name}"' for name in columns)
+
+        if changed:
+            for start in range(0, len(changed), 500):
+                chunk = changed[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                dropped = self._conn.execute(
+                    f'DELETE FROM "{table}" WHERE id IN ({placeholders})', chunk
+                ).fetchone()
+                self._counters['rows_dropped'] += dropped[0] if dropped else 0
+                # Updated rows still exist and are copied again; deleted ones are gone
+                self._insert(table, columns, source.execute(
+                    f"SELECT {column_list} FROM {table} WHERE id IN ({placeholders}) AND id <= ?",
+                    (*chunk, last_id)
+                ).fetchall())
+
+        max_id = last_id
+        while True:
+            rows = source.execute(
+                f"SELECT {column_list} FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                (max_id, self.batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            self._insert(table, columns, rows)
+            max_id = rows[-1][columns.index('id')]
+
+        self._conn.execute("""
+            INSERT OR REPLACE INTO mirror_state (table_name, last_id, last_change_seq, synced_at)
+            VALUES (?, ?, ?, ?)
+        """, [table, max_id, change_seq, time.time()])
+
+    def sync(self) -> Dict:
+        """Bring every mirrored table up to date with one SQLite snapshot"""
+        with self._lock:
+            started = time.perf_counter()
+            copied, dropped = self._counters['rows_copied'], self._counters['rows_dropped']
+            source = connect_readonly(self.sqlite_path)
+            try:
+                # sqlite_sequence keeps the highest seq even after the log is pruned
+                row = source.execute("SELECT seq FROM sqlite_sequence WHERE name = 'mirror_changes'").fetchone()
+                change_seq = row[0] if row else 0
+                oldest = source.execute("SELECT MIN(seq) FROM mirror_changes").fetchone()[0]
+                pruned_through = change_seq if oldest is None else oldest - 1
+
+                self._conn.execute("BEGIN TRANSACTION")
+                try:
+                    for table in self.tables:
+                        self._sync_table(source, table, change_seq, pruned_through)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            finally:
+                source.close()
+
+            self._synced_at = time.monotonic()
+            self._counters['syncs'] += 1
+            return {
+                'rows_copied': self._counters['rows_copied'] - copied,
+                'rows_dropped': self._counters['rows_dropped'] - dropped,
+                'duration_seconds': round(time.perf_counter() - started, 2)
+            }
+
+    def cursor(self, max_age_seconds: float = None):
+        """
+        A DuckDB cursor over the mirror, syncing first if the last sync is too old
+
+        The cursor supports execute/fetchall/close like a sqlite3 connection.
+        """
+        max_age = DEFAULT_SYNC_SECONDS if max_age_seconds is None else max_age_seconds
+        if time.monotonic() - self._synced_at >= max_age:
+            self.sync()
+        return self._conn.cursor()
+
+    def stats(self) -> Dict:
+        stats = dict(self._counters)
+        stats['mirror_path'] = self.mirror_path
+        stats['age_seconds'] = round(time.monotonic() - self._synced_at, 1) if self._synced_at else None
+        return stats
+
+# Singleton instance
+_mirror_instance = None
+_mirror_unavailable = False
+_mirror_lock = threading.Lock()
+
+def get_mirror(sqlite_path: str) -> Optional[DuckDBMirror]:
+    """
+    Shared mirror for a SQLite database, or None when disabled
+
+    Enabled by setting SERPAPI_DUCKDB_MIRROR to the DuckDB file path; falls
+    back to None (with a warning) if duckdb is not installed.
+    """
+    global _mirror_instance, _mirror_unavailable
+    if not DEFAULT_MIRROR_PATH or _mirror_unavailable:
+        return None
+    if _mirror_instance is None:
+        with _mirror_lock:
+            if _mirror_instance is None:
+                if duckdb is None:
+                    print("Warning: SERPAPI_DUCKDB_MIRROR is set but duckdb is not installed; using SQLite")
+                    _mirror_unavailable = True
+                    return None
+                _mirror_instance = DuckDBMirror(sqlite_path, DEFAULT_MIRROR_PATH)
+    return _mirror_instance
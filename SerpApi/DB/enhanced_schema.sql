@@ -17,7 +17,8 @@ CREATE TABLE IF NOT EXISTS api_calls (
     response_time_ms INTEGER,
     api_credits_used INTEGER DEFAULT 1,
     error_message TEXT,
-    raw_response TEXT, -- JSON blob
+    raw_response TEXT, -- JSON blob (legacy rows; new rows use raw_response_hash)
+    raw_response_hash TEXT, -- sha256 of the JSON, see raw_responses
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     validated_at TIMESTAMP,
     is_valid BOOLEAN DEFAULT 1
@@ -515,6 +516,33 @@ CREATE TABLE IF NOT EXISTS market_summaries (
     FOREIGN KEY (session_id) REFERENCES search_sessions(id)
 );
 
+-- ============================================================================
+-- RAW RESPONSE STORAGE
+-- ============================================================================
+
+-- Compressed raw API payloads, stored once per content hash
+CREATE TABLE IF NOT EXISTS raw_responses (
+    content_hash TEXT PRIMARY KEY, -- sha256 of the JSON text
+    encoding TEXT NOT NULL, -- 'zlib' or 'zstd'
+    payload BLOB NOT NULL,
+    size_bytes INTEGER, -- uncompressed JSON size
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================================================
+-- RESPONSE CACHE
+-- ============================================================================
+
+-- API responses keyed by sha256 of endpoint, engine function and all parameters
+CREATE TABLE IF NOT EXISTS response_cache (
+    cache_key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    query TEXT,
+    location TEXT,
+    response TEXT NOT NULL, -- JSON blob
+    created_at REAL NOT NULL -- Unix timestamp
+);
+
 -- ============================================================================
 -- INDEXES FOR PERFORMANCE
 -- ============================================================================
@@ -523,6 +551,7 @@ CREATE TABLE IF NOT EXISTS market_summaries (
 CREATE INDEX IF NOT EXISTS idx_api_calls_endpoint ON api_calls(api_endpoint, created_at);
 CREATE INDEX IF NOT EXISTS idx_api_calls_query ON api_calls(query, location);
 CREATE INDEX IF NOT EXISTS idx_api_calls_status ON api_calls(status);
+CREATE INDEX IF NOT EXISTS idx_response_cache_created ON response_cache(created_at);
 
 -- Keyword indexes
 CREATE INDEX IF NOT EXISTS idx_keywords_keyword ON keywords(keyword);
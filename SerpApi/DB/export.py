@@ -0,0 +1,236 @@
+"""
+SerpApi Bulk Export
+Streams any data table as CSV, JSONL or Parquet, reading fixed-size batches
+with fetchmany from one read-only snapshot, so memory use stays constant
+however large the table is
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import zlib
+from typing import Dict, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from DB.analytics_db import analytics_connection, connect_readonly
+
+# Export defaults (override via environment)
+DEFAULT_EXPORT_BATCH_SIZE = int(os.getenv('SERPAPI_EXPORT_BATCH_SIZE', '5000'))
+
+# Format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+# Compressed payload blobs, caches and change logs are not data tables
+INTERNAL_TABLES = {'raw_responses', 'response_cache', 'mirror_changes'}
+_FTS_TABLE = re.compile(r'_fts(_\w+)?$')
+
+# Query parameters that are options; every other parameter filters a column
+EXPORT_OPTIONS = {'format', 'compress', 'columns', 'since', 'until', 'after_id', 'limit'}
+
+def export_tables(conn) -> List[str]:
+    """Tables that can be exported (SQLite internals, FTS indexes and caches excluded)"""
+    return [name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+            if not name.startswith('sqlite_') and not _FTS_TABLE.search(name) and name not in INTERNAL_TABLES]
+
+def _arrow_type(sqlite_type: str):
+    """Arrow column type for a declared SQLite type (timestamps stay text, as in SQLite)"""
+    declared = (sqlite_type or '').upper()
+    if 'INT' in declared or 'BOOL' in declared:
+        return pa.int64()
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return pa.float64()
+    if 'BLOB' in declared:
+        return pa.binary()
+    return pa.string()
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that collects what the Parquet writer writes until drained"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+class TableExport:
+    """
+    One validated export of a table
+
+    The table, columns and options are checked when the export is created,
+    so a bad request raises ValueError before any output is produced. The
+    rows are read by chunks(), which opens its own snapshot connection.
+
+    Args:
+        db_path: Database file
+        table: Table to export
+        params: Request parameters:
+            format: 'csv' (default), 'jsonl' or 'parquet'
+            compress: 'gzip' to gzip the stream (CSV and JSONL)
+            columns: Comma-separated columns to export (default: all)
+            since / until: created_at range (since inclusive, until exclusive)
+            after_id: Only rows with a higher id (incremental pulls)
+            limit: Maximum number of rows
+            <column>=<value>: Only rows where the column equals the value
+        batch_size: Rows per fetchmany (default: DEFAULT_EXPORT_BATCH_SIZE)
+    """
+
+    def __init__(self, db_path: str, table: str, params: Dict[str, str], batch_size: int = None):
+        self.db_path = db_path
+        self.table = table
+        self.batch_size = batch_size or DEFAULT_EXPORT_BATCH_SIZE
+
+        self.format = params.get('format', 'csv').lower()
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown format: {self.format} (available: {', '.join(EXPORT_FORMATS)})")
+        if self.format == 'parquet' and pa is None:
+            raise ValueError("Parquet export requires pyarrow (pip install pyarrow)")
+
+        self.compress = params.get('compress', '').lower() or None
+        if self.compress not in (None, 'gzip'):
+            raise ValueError(f"Unknown compression: {self.compress} (available: gzip)")
+        if self.compress and self.format == 'parquet':
+            raise ValueError("Parquet files are already compressed; omit compress")
+
+        conn = connect_readonly(db_path)
+        try:
+            if table not in export_tables(conn):
+                raise ValueError(f"Unknown table: {table} (available: {', '.join(export_tables(conn))})")
+            declared = {name: sqlite_type for _, name, sqlite_type, *_ in
+                        conn.execute(f'PRAGMA table_info("{table}")').fetchall()}
+        finally:
+            conn.close()
+
+        requested = [c.strip() for c in params.get('columns', '').split(',') if c.strip()]
+        unknown = [c for c in requested if c not in declared]
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {', '.join(unknown)}")
+        self.columns = requested or list(declared)
+        self.types = [declared[c] for c in self.columns]
+
+        conditions, values = [], []
+        for name, value in params.items():
+            if name in EXPORT_OPTIONS:
+                continue
+            if name not in declared:
+                raise ValueError(f"Unknown filter column for {table}: {name}")
+            conditions.append(f'"{name}" = ?')
+            values.append(value)
+
+        for option, operator, column in (('since', '>=', 'created_at'), ('until', '<', 'created_at'),
+                                         ('after_id', '>', 'id')):
+            if params.get(option):
+                if column not in declared:
+                    raise ValueError(f"{option} needs a {column} column, which {table} does not have")
+                conditions.append(f'"{column}" {operator} ?')
+                values.append(int(params[option]) if column == 'id' else params[option])
+
+        column_list = ', '.join(f'"{c}"' for c in self.columns)
+        self.sql = f'SELECT {column_list} FROM "{table}"'
+        if conditions:
+            self.sql += ' WHERE ' + ' AND '.join(conditions)
+        if 'id' in declared:
+            # Stable order along the primary key, so after_id pulls can resume
+            self.sql += ' ORDER BY id'
+        if params.get('limit'):
+            self.sql += ' LIMIT ?'
+            values.append(int(params['limit']))
+        self.values = values
+
+    @property
+    def mimetype(self) -> str:
+        return 'application/gzip' if self.compress else EXPORT_FORMATS[self.format][0]
+
+    @property
+    def filename(self) -> str:
+        name = f"{self.table}.{EXPORT_FORMATS[self.format][1]}"
+        return f"{name}.gz" if self.compress else name
+
+    def _batches(self, cursor) -> Iterator[List[tuple]]:
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def _csv(self, cursor) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        for rows in self._batches(cursor):
+            writer.writerows(rows)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only, for an empty export
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    def _jsonl(self, cursor) -> Iterator[bytes]:
+        for rows in self._batches(cursor):
+            yield ''.join(json.dumps(dict(zip(self.columns, row)), default=str) + '\n'
+                          for row in rows).encode('utf-8')
+
+    def _parquet(self, cursor) -> Iterator[bytes]:
+        schema = pa.schema([(name, _arrow_type(declared)) for name, declared in zip(self.columns, self.types)])
+        sink = _ChunkSink()
+        # One row group per batch; each is handed on as soon as it is written
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        try:
+            for rows in self._batches(cursor):
+                arrays = []
+                for field, values in zip(schema, zip(*rows)):
+                    if pa.types.is_string(field.type):
+                        values = [None if v is None else str(v) for v in values]
+                    # safe=False: SQLite lets an INTEGER column hold 4.5
+                    arrays.append(pa.array(values, type=field.type, safe=False))
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    def chunks(self) -> Iterator[bytes]:
+        """Encoded (and optionally gzipped) output, one chunk per batch of rows"""
+        conn = analytics_connection(self.db_path)
+        try:
+            cursor = conn.execute(self.sql, self.values)
+            encoded = getattr(self, f"_{self.format}")(cursor)
+            if not self.compress:
+                yield from encoded
+                return
+
+            # gzip container (wbits 16+) so the stream is a valid .gz file
+            compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            for chunk in encoded:
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+            yield compressor.flush()
+        finally:
+            conn.close()
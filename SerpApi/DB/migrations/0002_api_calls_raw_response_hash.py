@@ -0,0 +1,11 @@
+"""
+Migration 2: reference compressed raw payloads from api_calls
+
+Databases created from an older enhanced_schema.sql have api_calls without
+raw_response_hash (CREATE TABLE IF NOT EXISTS does not add columns).
+"""
+
+def upgrade(conn):
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(api_calls)")]
+    if 'raw_response_hash' not in columns:
+        conn.execute("ALTER TABLE api_calls ADD COLUMN raw_response_hash TEXT")
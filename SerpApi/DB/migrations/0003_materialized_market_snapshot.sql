@@ -0,0 +1,190 @@
+-- Migration 3: materialized market snapshot
+--
+-- v_market_snapshot cross-joined local_businesses x keywords x news_articles x
+-- api_calls on every read. The same figures are now kept in one
+-- market_summaries row (industry = 'all', location = 'all') that triggers
+-- adjust as rows are inserted, replaced or deleted. Averages are stored as
+-- running sums and counts so each write costs O(1) plus one index probe.
+--
+-- INSERT OR REPLACE only fires the DELETE triggers for the replaced row when
+-- PRAGMA recursive_triggers is on; SerpApiDB enables it on every connection.
+
+DROP VIEW IF EXISTS v_market_snapshot;
+
+ALTER TABLE market_summaries ADD COLUMN rated_businesses INTEGER DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN rating_sum REAL DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN keywords_tracked INTEGER DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN scored_keywords INTEGER DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN difficulty_sum REAL DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN news_articles INTEGER DEFAULT 0;
+ALTER TABLE market_summaries ADD COLUMN last_updated TIMESTAMP;
+
+-- Backfill from the existing data (each aggregate reads a single table)
+INSERT INTO market_summaries (
+    industry, location, summary_date,
+    total_competitors, rated_businesses, rating_sum, total_reviews,
+    keywords_tracked, scored_keywords, difficulty_sum,
+    news_articles, last_updated
+)
+SELECT
+    'all', 'all', date('now'),
+    (SELECT COUNT(DISTINCT business_name) FROM local_businesses),
+    (SELECT COUNT(rating) FROM local_businesses),
+    (SELECT COALESCE(SUM(rating), 0) FROM local_businesses),
+    (SELECT COALESCE(SUM(reviews_count), 0) FROM local_businesses),
+    (SELECT COUNT(DISTINCT keyword) FROM keywords),
+    (SELECT COUNT(difficulty_score) FROM keywords),
+    (SELECT COALESCE(SUM(difficulty_score), 0) FROM keywords),
+    (SELECT COUNT(*) FROM news_articles),
+    (SELECT MAX(created_at) FROM api_calls WHERE status = 'success');
+
+UPDATE market_summaries SET
+    avg_rating = rating_sum / NULLIF(rated_businesses, 0),
+    market_difficulty_score = difficulty_sum / NULLIF(scored_keywords, 0)
+WHERE industry = 'all' AND location = 'all';
+
+-- Local businesses ----------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS trg_market_local_businesses_insert
+AFTER INSERT ON local_businesses
+BEGIN
+    UPDATE market_summaries SET
+        total_competitors = total_competitors + (
+            NEW.business_name IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM local_businesses
+                WHERE business_name = NEW.business_name AND id != NEW.id
+            )
+        ),
+        rated_businesses = rated_businesses + (NEW.rating IS NOT NULL),
+        rating_sum = rating_sum + COALESCE(NEW.rating, 0),
+        total_reviews = total_reviews + COALESCE(NEW.reviews_count, 0),
+        avg_rating = (rating_sum + COALESCE(NEW.rating, 0))
+            / NULLIF(rated_businesses + (NEW.rating IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_local_businesses_delete
+AFTER DELETE ON local_businesses
+BEGIN
+    UPDATE market_summaries SET
+        total_competitors = total_competitors - (
+            OLD.business_name IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM local_businesses WHERE business_name = OLD.business_name
+            )
+        ),
+        rated_businesses = rated_businesses - (OLD.rating IS NOT NULL),
+        rating_sum = rating_sum - COALESCE(OLD.rating, 0),
+        total_reviews = total_reviews - COALESCE(OLD.reviews_count, 0),
+        avg_rating = (rating_sum - COALESCE(OLD.rating, 0))
+            / NULLIF(rated_businesses - (OLD.rating IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_local_businesses_update
+AFTER UPDATE OF business_name, rating, reviews_count ON local_businesses
+BEGIN
+    UPDATE market_summaries SET
+        total_competitors = total_competitors + CASE
+            WHEN OLD.business_name IS NEW.business_name THEN 0
+            ELSE (NEW.business_name IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM local_businesses
+                    WHERE business_name = NEW.business_name AND id != NEW.id
+                 ))
+               - (OLD.business_name IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM local_businesses WHERE business_name = OLD.business_name
+                 ))
+        END,
+        rated_businesses = rated_businesses - (OLD.rating IS NOT NULL) + (NEW.rating IS NOT NULL),
+        rating_sum = rating_sum - COALESCE(OLD.rating, 0) + COALESCE(NEW.rating, 0),
+        total_reviews = total_reviews - COALESCE(OLD.reviews_count, 0) + COALESCE(NEW.reviews_count, 0),
+        avg_rating = (rating_sum - COALESCE(OLD.rating, 0) + COALESCE(NEW.rating, 0))
+            / NULLIF(rated_businesses - (OLD.rating IS NOT NULL) + (NEW.rating IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+-- Keywords ------------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS trg_market_keywords_insert
+AFTER INSERT ON keywords
+BEGIN
+    UPDATE market_summaries SET
+        keywords_tracked = keywords_tracked + NOT EXISTS (
+            SELECT 1 FROM keywords WHERE keyword = NEW.keyword AND id != NEW.id
+        ),
+        scored_keywords = scored_keywords + (NEW.difficulty_score IS NOT NULL),
+        difficulty_sum = difficulty_sum + COALESCE(NEW.difficulty_score, 0),
+        market_difficulty_score = (difficulty_sum + COALESCE(NEW.difficulty_score, 0))
+            / NULLIF(scored_keywords + (NEW.difficulty_score IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_keywords_delete
+AFTER DELETE ON keywords
+BEGIN
+    UPDATE market_summaries SET
+        keywords_tracked = keywords_tracked - NOT EXISTS (
+            SELECT 1 FROM keywords WHERE keyword = OLD.keyword
+        ),
+        scored_keywords = scored_keywords - (OLD.difficulty_score IS NOT NULL),
+        difficulty_sum = difficulty_sum - COALESCE(OLD.difficulty_score, 0),
+        market_difficulty_score = (difficulty_sum - COALESCE(OLD.difficulty_score, 0))
+            / NULLIF(scored_keywords - (OLD.difficulty_score IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_keywords_update
+AFTER UPDATE OF keyword, difficulty_score ON keywords
+BEGIN
+    UPDATE market_summaries SET
+        keywords_tracked = keywords_tracked + CASE
+            WHEN OLD.keyword IS NEW.keyword THEN 0
+            ELSE NOT EXISTS (SELECT 1 FROM keywords WHERE keyword = NEW.keyword AND id != NEW.id)
+               - NOT EXISTS (SELECT 1 FROM keywords WHERE keyword = OLD.keyword)
+        END,
+        scored_keywords = scored_keywords - (OLD.difficulty_score IS NOT NULL) + (NEW.difficulty_score IS NOT NULL),
+        difficulty_sum = difficulty_sum - COALESCE(OLD.difficulty_score, 0) + COALESCE(NEW.difficulty_score, 0),
+        market_difficulty_score = (difficulty_sum - COALESCE(OLD.difficulty_score, 0) + COALESCE(NEW.difficulty_score, 0))
+            / NULLIF(scored_keywords - (OLD.difficulty_score IS NOT NULL) + (NEW.difficulty_score IS NOT NULL), 0),
+        summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+-- News articles -------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS trg_market_news_insert
+AFTER INSERT ON news_articles
+BEGIN
+    UPDATE market_summaries SET news_articles = news_articles + 1, summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_news_delete
+AFTER DELETE ON news_articles
+BEGIN
+    UPDATE market_summaries SET news_articles = news_articles - 1, summary_date = date('now')
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+-- API calls -----------------------------------------------------------------
+
+CREATE TRIGGER IF NOT EXISTS trg_market_api_calls_insert
+AFTER INSERT ON api_calls
+WHEN NEW.status = 'success'
+BEGIN
+    UPDATE market_summaries SET last_updated = MAX(COALESCE(last_updated, ''), NEW.created_at)
+    WHERE industry = 'all' AND location = 'all';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_market_api_calls_delete
+AFTER DELETE ON api_calls
+WHEN OLD.status = 'success'
+BEGIN
+    UPDATE market_summaries SET
+        last_updated = (SELECT MAX(created_at) FROM api_calls WHERE status = 'success')
+    WHERE industry = 'all' AND location = 'all' AND last_updated = OLD.created_at;
+END;
@@ -0,0 +1,18 @@
+-- Migration 4: covering indexes for the hot api_calls lookups
+--
+-- Freshness checks filter on (query, location, status, api_endpoint) and read
+-- created_at; with every column in the index they never touch the table.
+-- query/location lead so one range answers all endpoints of a batched check.
+CREATE INDEX IF NOT EXISTS idx_api_calls_freshness
+    ON api_calls(query, location, status, api_endpoint, created_at);
+
+-- Credit budget sums and the market snapshot's last_updated read successful
+-- calls by time; this supersedes idx_api_calls_status
+CREATE INDEX IF NOT EXISTS idx_api_calls_status_created
+    ON api_calls(status, created_at, api_credits_used);
+DROP INDEX IF EXISTS idx_api_calls_status;
+
+-- Recent searches list
+CREATE INDEX IF NOT EXISTS idx_api_calls_created ON api_calls(created_at);
+
+ANALYZE api_calls;
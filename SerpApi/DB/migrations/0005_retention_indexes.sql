@@ -0,0 +1,12 @@
+-- Migration 5: indexes used by the retention job (DB/retention.py)
+--
+-- Expiry scans read rows older than a cutoff; without an index on created_at
+-- each pass would scan the whole table. api_calls is already covered by
+-- idx_api_calls_created.
+CREATE INDEX IF NOT EXISTS idx_search_results_created ON search_results(created_at);
+CREATE INDEX IF NOT EXISTS idx_local_businesses_created ON local_businesses(created_at);
+CREATE INDEX IF NOT EXISTS idx_keyword_volume_history_created ON keyword_volume_history(created_at);
+CREATE INDEX IF NOT EXISTS idx_regional_interest_created ON regional_interest(created_at);
+
+-- Garbage collection of raw_responses checks whether any call still references a blob
+CREATE INDEX IF NOT EXISTS idx_api_calls_raw_response_hash ON api_calls(raw_response_hash);
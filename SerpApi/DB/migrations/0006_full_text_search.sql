@@ -0,0 +1,127 @@
+-- Migration 6: full-text search
+--
+-- One FTS5 index per searchable table. They are external-content tables: the
+-- text lives only in the source table and the index stores tokens, so the
+-- indexes stay small. Triggers keep them in sync on insert, update and delete
+-- (including retention deletes and INSERT OR REPLACE, since SerpApiDB enables
+-- recursive_triggers). Each index is built from the existing rows once here.
+
+-- search_results (title, snippet)
+CREATE VIRTUAL TABLE IF NOT EXISTS search_results_fts USING fts5(
+    title, snippet,
+    content = 'search_results', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_results_fts_insert AFTER INSERT ON search_results
+BEGIN
+    INSERT INTO search_results_fts (rowid, title, snippet) VALUES (NEW.id, NEW.title, NEW.snippet);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_results_fts_delete AFTER DELETE ON search_results
+BEGIN
+    INSERT INTO search_results_fts (search_results_fts, rowid, title, snippet) VALUES ('delete', OLD.id, OLD.title, OLD.snippet);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_results_fts_update AFTER UPDATE OF title, snippet ON search_results
+BEGIN
+    INSERT INTO search_results_fts (search_results_fts, rowid, title, snippet) VALUES ('delete', OLD.id, OLD.title, OLD.snippet);
+    INSERT INTO search_results_fts (rowid, title, snippet) VALUES (NEW.id, NEW.title, NEW.snippet);
+END;
+
+INSERT INTO search_results_fts (search_results_fts) VALUES ('rebuild');
+
+-- people_also_ask (question, answer)
+CREATE VIRTUAL TABLE IF NOT EXISTS people_also_ask_fts USING fts5(
+    question, answer,
+    content = 'people_also_ask', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_people_also_ask_fts_insert AFTER INSERT ON people_also_ask
+BEGIN
+    INSERT INTO people_also_ask_fts (rowid, question, answer) VALUES (NEW.id, NEW.question, NEW.answer);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_people_also_ask_fts_delete AFTER DELETE ON people_also_ask
+BEGIN
+    INSERT INTO people_also_ask_fts (people_also_ask_fts, rowid, question, answer) VALUES ('delete', OLD.id, OLD.question, OLD.answer);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_people_also_ask_fts_update AFTER UPDATE OF question, answer ON people_also_ask
+BEGIN
+    INSERT INTO people_also_ask_fts (people_also_ask_fts, rowid, question, answer) VALUES ('delete', OLD.id, OLD.question, OLD.answer);
+    INSERT INTO people_also_ask_fts (rowid, question, answer) VALUES (NEW.id, NEW.question, NEW.answer);
+END;
+
+INSERT INTO people_also_ask_fts (people_also_ask_fts) VALUES ('rebuild');
+
+-- news_articles (title, snippet)
+CREATE VIRTUAL TABLE IF NOT EXISTS news_articles_fts USING fts5(
+    title, snippet,
+    content = 'news_articles', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_news_articles_fts_insert AFTER INSERT ON news_articles
+BEGIN
+    INSERT INTO news_articles_fts (rowid, title, snippet) VALUES (NEW.id, NEW.title, NEW.snippet);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_news_articles_fts_delete AFTER DELETE ON news_articles
+BEGIN
+    INSERT INTO news_articles_fts (news_articles_fts, rowid, title, snippet) VALUES ('delete', OLD.id, OLD.title, OLD.snippet);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_news_articles_fts_update AFTER UPDATE OF title, snippet ON news_articles
+BEGIN
+    INSERT INTO news_articles_fts (news_articles_fts, rowid, title, snippet) VALUES ('delete', OLD.id, OLD.title, OLD.snippet);
+    INSERT INTO news_articles_fts (rowid, title, snippet) VALUES (NEW.id, NEW.title, NEW.snippet);
+END;
+
+INSERT INTO news_articles_fts (news_articles_fts) VALUES ('rebuild');
+
+-- yelp_review_details (review_text)
+CREATE VIRTUAL TABLE IF NOT EXISTS yelp_review_details_fts USING fts5(
+    review_text,
+    content = 'yelp_review_details', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_yelp_review_details_fts_insert AFTER INSERT ON yelp_review_details
+BEGIN
+    INSERT INTO yelp_review_details_fts (rowid, review_text) VALUES (NEW.id, NEW.review_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_yelp_review_details_fts_delete AFTER DELETE ON yelp_review_details
+BEGIN
+    INSERT INTO yelp_review_details_fts (yelp_review_details_fts, rowid, review_text) VALUES ('delete', OLD.id, OLD.review_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_yelp_review_details_fts_update AFTER UPDATE OF review_text ON yelp_review_details
+BEGIN
+    INSERT INTO yelp_review_details_fts (yelp_review_details_fts, rowid, review_text) VALUES ('delete', OLD.id, OLD.review_text);
+    INSERT INTO yelp_review_details_fts (rowid, review_text) VALUES (NEW.id, NEW.review_text);
+END;
+
+INSERT INTO yelp_review_details_fts (yelp_review_details_fts) VALUES ('rebuild');
+
+-- job_listings (job_title, company_name, description)
+CREATE VIRTUAL TABLE IF NOT EXISTS job_listings_fts USING fts5(
+    job_title, company_name, description,
+    content = 'job_listings', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_job_listings_fts_insert AFTER INSERT ON job_listings
+BEGIN
+    INSERT INTO job_listings_fts (rowid, job_title, company_name, description) VALUES (NEW.id, NEW.job_title, NEW.company_name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_listings_fts_delete AFTER DELETE ON job_listings
+BEGIN
+    INSERT INTO job_listings_fts (job_listings_fts, rowid, job_title, company_name, description) VALUES ('delete', OLD.id, OLD.job_title, OLD.company_name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_listings_fts_update AFTER UPDATE OF job_title, company_name, description ON job_listings
+BEGIN
+    INSERT INTO job_listings_fts (job_listings_fts, rowid, job_title, company_name, description) VALUES ('delete', OLD.id, OLD.job_title, OLD.company_name, OLD.description);
+    INSERT INTO job_listings_fts (rowid, job_title, company_name, description) VALUES (NEW.id, NEW.job_title, NEW.company_name, NEW.description);
+END;
+
+INSERT INTO job_listings_fts (job_listings_fts) VALUES ('rebuild');
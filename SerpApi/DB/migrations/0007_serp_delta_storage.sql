@@ -0,0 +1,54 @@
+-- Migration 7: SERP change-detection storage
+--
+-- serp_current holds the latest observed state of every item (organic result,
+-- local pack entry, Yelp business) per (source, keyword, location).
+-- serp_changes is an append-only log written only when an item appears,
+-- disappears, or changes position, rating or review count. Any past SERP
+-- is rebuilt by replaying the log up to a point in time.
+
+CREATE TABLE IF NOT EXISTS serp_current (
+    source TEXT NOT NULL, -- 'search_results', 'local_pack', 'yelp_businesses'
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    item_key TEXT NOT NULL, -- link, place_id or Yelp URL
+    title TEXT,
+    link TEXT,
+    position INTEGER,
+    rating REAL,
+    reviews_count INTEGER,
+    first_seen TIMESTAMP NOT NULL,
+    changed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (source, keyword, location, item_key)
+) WITHOUT ROWID;
+
+-- One row per tracked SERP: when it was last checked and last changed
+CREATE TABLE IF NOT EXISTS serp_sets (
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    observations INTEGER DEFAULT 0,
+    last_observed_at TIMESTAMP,
+    last_changed_at TIMESTAMP,
+    PRIMARY KEY (source, keyword, location)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS serp_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    change_type TEXT NOT NULL, -- 'added', 'changed', 'removed'
+    title TEXT,
+    link TEXT,
+    position INTEGER, -- state after the change (NULL for 'removed')
+    rating REAL,
+    reviews_count INTEGER,
+    previous_position INTEGER,
+    observed_at TIMESTAMP NOT NULL,
+    api_call_id INTEGER,
+    FOREIGN KEY (api_call_id) REFERENCES api_calls(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_serp_changes_set
+    ON serp_changes(source, keyword, location, observed_at);
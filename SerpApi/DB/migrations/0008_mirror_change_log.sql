@@ -0,0 +1,116 @@
+-- Migration 8: change log for the DuckDB analytics mirror (DB/duckdb_mirror.py)
+--
+-- The mirror copies new rows by id. Rows that are deleted (retention,
+-- INSERT OR REPLACE) or updated are logged here so the next sync can drop
+-- or re-copy them. The retention job prunes old entries; a mirror that has
+-- fallen behind the pruned range rebuilds itself from scratch.
+
+CREATE TABLE IF NOT EXISTS mirror_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_id INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_mirror_changes_table ON mirror_changes(table_name, seq);
+CREATE INDEX IF NOT EXISTS idx_mirror_changes_created ON mirror_changes(created_at);
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_local_businesses_delete AFTER DELETE ON local_businesses
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('local_businesses', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_local_businesses_update AFTER UPDATE ON local_businesses
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('local_businesses', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_yelp_reviews_delete AFTER DELETE ON yelp_reviews
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('yelp_reviews', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_yelp_reviews_update AFTER UPDATE ON yelp_reviews
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('yelp_reviews', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keywords_delete AFTER DELETE ON keywords
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keywords', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keywords_update AFTER UPDATE ON keywords
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keywords', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_news_articles_delete AFTER DELETE ON news_articles
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('news_articles', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_news_articles_update AFTER UPDATE ON news_articles
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('news_articles', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_people_also_ask_delete AFTER DELETE ON people_also_ask
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('people_also_ask', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_people_also_ask_update AFTER UPDATE ON people_also_ask
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('people_also_ask', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_related_searches_delete AFTER DELETE ON related_searches
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('related_searches', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_related_searches_update AFTER UPDATE ON related_searches
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('related_searches', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keyword_suggestions_delete AFTER DELETE ON keyword_suggestions
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keyword_suggestions', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keyword_suggestions_update AFTER UPDATE ON keyword_suggestions
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keyword_suggestions', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_shopping_products_delete AFTER DELETE ON shopping_products
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('shopping_products', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_shopping_products_update AFTER UPDATE ON shopping_products
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('shopping_products', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keyword_volume_history_delete AFTER DELETE ON keyword_volume_history
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keyword_volume_history', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_keyword_volume_history_update AFTER UPDATE ON keyword_volume_history
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('keyword_volume_history', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_regional_interest_delete AFTER DELETE ON regional_interest
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('regional_interest', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_mirror_regional_interest_update AFTER UPDATE ON regional_interest
+BEGIN
+    INSERT INTO mirror_changes (table_name, row_id) VALUES ('regional_interest', OLD.id);
+END;
@@ -0,0 +1,36 @@
+-- Migration 9: checkpoints and lookups for the raw-response backfill (DB/backfill.py)
+--
+-- A backfill re-derives rows from stored API responses, replacing the rows of
+-- each call. Its progress is committed with every batch, so an interrupted run
+-- resumes after the last call it wrote.
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    name TEXT NOT NULL,             -- Backfill run name (reuse to resume, change to start over)
+    api_endpoint TEXT NOT NULL,     -- api_calls.api_endpoint being replayed
+    last_api_call_id INTEGER NOT NULL DEFAULT 0,
+    calls_processed INTEGER NOT NULL DEFAULT 0,
+    calls_failed INTEGER NOT NULL DEFAULT 0,
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    started_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    PRIMARY KEY (name, api_endpoint)
+);
+
+-- Each call's rows are deleted before they are rebuilt; without these indexes
+-- every batch would scan the whole table
+CREATE INDEX IF NOT EXISTS idx_search_results_api_call ON search_results(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_keywords_api_call ON keywords(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_keyword_suggestions_api_call ON keyword_suggestions(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_people_also_ask_api_call ON people_also_ask(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_related_searches_api_call ON related_searches(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_serp_features_api_call ON serp_features(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_local_businesses_api_call ON local_businesses(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_local_pack_api_call ON local_pack(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_images_api_call ON images(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_news_articles_api_call ON news_articles(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_shopping_products_api_call ON shopping_products(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_yelp_reviews_api_call ON yelp_reviews(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_youtube_videos_api_call ON youtube_videos(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_job_listings_api_call ON job_listings(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_keyword_volume_history_api_call ON keyword_volume_history(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_regional_interest_api_call ON regional_interest(api_call_id);
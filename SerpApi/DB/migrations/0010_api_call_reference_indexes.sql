@@ -0,0 +1,9 @@
+-- Migration 10: api_call_id indexes for the remaining referencing tables
+--
+-- When the retention job deletes api_calls it clears the api_call_id of rows
+-- still pointing at them; migration 9 indexed the tables the backfill writes,
+-- these are the rest.
+CREATE INDEX IF NOT EXISTS idx_autocomplete_suggestions_api_call ON autocomplete_suggestions(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_competitor_keywords_api_call ON competitor_keywords(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_search_trends_api_call ON search_trends(api_call_id);
+CREATE INDEX IF NOT EXISTS idx_serp_changes_api_call ON serp_changes(api_call_id);
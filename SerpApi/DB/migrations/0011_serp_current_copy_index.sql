@@ -0,0 +1,6 @@
+-- Migration 11: index for finding the newest copy of each SERP
+--
+-- The retention job keeps the latest search_results rows of every tracked
+-- SERP (unchanged SERPs are not re-inserted); this makes the per-row
+-- MAX(created_at) lookup an index seek.
+CREATE INDEX IF NOT EXISTS idx_search_results_serp_created ON search_results(keyword, location, created_at);
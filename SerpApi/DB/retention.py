@@ -0,0 +1,363 @@
+"""
+SerpApi Retention & Archival
+Per-table retention policies: expired rows are exported to compressed,
+month-partitioned archives, deleted in batches, and the freed pages are
+handed back with an incremental vacuum
+"""
+
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+def _parse_retention_days(spec: str) -> Dict[str, int]:
+    """Parse 'search_results=90,api_calls=365' into {'search_results': 90, 'api_calls': 365}"""
+    days = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        table, _, value = item.partition('=')
+        days[table.strip()] = int(value)
+    return days
+
+# Days to keep each kind of data (0 = keep forever). Raw payloads are most of
+# the file and go first; parsed rows are kept longer. Aggregates (keywords,
+# keyword_metrics_history, market_summaries) have no policy and are never deleted.
+# api_calls must cover at least a month so the monthly credit budget sees every call.
+DEFAULT_RETENTION_DAYS = {
+    'raw_responses': 30,
+    'search_results': 180,
+    'local_businesses': 365,
+    'keyword_volume_history': 730,
+    'regional_interest': 730,
+    'api_calls': 400,
+    'response_cache': 7,
+    # DuckDB mirror change log; a mirror idle for longer rebuilds itself
+    'mirror_changes': 30,
+    # Overrides, e.g. SERPAPI_RETENTION_DAYS="raw_responses=14,search_results=90"
+    **_parse_retention_days(os.getenv('SERPAPI_RETENTION_DAYS', ''))
+}
+
+# Row tables in deletion order: children before api_calls
+ROW_TABLES = ['search_results', 'local_businesses', 'keyword_volume_history',
+              'regional_interest', 'api_calls']
+
+# Row tables stored as SERP deltas -> their serp_sets source. An unchanged SERP
+# is not re-inserted, so the newest copy of a tracked SERP is kept at any age.
+CURRENT_COPY_SOURCES = {'search_results': 'search_results'}
+
+# Archive defaults (override via environment)
+DEFAULT_ARCHIVE_DIR = os.getenv('SERPAPI_ARCHIVE_DIR',
+                                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archive'))
+DEFAULT_ARCHIVE_FORMAT = os.getenv('SERPAPI_ARCHIVE_FORMAT', 'jsonl')  # 'jsonl' or 'parquet'
+DEFAULT_BATCH_SIZE = int(os.getenv('SERPAPI_RETENTION_BATCH_SIZE', '1000'))
+
+class RetentionJob:
+    """
+    Archive-then-delete pass over every table with a policy
+
+    Each batch is written to <archive_dir>/<table>/<YYYY-MM>/part-<run>.jsonl.gz
+    (or .parquet) and synced to disk before its rows are deleted, so a crash
+    can at worst archive a batch twice, never lose it. Deleting api_calls
+    clears the api_call_id of every row still pointing at them in the same
+    transaction; those rows are kept until their own policy expires them.
+    The newest full copy of each SERP tracked in serp_sets is never expired,
+    however old, since it is still the SERP's current state.
+    """
+
+    def __init__(self, db, retention_days: Dict[str, int] = None, archive_dir: str = None,
+                 archive_format: str = None, batch_size: int = None):
+        self.db = db
+        self.retention_days = {**DEFAULT_RETENTION_DAYS, **(retention_days or {})}
+        self.archive_dir = archive_dir or DEFAULT_ARCHIVE_DIR
+        self.archive_format = archive_format or DEFAULT_ARCHIVE_FORMAT
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+
+        if self.archive_format == 'parquet' and pa is None:
+            print("Warning: pyarrow not installed, archiving as JSONL instead of Parquet")
+            self.archive_format = 'jsonl'
+
+        self._run_stamp = None
+        self._parts = 0
+        self._files = set()
+
+    def _cutoff(self, days: int, utc: bool = False) -> str:
+        """
+        created_at values below this string are expired (ISO timestamps sort as text)
+
+        SerpApiDB writes created_at with datetime.now(), i.e. local time;
+        utc=True is for tables stamped by SQLite's CURRENT_TIMESTAMP.
+        """
+        now = datetime.utcnow() if utc else datetime.now()
+        return (now - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+    def _referencing_tables(self) -> List[str]:
+        """Tables with an api_call_id column (FTS indexes excluded)"""
+        conn = self.db.get_connection()
+        tables = [name for (name,) in conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name != 'api_calls' AND sql NOT LIKE 'CREATE VIRTUAL%'
+        """)]
+        return [table for table in tables
+                if any(column[1] == 'api_call_id' for column in conn.execute(f'PRAGMA table_info("{table}")'))]
+
+    # ------------------------------------------------------------------
+    # Archives
+    # ------------------------------------------------------------------
+
+    def _archive(self, name: str, records: List[Dict]):
+        """Append records to their month partitions and fsync before returning"""
+        by_month: Dict[str, List[Dict]] = {}
+        for record in records:
+            month = str(record.get('created_at') or '')[:7] or 'unknown'
+            by_month.setdefault(month, []).append(record)
+
+        for month, rows in by_month.items():
+            directory = os.path.join(self.archive_dir, name, month)
+            os.makedirs(directory, exist_ok=True)
+
+            if self.archive_format == 'parquet':
+                # Parquet files cannot be appended to, so every batch is its own part
+                self._parts += 1
+                path = os.path.join(directory, f"part-{self._run_stamp}-{self._parts:05d}.parquet")
+                columns = [{key: json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+                            for key, value in row.items()} for row in rows]
+                pq.write_table(pa.Table.from_pylist(columns), path, compression='zstd')
+                with open(path, 'rb') as f:
+                    os.fsync(f.fileno())
+            else:
+                path = os.path.join(directory, f"part-{self._run_stamp}.jsonl.gz")
+                with open(path, 'ab') as raw:
+                    # Each batch is a separate gzip member; gzip readers concatenate them
+                    with gzip.GzipFile(fileobj=raw, mode='ab') as f:
+                        for row in rows:
+                            f.write((json.dumps(row, default=str) + '\n').encode('utf-8'))
+                    raw.flush()
+                    os.fsync(raw.fileno())
+
+            self._files.add(path)
+
+    # ------------------------------------------------------------------
+    # Policies
+    # ------------------------------------------------------------------
+
+    def _expire_raw_payloads(self, days: int, dry_run: bool) -> Dict:
+        """Archive and detach raw payloads of old calls, then drop unreferenced blobs"""
+        conn = self.db.get_connection()
+        cutoff = self._cutoff(days)
+        expired_where = """
+            created_at < ? AND (raw_response_hash IS NOT NULL OR raw_response IS NOT NULL)
+        """
+
+        if dry_run:
+            count = conn.execute(f"SELECT COUNT(*) FROM api_calls WHERE {expired_where}", (cutoff,)).fetchone()[0]
+            return {'expired': count}
+
+        archived = 0
+        while True:
+            rows = conn.execute(f"""
+                SELECT id, api_endpoint, query, location, created_at FROM api_calls
+                WHERE {expired_where}
+                ORDER BY id LIMIT ?
+            """, (cutoff, self.batch_size)).fetchall()
+            if not rows:
+                break
+
+            self._archive('raw_responses', [{
+                'api_call_id': api_call_id,
+                'api_endpoint': endpoint,
+                'query': query,
+                'location': location,
+                'created_at': created_at,
+                'raw_response': self.db.get_raw_response(api_call_id)
+            } for api_call_id, endpoint, query, location, created_at in rows])
+
+            with self.db.transaction():
+                conn.executemany(
+                    "UPDATE api_calls SET raw_response_hash = NULL, raw_response = NULL WHERE id = ?",
+                    [(row[0],) for row in rows]
+                )
+            archived += len(rows)
+
+        # Blobs are shared between identical responses, so only drop unreferenced ones
+        with self.db.transaction():
+            blobs_deleted = conn.execute("""
+                DELETE FROM raw_responses
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM api_calls WHERE raw_response_hash = raw_responses.content_hash
+                )
+            """).rowcount
+
+        return {'expired': archived, 'archived': archived, 'blobs_deleted': blobs_deleted}
+
+    def _expired_where(self, table: str, cutoff: str):
+        """WHERE clause and parameters selecting the expired rows of a row table"""
+        source = CURRENT_COPY_SOURCES.get(table)
+        if source is None:
+            return "created_at < ?", (cutoff,)
+
+        # Rows of one save share created_at, so the newest copy is the rows at MAX(created_at)
+        return f"""
+            created_at < ? AND (
+                NOT EXISTS (
+                    SELECT 1 FROM serp_sets
+                    WHERE serp_sets.source = ? AND serp_sets.keyword = {table}.keyword
+                      AND serp_sets.location IS {table}.location
+                )
+                OR created_at < (
+                    SELECT MAX(newer.created_at) FROM {table} AS newer
+                    WHERE newer.keyword = {table}.keyword AND newer.location IS {table}.location
+                )
+            )
+        """, (cutoff, source)
+
+    def _expire_rows(self, table: str, days: int, dry_run: bool) -> Dict:
+        """Archive and delete rows older than the table's retention period"""
+        conn = self.db.get_connection()
+        where, params = self._expired_where(table, self._cutoff(days))
+
+        if dry_run:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}", params).fetchone()[0]
+            return {'expired': count}
+
+        deleted = 0
+        while True:
+            cursor = conn.execute(f"""
+                SELECT * FROM {table} WHERE {where}
+                ORDER BY created_at LIMIT ?
+            """, (*params, self.batch_size))
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            records = [dict(zip(columns, row)) for row in rows]
+            self._archive(table, records)
+
+            ids = [record['id'] for record in records]
+            with self.db.transaction():
+                if table == 'api_calls':
+                    self._detach_calls(ids)
+                conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in ids])
+            deleted += len(rows)
+
+        return {'expired': deleted, 'archived': deleted, 'deleted': deleted}
+
+    def _detach_calls(self, api_call_ids: List[int], chunk_size: int = 500):
+        """Clear references to api_calls about to be deleted (inside the deleting transaction)"""
+        conn = self.db.get_connection()
+        for table in self._referencing_tables():
+            for start in range(0, len(api_call_ids), chunk_size):
+                chunk = api_call_ids[start:start + chunk_size]
+                conn.execute(f"UPDATE {table} SET api_call_id = NULL WHERE api_call_id IN ({','.join('?' * len(chunk))})",
+                             chunk)
+
+    def _purge(self, table: str, cutoff, dry_run: bool) -> Dict:
+        """Delete rows older than cutoff without archiving (caches and logs that can be rebuilt)"""
+        conn = self.db.get_connection()
+
+        if dry_run:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE created_at < ?", (cutoff,)).fetchone()[0]
+            return {'expired': count}
+
+        with self.db.transaction():
+            deleted = conn.execute(f"DELETE FROM {table} WHERE created_at < ?", (cutoff,)).rowcount
+        return {'expired': deleted, 'deleted': deleted}
+
+    # ------------------------------------------------------------------
+    # Vacuum
+    # ------------------------------------------------------------------
+
+    def _vacuum(self) -> Dict:
+        """Return free pages to the filesystem and refresh planner statistics"""
+        conn = self.db.get_connection()
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            print("Warning: Database is not in incremental auto_vacuum mode; "
+                  "run enable_incremental_vacuum() once to reclaim space")
+            released = 0
+        else:
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            released = free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # In WAL mode the file only shrinks once the pages are checkpointed
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+        conn.execute("PRAGMA optimize")
+        return {'free_pages_before': free_pages, 'pages_released': released}
+
+    def run(self, dry_run: bool = False) -> Dict:
+        """
+        Apply every policy
+
+        Args:
+            dry_run: Only count expired rows; nothing is archived or deleted
+
+        Returns:
+            Report of expired/archived/deleted counts per table, archive files
+            written and pages released by the vacuum
+        """
+        self._run_stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime())
+        self._parts = 0
+        self._files = set()
+        started = time.perf_counter()
+        report = {'dry_run': dry_run, 'tables': {}}
+
+        raw_days = self.retention_days.get('raw_responses', 0)
+        api_calls_days = self.retention_days.get('api_calls', 0)
+        if api_calls_days:
+            # Payloads of deleted calls would otherwise become unreachable without being archived
+            raw_days = min(raw_days or api_calls_days, api_calls_days)
+        if raw_days:
+            report['tables']['raw_responses'] = self._expire_raw_payloads(raw_days, dry_run)
+
+        for table in ROW_TABLES:
+            days = self.retention_days.get(table, 0)
+            if days:
+                report['tables'][table] = self._expire_rows(table, days, dry_run)
+
+        cache_days = self.retention_days.get('response_cache', 0)
+        if cache_days:
+            # response_cache.created_at is a Unix timestamp
+            report['tables']['response_cache'] = self._purge('response_cache', time.time() - cache_days * 86400, dry_run)
+
+        log_days = self.retention_days.get('mirror_changes', 0)
+        if log_days:
+            # mirror_changes is stamped by triggers with CURRENT_TIMESTAMP (UTC)
+            report['tables']['mirror_changes'] = self._purge('mirror_changes', self._cutoff(log_days, utc=True), dry_run)
+
+        if not dry_run:
+            report['archive_files'] = sorted(self._files)
+            report['vacuum'] = self._vacuum()
+
+        report['duration_seconds'] = round(time.perf_counter() - started, 2)
+        return report
+
+def enable_incremental_vacuum(db):
+    """
+    Switch an existing database to incremental auto_vacuum
+
+    Databases created before the retention job have auto_vacuum off, and the
+    mode only changes with a full VACUUM, which rewrites the file and holds
+    an exclusive lock. Run once during a quiet period.
+    """
+    conn = db.get_connection()
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+
+def run_retention(db, dry_run: bool = False, **options) -> Dict:
+    """Run the retention job once with default policies (see RetentionJob for options)"""
+    return RetentionJob(db, **options).run(dry_run=dry_run)
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from db_manager import get_db
+
+    print(json.dumps(run_retention(get_db(), dry_run='--dry-run' in sys.argv), indent=2))
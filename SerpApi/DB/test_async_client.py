@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Async client checks: session reuse across event loops and error dicts
+No API calls; skipped when aiohttp is not installed. Run with pytest or directly.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import serpapi_async
+except ImportError:
+    # aiohttp is optional
+    serpapi_async = None
+
+from rate_limiter import BudgetExceeded
+from resilience import CircuitOpenError
+
+def test_new_loop_closes_previous_session():
+    if serpapi_async is None:
+        return
+
+    client = serpapi_async.AsyncSerpApiClient()
+
+    async def open_session():
+        return await client._ensure_session()
+
+    first = asyncio.run(open_session())
+    second = asyncio.run(open_session())
+    assert first is not second
+    assert first.closed and not second.closed
+    asyncio.run(client.close())
+
+def test_keyword_volume_history_refusals_become_error_dicts():
+    if serpapi_async is None:
+        return
+
+    class RefusingClient:
+        def __init__(self, error):
+            self.error = error
+
+        async def get(self, params):
+            raise self.error
+
+    original = serpapi_async._async_client
+    try:
+        for error in (BudgetExceeded("Daily SerpApi credit budget exhausted (5/5)"),
+                      CircuitOpenError("Circuit open for engine 'google_trends'")):
+            serpapi_async._async_client = RefusingClient(error)
+            result = asyncio.run(serpapi_async.get_keyword_volume_history_async('movers', 'US'))
+            assert result == {'keyword': 'movers', 'location': 'US', 'status': 'error', 'error': str(error)}
+    finally:
+        serpapi_async._async_client = original
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
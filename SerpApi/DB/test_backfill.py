@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Backfill checks: resuming from a checkpoint and counting delta-only calls
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DB.backfill import Backfill
+
+class Interrupted(Exception):
+    pass
+
+class InterruptedBackfill(Backfill):
+    """Stops after writing a given number of batches"""
+
+    def __init__(self, *args, stop_after: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stop_after = stop_after
+
+    def _write(self, *args):
+        if self.stop_after == 0:
+            raise Interrupted()
+        self.stop_after -= 1
+        return super()._write(*args)
+
+def store_news(db, session_id, query):
+    data = {'status': 'success', 'query': query,
+            'news': [{'position': 1, 'title': f"{query} story", 'link': f"https://news.example/{query}"}]}
+    api_call_id = db.log_api_call('News Search', query, 'Miami, FL', 'success', raw_response=data)
+    db.save_news(data, session_id, api_call_id)
+    return api_call_id
+
+def store_search(db, session_id, query, titles):
+    data = {'status': 'success', 'query': query, 'location': 'Miami, FL',
+            'organic_results': [{'position': i + 1, 'title': title, 'link': f"https://{title}.example"}
+                                for i, title in enumerate(titles)]}
+    api_call_id = db.log_api_call('Google Search', query, 'Miami, FL', 'success', raw_response=data)
+    db.save_search_results(data, session_id, api_call_id)
+    return api_call_id
+
+def news_call_ids(db):
+    rows = db.get_connection().execute("SELECT api_call_id FROM news_articles ORDER BY api_call_id").fetchall()
+    return [api_call_id for (api_call_id,) in rows]
+
+def test_resumes_below_checkpoint(db):
+    session_id = db.create_session('test', 'movers', 'Miami, FL')
+    calls = [store_news(db, session_id, f"q{i}") for i in range(4)]
+    # Rows lost since the calls were made; the backfill rebuilds them
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM news_articles")
+
+    options = dict(endpoints=['News Search'], name='resume', workers=1, batch_size=1)
+    try:
+        InterruptedBackfill(db, stop_after=2, **options).run()
+        raise AssertionError("backfill was not interrupted")
+    except Interrupted:
+        pass
+
+    # Newest first: the two newest calls were written before the interruption
+    assert news_call_ids(db) == calls[2:]
+    backfill = Backfill(db, **options)
+    assert backfill._checkpoint('News Search') == calls[2]
+
+    report = backfill.run()['endpoints']['News Search']
+    assert report['resumed_below_id'] == calls[2]
+    assert report['calls'] == 2 and report['failed'] == 0 and report['rows'] == 2
+    assert news_call_ids(db) == calls
+
+    checkpoint = db.get_connection().execute("""
+        SELECT last_api_call_id, calls_processed, rows_written, completed_at
+        FROM backfill_checkpoints WHERE name = 'resume'
+    """).fetchone()
+    assert checkpoint[:3] == (calls[0], 4, 4) and checkpoint[3] is not None
+
+    # A finished backfill has nothing left below its checkpoint
+    assert Backfill(db, **options).run(dry_run=True)['endpoints']['News Search']['pending_calls'] == 0
+
+def test_reports_skipped_delta_only_calls(db):
+    session_id = db.create_session('test', 'movers', 'Miami, FL')
+    first = store_search(db, session_id, 'movers', ['a', 'b'])
+    store_search(db, session_id, 'movers', ['a', 'b'])  # unchanged: delta only, no rows
+
+    dry = Backfill(db, ['Google Search'], workers=1).run(dry_run=True)['endpoints']['Google Search']
+    assert dry['pending_calls'] == 1 and dry['skipped_delta_only'] == 1
+
+    report = Backfill(db, ['Google Search'], workers=1).run()['endpoints']['Google Search']
+    assert report['calls'] == 1 and report['skipped_delta_only'] == 1
+    rows = db.get_connection().execute("SELECT DISTINCT api_call_id FROM search_results").fetchall()
+    assert rows == [(first,)]
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
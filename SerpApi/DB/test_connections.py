@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Connection lifecycle checks: per-thread connections are closed with their thread
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import gc
+import sqlite3
+import sys
+import threading
+
+def test_finished_threads_release_their_connections(db):
+    opened = []
+
+    def request():
+        conn = db.get_connection()
+        conn.execute("SELECT COUNT(*) FROM api_calls").fetchone()
+        opened.append(conn)
+
+    for _ in range(5):
+        thread = threading.Thread(target=request)
+        thread.start()
+        thread.join(5)
+    gc.collect()
+
+    # Only the main thread's connection (from init_database) is left
+    assert db._connections == {db.get_connection()}
+    for conn in opened:
+        try:
+            conn.execute("SELECT 1")
+            raise AssertionError("connection of a finished thread is still open")
+        except sqlite3.ProgrammingError:
+            pass
+
+def test_close_reaches_other_threads_connections(db):
+    opened, closed, outcome = threading.Event(), threading.Event(), []
+
+    def worker():
+        conn = db.get_connection()
+        opened.set()
+        closed.wait(5)
+        try:
+            conn.execute("SELECT 1")
+            outcome.append('open')
+        except sqlite3.ProgrammingError:
+            outcome.append('closed')
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    opened.wait(5)
+    db.close()
+    closed.set()
+    thread.join(5)
+    assert outcome == ['closed'] and not db._connections
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+DuckDB mirror checks: incremental syncs and tables rebuilt after a migration
+Runs against a throwaway database; skipped when duckdb is not installed.
+Run with pytest or directly.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DB.duckdb_mirror import DuckDBMirror, duckdb
+
+def save_businesses(db, titles):
+    data = {'status': 'success', 'query': 'movers', 'location': 'Miami, FL',
+            'businesses': [{'title': title, 'position': i + 1} for i, title in enumerate(titles)]}
+    db.save_local_businesses(data, None, None)
+
+def test_added_column_rebuilds_the_mirror_table(db, tmp_path):
+    if duckdb is None:
+        return
+
+    mirror = DuckDBMirror(db.db_path, str(tmp_path / 'mirror.duckdb'), tables=['local_businesses'])
+    save_businesses(db, ['a', 'b'])
+    mirror.sync()
+    save_businesses(db, ['c'])
+    assert mirror.sync()['rows_copied'] == 1
+    assert mirror.stats()['rebuilds'] == 0
+
+    # A later migration adds a column with a default for existing rows
+    db.get_connection().execute("ALTER TABLE local_businesses ADD COLUMN verified INTEGER DEFAULT 1")
+    db.get_connection().commit()
+    save_businesses(db, ['d'])
+    assert mirror.sync()['rows_copied'] == 4
+    assert mirror.stats()['rebuilds'] == 1
+
+    rows = mirror.cursor().execute(
+        'SELECT business_name, verified FROM local_businesses ORDER BY id').fetchall()
+    assert rows == [('a', 1), ('b', 1), ('c', 1), ('d', 1)]
+    assert mirror.sync()['rows_copied'] == 0
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
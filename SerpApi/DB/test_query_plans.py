@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Query plan regression checks for the hot api_calls lookups
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import sys
+
+FRESHNESS_SQL = """
+    SELECT created_at
+    FROM api_calls
+    WHERE api_endpoint = ? AND query = ? AND location = ? AND status = 'success'
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+FRESHNESS_BATCH_SQL = """
+    SELECT api_endpoint, MAX(created_at)
+    FROM api_calls
+    WHERE query = ? AND location = ? AND status = 'success'
+      AND api_endpoint IN (?, ?, ?)
+    GROUP BY api_endpoint
+"""
+
+CREDIT_USAGE_SQL = """
+    SELECT COALESCE(SUM(api_credits_used), 0)
+    FROM api_calls
+    WHERE status = 'success' AND created_at >= ?
+"""
+
+RECENT_SEARCHES_SQL = """
+    SELECT api_endpoint, query, location, status, created_at
+    FROM api_calls
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+def query_plan(db, sql, params):
+    rows = db.get_connection().execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return ' | '.join(row[-1] for row in rows)
+
+def test_freshness_uses_covering_index(db):
+    plan = query_plan(db, FRESHNESS_SQL, ('Google Search', 'q', 'Miami, FL'))
+    assert 'USING COVERING INDEX idx_api_calls_freshness' in plan, plan
+    assert 'TEMP B-TREE' not in plan, plan
+
+def test_freshness_batch_uses_covering_index(db):
+    plan = query_plan(db, FRESHNESS_BATCH_SQL, ('q', 'Miami, FL', 'a', 'b', 'c'))
+    assert 'USING COVERING INDEX idx_api_calls_freshness' in plan, plan
+
+def test_credit_usage_uses_covering_index(db):
+    plan = query_plan(db, CREDIT_USAGE_SQL, ('2024-01-01',))
+    assert 'USING COVERING INDEX idx_api_calls_status_created' in plan, plan
+
+def test_recent_searches_avoid_sort(db):
+    plan = query_plan(db, RECENT_SEARCHES_SQL, (10,))
+    assert 'idx_api_calls_created' in plan, plan
+    assert 'TEMP B-TREE' not in plan, plan
+
+def test_cache_lookup_uses_primary_key(db):
+    plan = query_plan(db, "SELECT response, created_at FROM response_cache WHERE cache_key = ?", ('k',))
+    assert 'sqlite_autoindex_response_cache_1' in plan, plan
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Credit budget checks: usage shared between processes through the usage loader
+No API calls. Run with pytest or directly.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limiter import BudgetExceeded, CreditBudget
+
+def refused(budget):
+    try:
+        budget.charge()
+    except BudgetExceeded:
+        return True
+    return False
+
+def test_own_spending_counts_on_top_of_logged_usage():
+    # Another process has logged 5 credits; this one has not synced since spending 1
+    budget = CreditBudget(daily_limit=7, monthly_limit=0, usage_loader=lambda since: 5,
+                          sync_seconds=3600)
+    budget.charge()
+    assert budget.remaining() == 1
+    budget.charge()
+    assert refused(budget)
+
+def test_sync_folds_own_spending_into_logged_usage():
+    logged = [0]
+    budget = CreditBudget(daily_limit=10, monthly_limit=0, usage_loader=lambda since: logged[0],
+                          sync_seconds=3600)
+    budget.charge()
+    budget.charge()
+    # Both calls are now in the log next to 4 from another process
+    logged[0] = 6
+    budget._synced_at = 0.0
+    assert budget.remaining() == 4
+
+def test_without_loader_counts_own_spending():
+    budget = CreditBudget(daily_limit=2, monthly_limit=0)
+    budget.charge()
+    budget.charge()
+    assert refused(budget) and budget.remaining() == 0
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
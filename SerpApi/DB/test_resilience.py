@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker state machine checks, including the clients' handling of
+errors that used to leave a half-open probe in flight
+No API calls. Run with pytest or directly.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import resilience
+from rate_limiter import configure_rate_limiter
+from resilience import CircuitBreaker, CircuitOpenError
+from serpapi_client import SerpApiClient
+
+RESET_TIMEOUT = 0.05
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure(RuntimeError('boom'))
+
+def half_open_breaker(engine):
+    """Shared breaker for engine, opened and past its reset timeout"""
+    breaker = resilience._breakers[engine] = CircuitBreaker(engine, failure_threshold=1,
+                                                            reset_timeout=RESET_TIMEOUT)
+    open_breaker(breaker)
+    time.sleep(RESET_TIMEOUT * 2)
+    return breaker
+
+def assert_refused(breaker):
+    try:
+        breaker.before_call()
+    except CircuitOpenError:
+        return
+    raise AssertionError(f"breaker admitted a call in state {breaker.state()}")
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, error=None):
+        self.status_code = status_code
+        self.headers = {}
+        self._body = body
+        self._error = error
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+    def json(self):
+        if self._error:
+            raise self._error
+        return self._body
+
+def make_client(outcome):
+    """Client without retries whose every request returns or raises outcome"""
+    configure_rate_limiter(default_rate=1000, burst=1000)
+    client = SerpApiClient(max_retries=0)
+
+    def fake_get(url, params=None, timeout=None):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    client.session.get = fake_get
+    return client
+
+def probe(client, engine):
+    try:
+        return client.get({'engine': engine})
+    except Exception:
+        return None
+
+def test_opens_after_threshold():
+    breaker = CircuitBreaker('t', failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure(RuntimeError('boom'))
+    assert breaker.state()['state'] == CircuitBreaker.CLOSED
+    breaker.before_call()
+    breaker.record_failure(RuntimeError('boom'))
+    assert breaker.state()['state'] == CircuitBreaker.OPEN
+    assert breaker.state()['last_error'] == 'boom'
+    assert_refused(breaker)
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker('t', failure_threshold=2, reset_timeout=60)
+    breaker.before_call()
+    breaker.record_failure(RuntimeError('boom'))
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    breaker.record_failure(RuntimeError('boom'))
+    assert breaker.state()['state'] == CircuitBreaker.CLOSED
+
+def test_half_open_admits_one_probe():
+    breaker = CircuitBreaker('t', failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    open_breaker(breaker)
+    assert_refused(breaker)
+    time.sleep(RESET_TIMEOUT * 2)
+    breaker.before_call()
+    assert breaker.state()['state'] == CircuitBreaker.HALF_OPEN
+    assert_refused(breaker)
+
+def test_probe_success_closes():
+    breaker = CircuitBreaker('t', failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    open_breaker(breaker)
+    time.sleep(RESET_TIMEOUT * 2)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state() == {'state': CircuitBreaker.CLOSED, 'consecutive_failures': 0, 'last_error': 'boom'}
+    breaker.before_call()
+    breaker.before_call()
+
+def test_probe_failure_reopens():
+    breaker = CircuitBreaker('t', failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    open_breaker(breaker)
+    time.sleep(RESET_TIMEOUT * 2)
+    breaker.before_call()
+    breaker.record_failure(RuntimeError('still down'))
+    assert breaker.state()['state'] == CircuitBreaker.OPEN
+    assert_refused(breaker)
+
+def test_released_probe_lets_next_probe_through():
+    breaker = CircuitBreaker('t', failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    open_breaker(breaker)
+    time.sleep(RESET_TIMEOUT * 2)
+    breaker.before_call()
+    breaker.release()
+    assert breaker.state()['state'] == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+
+def test_undecodable_probe_reopens_instead_of_wedging():
+    breaker = half_open_breaker('test-json')
+    client = make_client(FakeResponse(error=ValueError('Expecting value')))
+    assert probe(client, 'test-json') is None
+    assert breaker.state()['state'] == CircuitBreaker.OPEN
+    time.sleep(RESET_TIMEOUT * 2)
+    breaker.before_call()
+
+def test_chunked_encoding_probe_reopens():
+    breaker = half_open_breaker('test-chunked')
+    client = make_client(requests.exceptions.ChunkedEncodingError('connection broken'))
+    assert probe(client, 'test-chunked') is None
+    assert breaker.state()['state'] == CircuitBreaker.OPEN
+
+def test_client_error_probe_is_released():
+    breaker = half_open_breaker('test-400')
+    client = make_client(FakeResponse(status_code=400))
+    assert probe(client, 'test-400') is None
+    assert breaker.state()['state'] == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+
+def test_interrupted_probe_is_released():
+    breaker = half_open_breaker('test-interrupt')
+    client = make_client(KeyboardInterrupt())
+    try:
+        client.get({'engine': 'test-interrupt'})
+    except KeyboardInterrupt:
+        pass
+    assert breaker.state()['state'] == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+
+def test_probe_success_recorded_after_decoding():
+    breaker = half_open_breaker('test-ok')
+    client = make_client(FakeResponse(body={'search_metadata': {'status': 'Success'}}))
+    assert probe(client, 'test-ok') == {'search_metadata': {'status': 'Success'}}
+    assert breaker.state()['state'] == CircuitBreaker.CLOSED
+
+def test_cancelled_async_probe_is_released():
+    try:
+        from serpapi_async import AsyncSerpApiClient
+    except ImportError:
+        # aiohttp is optional
+        return
+
+    breaker = half_open_breaker('test-cancel')
+    client = AsyncSerpApiClient(max_retries=0)
+
+    async def cancelled(engine, params):
+        raise asyncio.CancelledError()
+
+    client._send = cancelled
+
+    async def run():
+        try:
+            await client.get({'engine': 'test-cancel'})
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert breaker.state()['state'] == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Response cache checks: LRU and byte-size eviction, TTL and the SQLite tier
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from response_cache import ResponseCache, make_cache_key
+
+def payload(size):
+    return {'status': 'success', 'blob': 'x' * size}
+
+def payload_bytes(data):
+    return len(json.dumps(data, default=str))
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set('a', payload(1), 'Google Search')
+    cache.set('b', payload(1), 'Google Search')
+    assert cache.get('a') is not None  # 'a' becomes most recently used
+    cache.set('c', payload(1), 'Google Search')
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2 and stats['evictions'] == 1
+
+def test_byte_limit_evicts_and_skips_oversized():
+    size = payload_bytes(payload(100))
+    cache = ResponseCache(max_bytes=size * 2)
+    for key in 'abc':
+        cache.set(key, payload(100), 'Google Search')
+
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2 and stats['memory_bytes'] == size * 2
+    assert cache.get('a') is None
+
+    # An entry larger than the whole tier is not kept and evicts nothing
+    cache.set('huge', payload(size * 3), 'Google Search')
+    assert cache.get('huge') is None
+    assert cache.stats()['memory_entries'] == 2
+
+def test_replacing_a_key_keeps_byte_count_exact():
+    cache = ResponseCache()
+    cache.set('a', payload(100), 'Google Search')
+    cache.set('a', payload(10), 'Google Search')
+    assert cache.stats()['memory_bytes'] == payload_bytes(payload(10))
+
+def test_expired_entries_are_not_returned():
+    cache = ResponseCache(ttl_seconds=0.05)
+    cache.set('a', payload(1), 'Google Search')
+    assert cache.get('a') is not None
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    assert cache.stats()['memory_entries'] == 0
+
+def test_max_age_narrows_hits():
+    cache = ResponseCache()
+    cache.set('a', payload(1), 'Google Search')
+    time.sleep(0.05)
+    assert cache.get('a', max_age_seconds=0.01) is None
+    assert cache.get('a', max_age_seconds=60) is not None
+
+def test_db_tier_serves_and_promotes_memory_misses(db):
+    cache = ResponseCache(db)
+    cache.set('a', payload(1), 'Google Search', 'movers', 'Miami, FL')
+    cache.clear_memory()
+
+    entry = cache.get('a')
+    assert entry is not None and entry.data == payload(1)
+    assert cache.stats()['db_hits'] == 1 and cache.stats()['memory_entries'] == 1
+    assert cache.get('a') is not None
+    assert cache.stats()['memory_hits'] == 1
+
+    # A second process sees entries written by the first
+    assert ResponseCache(db).get('a').data == payload(1)
+
+def test_db_tier_respects_ttl_and_get_latest_does_not(db):
+    db.save_cached_response('old', 'Google Search', 'movers', 'Miami, FL', payload(1), time.time() - 3600)
+    cache = ResponseCache(db, ttl_seconds=60)
+
+    assert cache.get('old') is None
+    assert cache.stats()['memory_entries'] == 0
+    latest = cache.get_latest('old')
+    assert latest is not None and latest.age_seconds >= 3600
+
+def test_cache_key_covers_function_and_arguments():
+    def google_search(query, location=None):
+        pass
+
+    def news_search(query, location=None):
+        pass
+
+    key = make_cache_key('Search', google_search, ('movers',), {'location': 'Miami, FL'})
+    assert key == make_cache_key('Search', google_search, ('movers',), {'location': 'Miami, FL'})
+    assert key != make_cache_key('Search', news_search, ('movers',), {'location': 'Miami, FL'})
+    assert key != make_cache_key('Search', google_search, ('movers',), {'location': 'Tampa, FL'})
+    assert key != make_cache_key('Other', google_search, ('movers',), {'location': 'Miami, FL'})
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Retention job checks: dry run against the real run, archives, references to
+deleted calls, current SERP copies and the local-time cutoff
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from retention import RetentionJob
+
+POLICY = {'raw_responses': 30, 'search_results': 180, 'api_calls': 400}
+
+def make_job(db, tmp_path):
+    archive_dir = tmp_path / 'archive'
+    archive_dir.mkdir(exist_ok=True)
+    return RetentionJob(db, retention_days=POLICY, archive_dir=str(archive_dir))
+
+def search_response(query, titles):
+    return {
+        'status': 'success', 'query': query, 'location': 'Miami, FL',
+        'organic_results': [{'position': i + 1, 'title': title, 'link': f"https://{title}.example"}
+                            for i, title in enumerate(titles)]
+    }
+
+def store_search(db, session_id, query, titles, age_days=0):
+    """Log and save one search, dated age_days back in local time"""
+    data = search_response(query, titles)
+    api_call_id = db.log_api_call('Google Search', query, 'Miami, FL', 'success', raw_response=data)
+    db.save_search_results(data, session_id, api_call_id)
+    if age_days:
+        created_at = datetime.now() - timedelta(days=age_days)
+        with db.transaction() as conn:
+            conn.execute("UPDATE api_calls SET created_at = ? WHERE id = ?", (created_at, api_call_id))
+            conn.execute("UPDATE search_results SET created_at = ? WHERE api_call_id = ?", (created_at, api_call_id))
+    return api_call_id
+
+def count(db, table, where='1', params=()):
+    return db.get_connection().execute(f"SELECT COUNT(*) FROM {table} WHERE {where}", params).fetchone()[0]
+
+def read_archive(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def populate(db):
+    """Two expired SERPs that have changed since, and one recent SERP"""
+    session_id = db.create_session('test', 'movers', 'Miami, FL')
+    old = [store_search(db, session_id, f"old {i}", ['a', 'b'], age_days=500) for i in range(2)]
+    kept = [store_search(db, session_id, f"old {i}", ['b'], age_days=10) for i in range(2)]
+    kept.append(store_search(db, session_id, 'recent', ['c']))
+    return old, kept
+
+def test_dry_run_counts_without_changing_anything(db, tmp_path):
+    old, _ = populate(db)
+    job = make_job(db, tmp_path)
+    report = job.run(dry_run=True)
+
+    assert report['tables']['raw_responses'] == {'expired': 2}
+    assert report['tables']['search_results'] == {'expired': 4}
+    assert report['tables']['api_calls'] == {'expired': 2}
+    assert 'archive_files' not in report
+    assert count(db, 'api_calls') == 5
+    assert count(db, 'search_results') == 7
+    assert count(db, 'api_calls', 'raw_response_hash IS NOT NULL') == 5
+    assert not os.listdir(job.archive_dir)
+
+def test_real_run_matches_dry_run_and_archives(db, tmp_path):
+    old, kept = populate(db)
+    dry = make_job(db, tmp_path).run(dry_run=True)
+    job = make_job(db, tmp_path)
+    report = job.run()
+
+    for table in ('raw_responses', 'search_results', 'api_calls'):
+        assert report['tables'][table]['expired'] == dry['tables'][table]['expired'], table
+    assert [row[0] for row in db.get_connection().execute("SELECT id FROM api_calls ORDER BY id")] == kept
+    assert count(db, 'search_results') == 3
+    assert count(db, 'raw_responses') == 3
+
+    archived = {}
+    for path in report['archive_files']:
+        assert path.startswith(job.archive_dir) and os.path.exists(path)
+        table = os.path.relpath(path, job.archive_dir).split(os.sep)[0]
+        archived.setdefault(table, []).extend(read_archive(path))
+
+    assert sorted(row['api_call_id'] for row in archived['raw_responses']) == old
+    assert archived['raw_responses'][0]['raw_response']['status'] == 'success'
+    assert sorted(row['id'] for row in archived['api_calls']) == old
+    assert sorted({row['api_call_id'] for row in archived['search_results']}) == old
+    assert len(archived['search_results']) == 4
+
+def test_deleted_calls_leave_no_dangling_references(db, tmp_path):
+    old, kept = populate(db)
+    changes_before = count(db, 'serp_changes')
+    make_job(db, tmp_path).run()
+
+    # The change log is kept; only its links to the deleted calls are cleared
+    assert count(db, 'serp_changes') == changes_before
+    placeholders = ','.join('?' * len(old))
+    assert count(db, 'serp_changes', f"api_call_id IN ({placeholders})", old) == 0
+    assert count(db, 'serp_changes', 'api_call_id = ?', (kept[-1],)) > 0
+    assert count(db, 'serp_changes', 'api_call_id IS NOT NULL AND api_call_id NOT IN (SELECT id FROM api_calls)') == 0
+
+def test_current_serp_copy_is_kept_at_any_age(db, tmp_path):
+    session_id = db.create_session('test', 'movers', 'Miami, FL')
+    # Re-checked since, but unchanged: the 500-day-old rows are still the current SERP
+    store_search(db, session_id, 'unchanged', ['a', 'b'], age_days=500)
+    store_search(db, session_id, 'unchanged', ['a', 'b'])
+    assert count(db, 'search_results') == 2
+
+    assert make_job(db, tmp_path).run(dry_run=True)['tables']['search_results'] == {'expired': 0}
+    make_job(db, tmp_path).run()
+    assert count(db, 'search_results') == 2
+    assert [(item['title'], item['position'])
+            for item in db.get_serp_state('search_results', 'unchanged', 'Miami, FL')] == [('a', 1), ('b', 2)]
+
+def test_cutoff_uses_local_time(db, tmp_path):
+    if not hasattr(time, 'tzset'):
+        return
+
+    original_tz = os.environ.get('TZ')
+    # Ten hours ahead of UTC: a UTC cutoff would keep rows expired by up to ten hours
+    os.environ['TZ'] = 'Etc/GMT-10'
+    time.tzset()
+    try:
+        session_id = db.create_session('test', 'movers', 'Miami, FL')
+        store_search(db, session_id, 'just expired', ['a'], age_days=180 + 1 / 24)
+        store_search(db, session_id, 'not yet', ['b'], age_days=180 - 1 / 24)
+        # Newer copies, so neither is the current SERP
+        store_search(db, session_id, 'just expired', ['c'])
+        store_search(db, session_id, 'not yet', ['c'])
+
+        report = make_job(db, tmp_path).run(dry_run=True)
+        assert report['tables']['search_results'] == {'expired': 1}
+    finally:
+        if original_tz is None:
+            os.environ.pop('TZ', None)
+        else:
+            os.environ['TZ'] = original_tz
+        time.tzset()
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+SERP delta storage checks: unchanged re-saves, logged changes and replay
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import sys
+from datetime import datetime
+
+def search_response(results):
+    """results: (title, position) pairs"""
+    return {
+        'status': 'success', 'query': 'movers', 'location': 'Miami, FL',
+        'organic_results': [{'position': position, 'title': title, 'link': f"https://{title}.example"}
+                            for title, position in results]
+    }
+
+def save(db, session_id, results):
+    data = search_response(results)
+    api_call_id = db.log_api_call('Google Search', 'movers', 'Miami, FL', 'success', raw_response=data)
+    db.save_search_results(data, session_id, api_call_id)
+    return api_call_id
+
+def count(db, table):
+    return db.get_connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+def changes(db):
+    return db.get_serp_changes('search_results', 'movers', 'Miami, FL')
+
+def state(db, at=None):
+    return [(item['title'], item['position'])
+            for item in db.get_serp_state('search_results', 'movers', 'Miami, FL', at)]
+
+def make_session(db):
+    return db.create_session('test', 'movers', 'Miami, FL')
+
+def test_first_save_stores_rows_and_additions(db):
+    save(db, make_session(db), [('a', 1), ('b', 2)])
+    assert count(db, 'search_results') == 2
+    assert sorted(change['change_type'] for change in changes(db)) == ['added', 'added']
+    assert state(db) == [('a', 1), ('b', 2)]
+
+def test_identical_resave_inserts_nothing(db):
+    session_id = make_session(db)
+    save(db, session_id, [('a', 1), ('b', 2)])
+    rows, logged = count(db, 'search_results'), count(db, 'serp_changes')
+
+    save(db, session_id, [('a', 1), ('b', 2)])
+    assert count(db, 'search_results') == rows
+    assert count(db, 'serp_changes') == logged
+    observations = db.get_connection().execute("SELECT observations FROM serp_sets").fetchone()[0]
+    assert observations == 2
+
+def test_changed_resave_logs_changes(db):
+    session_id = make_session(db)
+    save(db, session_id, [('a', 1), ('b', 2), ('c', 3)])
+    second = save(db, session_id, [('b', 1), ('a', 2), ('d', 3)])
+
+    latest = {change['item_key']: change for change in changes(db) if change['api_call_id'] == second}
+    assert latest['https://b.example']['change_type'] == 'changed'
+    assert latest['https://b.example']['previous_position'] == 2
+    assert latest['https://a.example']['change_type'] == 'changed'
+    assert latest['https://c.example']['change_type'] == 'removed'
+    assert latest['https://d.example']['change_type'] == 'added'
+    # A changed SERP is stored in full again
+    assert count(db, 'search_results') == 6
+    assert state(db) == [('b', 1), ('a', 2), ('d', 3)]
+
+def test_state_replays_past_observations(db):
+    session_id = make_session(db)
+    save(db, session_id, [('a', 1), ('b', 2), ('c', 3)])
+    after_first = str(datetime.now())
+    save(db, session_id, [('b', 1), ('a', 2)])
+    after_second = str(datetime.now())
+    save(db, session_id, [('b', 1), ('a', 2)])
+
+    assert state(db, after_first) == [('a', 1), ('b', 2), ('c', 3)]
+    assert state(db, after_second) == [('b', 1), ('a', 2)]
+    assert state(db, after_second) == state(db)
+    assert state(db, '2000-01-01 00:00:00') == []
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+SERP snapshot cache checks: one fetch per page, bounded size, no stray locks
+No API calls. Run with pytest or directly.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serp_snapshot
+from serp_snapshot import SerpSnapshotCache
+
+def fake_fetches(delay=0.0):
+    """Replace the upstream fetch; returns the list of fetched queries"""
+    fetched = []
+
+    def fake_get(params):
+        fetched.append(params.get('q'))
+        time.sleep(delay)
+        return {'search_metadata': {'status': 'Success'}, 'q': params.get('q')}
+
+    serp_snapshot.serpapi_get = fake_get
+    return fetched
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+def test_concurrent_callers_fetch_once():
+    fetched = fake_fetches(delay=0.1)
+    cache = SerpSnapshotCache(ttl_seconds=60)
+    # Other keys are stored while callers wait on the shared key
+    run_threads([lambda: cache.get('movers')] * 10 +
+                [lambda i=i: cache.get(f"other {i}") for i in range(5)])
+    assert fetched.count('movers') == 1, fetched
+    assert cache._key_locks == {}
+
+def test_size_is_bounded_and_expired_pages_dropped():
+    fake_fetches()
+    cache = SerpSnapshotCache(ttl_seconds=0.05, max_entries=3)
+    for i in range(10):
+        cache.get(f"q{i}")
+    assert list(key[0] for key in cache._snapshots) == ['q7', 'q8', 'q9']
+
+    time.sleep(0.1)
+    cache.get('fresh')
+    assert list(key[0] for key in cache._snapshots) == ['fresh']
+    assert cache._key_locks == {}
+
+def test_failed_fetch_leaves_no_lock():
+    def failing_get(params):
+        raise RuntimeError('upstream down')
+
+    serp_snapshot.serpapi_get = failing_get
+    cache = SerpSnapshotCache(ttl_seconds=60)
+    try:
+        cache.get('movers')
+        raise AssertionError("fetch error was swallowed")
+    except RuntimeError:
+        pass
+    assert cache._key_locks == {} and not cache._snapshots
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
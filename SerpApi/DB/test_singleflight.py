@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Request coalescing checks: concurrent identical calls share one execution
+No API calls. Run with pytest or directly.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from singleflight import SingleFlight
+
+def run_concurrently(flight, key, fn, callers):
+    """Start callers threads on flight.do(key, fn) while fn is running; returns their outcomes"""
+    outcomes = []
+    lock = threading.Lock()
+
+    def call():
+        try:
+            outcome = flight.do(key, fn)
+        except Exception as e:
+            outcome = e
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+def slow(result, calls, release):
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return fn
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+def test_concurrent_callers_share_one_call():
+    flight, calls, release = SingleFlight(), [], threading.Event()
+    fn = slow({'status': 'success'}, calls, release)
+    threading.Timer(0.2, release.set).start()
+    outcomes = run_concurrently(flight, 'k', fn, 8)
+
+    assert len(calls) == 1
+    assert all(result == {'status': 'success'} for result, _ in outcomes)
+    assert sorted(shared for _, shared in outcomes) == [False] + [True] * 7
+    assert flight.in_flight() == 0
+
+def test_error_reaches_every_waiter():
+    flight, calls, release = SingleFlight(), [], threading.Event()
+    error = RuntimeError('upstream down')
+    threading.Timer(0.2, release.set).start()
+    outcomes = run_concurrently(flight, 'k', slow(error, calls, release), 5)
+
+    assert len(calls) == 1
+    assert outcomes == [error] * 5
+    assert flight.in_flight() == 0
+
+def test_different_keys_run_separately():
+    flight, calls, release = SingleFlight(), [], threading.Event()
+    threads = [threading.Thread(target=flight.do, args=(key, slow(key, calls, release))) for key in 'abc']
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: flight.in_flight() == 3)
+    assert flight.in_flight() == 3
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 3
+
+def test_nothing_cached_after_completion():
+    flight, counter = SingleFlight(), []
+    assert flight.do('k', lambda: counter.append(1) or len(counter)) == (1, False)
+    assert flight.do('k', lambda: counter.append(1) or len(counter)) == (2, False)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Write-behind queue checks: batching, per-job savepoints, futures and the
+synchronous fallback after close
+Runs against a throwaway database; no API calls. Run with pytest or directly.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from write_queue import WriteBehindQueue
+from response_cache import ResponseCache
+
+def log_job(db, query):
+    return lambda: db.log_api_call('Google Search', query, 'Miami, FL', 'success')
+
+def logged_queries(db):
+    rows = db.get_connection().execute("SELECT query FROM api_calls ORDER BY id").fetchall()
+    return [query for (query,) in rows]
+
+def test_waiting_jobs_share_a_batch(db):
+    write_queue = WriteBehindQueue(db, batch_size=10)
+    started, release = threading.Event(), threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+
+    write_queue.submit(blocker)
+    started.wait(5)
+    futures = [write_queue.submit(log_job(db, f"q{i}")) for i in range(5)]
+    release.set()
+    write_queue.flush()
+
+    assert [future.result() for future in futures] == [1, 2, 3, 4, 5]
+    stats = write_queue.stats()
+    assert stats['batches'] == 2, stats
+    assert stats['completed'] == 6 and stats['failed'] == 0, stats
+    write_queue.close()
+
+def test_failed_job_rolls_back_only_itself(db):
+    write_queue = WriteBehindQueue(db, batch_size=10)
+    started, release = threading.Event(), threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+
+    def half_written():
+        db.log_api_call('Google Search', 'broken', 'Miami, FL', 'success')
+        raise RuntimeError('save failed')
+
+    write_queue.submit(blocker)
+    started.wait(5)
+    first = write_queue.submit(log_job(db, 'before'))
+    broken = write_queue.submit(half_written)
+    last = write_queue.submit(log_job(db, 'after'))
+    release.set()
+    write_queue.flush()
+
+    assert isinstance(broken.exception(), RuntimeError)
+    assert first.result() and last.result()
+    assert logged_queries(db) == ['before', 'after']
+    assert write_queue.stats()['failed'] == 1
+    write_queue.close()
+
+def test_future_carries_job_result(db):
+    write_queue = WriteBehindQueue(db)
+    assert write_queue.submit(lambda: 'done').result(5) == 'done'
+    assert write_queue.submit(log_job(db, 'q')).result(5) == 1
+    write_queue.close()
+
+def test_submit_after_close_writes_synchronously(db):
+    write_queue = WriteBehindQueue(db)
+    write_queue.submit(log_job(db, 'queued'))
+    write_queue.close()
+    assert logged_queries(db) == ['queued']
+
+    future = write_queue.submit(log_job(db, 'late'))
+    assert future.done()
+    assert future.result() == 2
+    assert logged_queries(db) == ['queued', 'late']
+
+def test_cache_db_tier_written_by_queue(db):
+    write_queue = WriteBehindQueue(db)
+    cache = ResponseCache(db)
+    entry = cache.set('key', {'status': 'success'}, 'Google Search', 'q', 'Miami, FL', memory_only=True)
+    assert db.get_cached_response('key') is None
+
+    write_queue.submit(lambda: cache.save_to_db('key', entry, 'Google Search', 'q', 'Miami, FL')).result(5)
+    assert db.get_cached_response('key')['data'] == {'status': 'success'}
+    write_queue.close()
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
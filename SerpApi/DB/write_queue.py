@@ -0,0 +1,136 @@
+"""
+SerpApi Write-Behind Queue
+Moves API logging and result saving off the request path: jobs go onto a
+bounded queue and a background writer commits them in grouped transactions
+"""
+
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+# Queue defaults (override via environment)
+DEFAULT_MAX_PENDING = int(os.getenv('SERPAPI_WRITE_QUEUE_SIZE', '1000'))
+DEFAULT_BATCH_SIZE = int(os.getenv('SERPAPI_WRITE_BATCH_SIZE', '50'))
+
+_STOP = object()
+
+class WriteBehindQueue:
+    """
+    Background writer for SerpApiDB
+
+    submit() returns immediately with a Future for the job's return value (for
+    a logging job, the api_call_id). The writer thread takes whatever jobs are
+    waiting, up to batch_size, and runs them in one transaction; each job gets
+    its own savepoint, so a failing job does not discard the rest of the batch.
+    When the queue is full, submit() blocks until the writer catches up.
+    """
+
+    def __init__(self, db, max_pending: int = None, batch_size: int = None):
+        self.db = db
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self._queue = queue.Queue(maxsize=max_pending or DEFAULT_MAX_PENDING)
+        self._lock = threading.Lock()
+        self._counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'batches': 0}
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable[[], Any]) -> Future:
+        """
+        Queue a write job (a callable using self.db)
+
+        Returns:
+            Future resolved with the job's return value once it is committed
+        """
+        future = Future()
+        with self._submit_lock:
+            if not self._closed:
+                with self._lock:
+                    self._counters['submitted'] += 1
+                self._queue.put((job, future))
+                return future
+
+        # After shutdown, write synchronously rather than dropping data
+        self._execute([(job, future)])
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._execute(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _execute(self, batch):
+        """Run a batch of jobs in one transaction and resolve their futures"""
+        outcomes = []
+        try:
+            with self.db.transaction():
+                for job, future in batch:
+                    try:
+                        with self.db.transaction():
+                            outcomes.append((future, job(), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            # The commit itself failed: nothing in the batch was written
+            outcomes = [(future, None, e) for _, future in batch]
+
+        with self._lock:
+            self._counters['batches'] += 1
+            for _, _, error in outcomes:
+                self._counters['failed' if error else 'completed'] += 1
+
+        for future, result, error in outcomes:
+            if error is not None:
+                print(f"Warning: Background DB write failed: {error}")
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def flush(self):
+        """Block until every queued job has been committed"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending writes and stop the writer thread"""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats['pending'] = self._queue.qsize()
+        return stats
+
+def start_write_queue(db, **options) -> WriteBehindQueue:
+    """Start a write-behind queue that is flushed when the process exits"""
+    write_queue = WriteBehindQueue(db, **options)
+    atexit.register(write_queue.close)
+    return write_queue
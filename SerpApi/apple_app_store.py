@@ -8,8 +8,54 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_apple_apps_params(query: str, country: str = "us") -> Dict:
+    """Build SerpApi request parameters for search_apple_apps"""
+    params = {
+        "engine": "apple_app_store",
+        "term": query,
+        "country": country,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_apple_apps(data: Dict, query: str, country: str = "us") -> Dict:
+    """Convert a raw SerpApi response into the search_apple_apps result dict"""
+    # Extract app results
+    apps = []
+    for item in data.get("organic_results", []):
+        apps.append({
+            "app_name": item.get("title", ""),
+            "app_id": item.get("product_id", ""),
+            "developer": item.get("developer", ""),
+            "app_store_url": item.get("link", ""),
+            "rating": item.get("rating"),
+            "reviews_count": item.get("reviews"),
+            "price": item.get("price", "Free"),
+            "description": item.get("description", ""),
+            "category": item.get("category", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "version": item.get("version", ""),
+            "size": item.get("size", ""),
+            "age_rating": item.get("age_rating", ""),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "country": country,
+        "total_results": len(apps),
+        "apps": apps,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_apple_apps(query: str, country: str = "us") -> Dict:
     """
     Search for apps on Apple App Store (e.g., moving calculator apps, booking apps)
@@ -22,50 +68,8 @@ def search_apple_apps(query: str, country: str = "us") -> Dict:
         Dict with App Store results including ratings, reviews, prices
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "apple_app_store",
-            "term": query,
-            "country": country,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract app results
-        apps = []
-        for item in data.get("organic_results", []):
-            apps.append({
-                "app_name": item.get("title", ""),
-                "app_id": item.get("product_id", ""),
-                "developer": item.get("developer", ""),
-                "app_store_url": item.get("link", ""),
-                "rating": item.get("rating"),
-                "reviews_count": item.get("reviews"),
-                "price": item.get("price", "Free"),
-                "description": item.get("description", ""),
-                "category": item.get("category", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "version": item.get("version", ""),
-                "size": item.get("size", ""),
-                "age_rating": item.get("age_rating", ""),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "country": country,
-            "total_results": len(apps),
-            "apps": apps,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_apple_apps_params(query, country))
+        return parse_apple_apps(data, query, country)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -7,8 +7,40 @@ import os
 import requests
 from typing import Dict, List
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_autocomplete_suggestions_params(partial_keyword: str, location: str = None) -> Dict:
+    """Build SerpApi request parameters for get_autocomplete_suggestions"""
+    params = {
+        "engine": "google_autocomplete",
+        "q": partial_keyword,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    if location:
+        params["gl"] = location
+    
+    return params
+
+def parse_autocomplete_suggestions(data: Dict, partial_keyword: str, location: str = None) -> Dict:
+    """Convert a raw SerpApi response into the get_autocomplete_suggestions result dict"""
+    # Extract suggestions
+    suggestions_data = data.get("suggestions", [])
+    suggestions = [s.get("value", "") for s in suggestions_data if "value" in s]
+    
+    result = {
+        "partial_keyword": partial_keyword,
+        "location": location,
+        "suggestions": suggestions,
+        "total_suggestions": len(suggestions),
+        "status": "success",
+        "raw_data": data
+    }
+    
+    return result
+
 def get_autocomplete_suggestions(partial_keyword: str, location: str = None) -> Dict:
     """
     Get Google autocomplete suggestions as user types
@@ -21,36 +53,8 @@ def get_autocomplete_suggestions(partial_keyword: str, location: str = None) ->
         Dict with autocomplete suggestions
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_autocomplete",
-            "q": partial_keyword,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        if location:
-            params["gl"] = location
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract suggestions
-        suggestions_data = data.get("suggestions", [])
-        suggestions = [s.get("value", "") for s in suggestions_data if "value" in s]
-        
-        result = {
-            "partial_keyword": partial_keyword,
-            "location": location,
-            "suggestions": suggestions,
-            "total_suggestions": len(suggestions),
-            "status": "success",
-            "raw_data": data
-        }
-        
-        return result
+        data = serpapi_get(build_autocomplete_suggestions_params(partial_keyword, location))
+        return parse_autocomplete_suggestions(data, partial_keyword, location)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -8,9 +8,60 @@ import requests
 import os
 from typing import Dict, List, Optional
 
+from serpapi_client import serpapi_get
+
 # Get API key from environment or use hardcoded fallback
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_bing_params(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Build SerpApi request parameters for search_bing"""
+    params = {
+        "engine": "bing",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "count": num_results,
+        "location": location
+    }
+    
+    return params
+
+def parse_bing(data: Dict, query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Convert a raw SerpApi response into the search_bing result dict"""
+    # Extract organic results
+    organic_results = []
+    if "organic_results" in data:
+        for result in data["organic_results"]:
+            organic_results.append({
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+                "position": result.get("position", 0),
+                "domain": result.get("displayed_link", "").split("/")[0] if result.get("displayed_link") else ""
+            })
+    
+    # Extract ads
+    ads = []
+    if "ads" in data:
+        for ad in data["ads"]:
+            ads.append({
+                "title": ad.get("title", ""),
+                "link": ad.get("link", ""),
+                "snippet": ad.get("snippet", ""),
+                "position": ad.get("position", 0)
+            })
+    
+    return {
+        "status": "success",
+        "query": query,
+        "location": location,
+        "total_results": len(organic_results),
+        "organic_results": organic_results,
+        "ads": ads,
+        "total_ads": len(ads),
+        "search_engine": "Bing",
+        "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
+    }
+
 def search_bing(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
     """
     Search Bing for results
@@ -24,54 +75,8 @@ def search_bing(query: str, num_results: int = 10, location: str = "Miami, FL")
         Dict with search results and metadata
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "bing",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "count": num_results,
-            "location": location
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract organic results
-        organic_results = []
-        if "organic_results" in data:
-            for result in data["organic_results"]:
-                organic_results.append({
-                    "title": result.get("title", ""),
-                    "link": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                    "position": result.get("position", 0),
-                    "domain": result.get("displayed_link", "").split("/")[0] if result.get("displayed_link") else ""
-                })
-        
-        # Extract ads
-        ads = []
-        if "ads" in data:
-            for ad in data["ads"]:
-                ads.append({
-                    "title": ad.get("title", ""),
-                    "link": ad.get("link", ""),
-                    "snippet": ad.get("snippet", ""),
-                    "position": ad.get("position", 0)
-                })
-        
-        return {
-            "status": "success",
-            "query": query,
-            "location": location,
-            "total_results": len(organic_results),
-            "organic_results": organic_results,
-            "ads": ads,
-            "total_ads": len(ads),
-            "search_engine": "Bing",
-            "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
-        }
+        data = serpapi_get(build_bing_params(query, num_results, location))
+        return parse_bing(data, query, num_results, location)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -88,6 +93,31 @@ def search_bing(query: str, num_results: int = 10, location: str = "Miami, FL")
             "search_engine": "Bing"
         }
 
+def build_bing_autocomplete_params(query: str, location: str = "Miami, FL") -> Dict:
+    """Build SerpApi request parameters for get_bing_autocomplete"""
+    params = {
+        "engine": "bing_autocomplete",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "location": location
+    }
+    
+    return params
+
+def parse_bing_autocomplete(data: Dict, query: str, location: str = "Miami, FL") -> Dict:
+    """Convert a raw SerpApi response into the get_bing_autocomplete result dict"""
+    suggestions = []
+    if "suggestions" in data:
+        suggestions = [s.get("value", "") for s in data["suggestions"]]
+    
+    return {
+        "status": "success",
+        "query": query,
+        "suggestions": suggestions,
+        "total_suggestions": len(suggestions),
+        "search_engine": "Bing"
+    }
+
 def get_bing_autocomplete(query: str, location: str = "Miami, FL") -> Dict:
     """
     Get Bing autocomplete suggestions
@@ -100,30 +130,8 @@ def get_bing_autocomplete(query: str, location: str = "Miami, FL") -> Dict:
         Dict with autocomplete suggestions
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "bing_autocomplete",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "location": location
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        suggestions = []
-        if "suggestions" in data:
-            suggestions = [s.get("value", "") for s in data["suggestions"]]
-        
-        return {
-            "status": "success",
-            "query": query,
-            "suggestions": suggestions,
-            "total_suggestions": len(suggestions),
-            "search_engine": "Bing"
-        }
+        data = serpapi_get(build_bing_autocomplete_params(query, location))
+        return parse_bing_autocomplete(data, query, location)
         
     except Exception as e:
         return {
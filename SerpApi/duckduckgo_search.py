@@ -8,9 +8,69 @@ import requests
 import os
 from typing import Dict, List, Optional
 
+from serpapi_client import serpapi_get
+
 # Get API key from environment or use hardcoded fallback
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_duckduckgo_params(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Build SerpApi request parameters for search_duckduckgo"""
+    params = {
+        "engine": "duckduckgo",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "kl": "us-en",  # Language
+        "location": location
+    }
+    
+    return params
+
+def parse_duckduckgo(data: Dict, query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Convert a raw SerpApi response into the search_duckduckgo result dict"""
+    # Extract organic results
+    organic_results = []
+    if "organic_results" in data:
+        for result in data["organic_results"]:
+            organic_results.append({
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+                "position": result.get("position", 0),
+                "domain": result.get("displayed_link", "").split("/")[0] if result.get("displayed_link") else ""
+            })
+    
+    # Extract instant answers
+    instant_answers = []
+    if "answer_box" in data:
+        instant_answers.append({
+            "type": "answer_box",
+            "answer": data["answer_box"].get("answer", ""),
+            "source": data["answer_box"].get("source", "")
+        })
+    
+    # Extract related searches
+    related_searches = []
+    if "related_searches" in data:
+        for related in data["related_searches"]:
+            related_searches.append({
+                "query": related.get("query", ""),
+                "link": related.get("link", "")
+            })
+    
+    return {
+        "status": "success",
+        "query": query,
+        "location": location,
+        "total_results": len(organic_results),
+        "organic_results": organic_results,
+        "instant_answers": instant_answers,
+        "related_searches": related_searches,
+        "total_related": len(related_searches),
+        "search_engine": "DuckDuckGo",
+        "privacy_focused": True,
+        "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
+    }
+
 def search_duckduckgo(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
     """
     Search DuckDuckGo for results
@@ -24,63 +84,8 @@ def search_duckduckgo(query: str, num_results: int = 10, location: str = "Miami,
         Dict with search results and metadata
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "duckduckgo",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "kl": "us-en",  # Language
-            "location": location
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract organic results
-        organic_results = []
-        if "organic_results" in data:
-            for result in data["organic_results"]:
-                organic_results.append({
-                    "title": result.get("title", ""),
-                    "link": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                    "position": result.get("position", 0),
-                    "domain": result.get("displayed_link", "").split("/")[0] if result.get("displayed_link") else ""
-                })
-        
-        # Extract instant answers
-        instant_answers = []
-        if "answer_box" in data:
-            instant_answers.append({
-                "type": "answer_box",
-                "answer": data["answer_box"].get("answer", ""),
-                "source": data["answer_box"].get("source", "")
-            })
-        
-        # Extract related searches
-        related_searches = []
-        if "related_searches" in data:
-            for related in data["related_searches"]:
-                related_searches.append({
-                    "query": related.get("query", ""),
-                    "link": related.get("link", "")
-                })
-        
-        return {
-            "status": "success",
-            "query": query,
-            "location": location,
-            "total_results": len(organic_results),
-            "organic_results": organic_results,
-            "instant_answers": instant_answers,
-            "related_searches": related_searches,
-            "total_related": len(related_searches),
-            "search_engine": "DuckDuckGo",
-            "privacy_focused": True,
-            "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
-        }
+        data = serpapi_get(build_duckduckgo_params(query, num_results, location))
+        return parse_duckduckgo(data, query, num_results, location)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -97,6 +102,36 @@ def search_duckduckgo(query: str, num_results: int = 10, location: str = "Miami,
             "search_engine": "DuckDuckGo"
         }
 
+def build_duckduckgo_instant_answers_params(query: str) -> Dict:
+    """Build SerpApi request parameters for get_duckduckgo_instant_answers"""
+    params = {
+        "engine": "duckduckgo",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "kl": "us-en"
+    }
+    
+    return params
+
+def parse_duckduckgo_instant_answers(data: Dict, query: str) -> Dict:
+    """Convert a raw SerpApi response into the get_duckduckgo_instant_answers result dict"""
+    answers = []
+    if "answer_box" in data:
+        answers.append({
+            "type": "answer_box",
+            "answer": data["answer_box"].get("answer", ""),
+            "source": data["answer_box"].get("source", ""),
+            "title": data["answer_box"].get("title", "")
+        })
+    
+    return {
+        "status": "success",
+        "query": query,
+        "instant_answers": answers,
+        "total_answers": len(answers),
+        "search_engine": "DuckDuckGo"
+    }
+
 def get_duckduckgo_instant_answers(query: str) -> Dict:
     """
     Get DuckDuckGo instant answers
@@ -108,35 +143,8 @@ def get_duckduckgo_instant_answers(query: str) -> Dict:
         Dict with instant answers
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "duckduckgo",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "kl": "us-en"
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        answers = []
-        if "answer_box" in data:
-            answers.append({
-                "type": "answer_box",
-                "answer": data["answer_box"].get("answer", ""),
-                "source": data["answer_box"].get("source", ""),
-                "title": data["answer_box"].get("title", "")
-            })
-        
-        return {
-            "status": "success",
-            "query": query,
-            "instant_answers": answers,
-            "total_answers": len(answers),
-            "search_engine": "DuckDuckGo"
-        }
+        data = serpapi_get(build_duckduckgo_instant_answers_params(query))
+        return parse_duckduckgo_instant_answers(data, query)
         
     except Exception as e:
         return {
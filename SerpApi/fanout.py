@@ -0,0 +1,150 @@
+"""
+SerpApi - Concurrent Fan-out
+Run many independent engine calls at once with per-source timeouts and an
+overall deadline, yielding each source's result as soon as it is ready
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterator, Tuple
+
+# Fan-out defaults in seconds (override via environment)
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv('FANOUT_SOURCE_TIMEOUT', '35'))
+DEFAULT_DEADLINE = float(os.getenv('FANOUT_DEADLINE', '45'))
+DEFAULT_MAX_WORKERS = int(os.getenv('FANOUT_MAX_WORKERS', '25'))
+
+def _timeout_marker(source_timeout: float, reason: str) -> Dict:
+    """Result placed in the response for a source that did not finish in time"""
+    return {
+        "status": "timeout",
+        "error": f"Source did not complete within {source_timeout:g}s ({reason})"
+    }
+
+def iter_fanout(tasks: Dict[str, Callable[[], Dict]],
+                source_timeout: float = None,
+                deadline: float = None,
+                max_workers: int = None) -> Iterator[Tuple[str, Dict, int]]:
+    """
+    Run tasks concurrently and yield (name, result, elapsed_ms) in completion order
+
+    Args:
+        tasks: Mapping of source name to a zero-argument callable returning a result dict
+        source_timeout: Seconds a single source may run once it has started
+        deadline: Seconds after which every unfinished source is given up on
+        max_workers: Maximum number of sources running at once
+
+    Yields:
+        One tuple per source. Sources that raise yield a status 'error' dict and
+        sources that run out of time yield a status 'timeout' marker, so every
+        task name is yielded exactly once.
+    """
+    source_timeout = source_timeout or DEFAULT_SOURCE_TIMEOUT
+    deadline = deadline or DEFAULT_DEADLINE
+    max_workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(tasks) or 1))
+
+    started_at = {}
+
+    def run(name, task):
+        started_at[name] = time.monotonic()
+        return task()
+
+    fanout_start = time.monotonic()
+    overall_end = fanout_start + deadline
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fanout")
+    futures = {executor.submit(run, name, task): name for name, task in tasks.items()}
+    pending = set(futures)
+
+    def elapsed_ms(name):
+        return int((time.monotonic() - started_at.get(name, fanout_start)) * 1000)
+
+    try:
+        while pending:
+            now = time.monotonic()
+
+            # Give up on sources that have been running longer than their own timeout
+            for future in [f for f in pending if futures[f] in started_at]:
+                name = futures[future]
+                if now - started_at[name] >= source_timeout:
+                    pending.discard(future)
+                    yield name, _timeout_marker(source_timeout, "source timeout"), elapsed_ms(name)
+
+            if not pending:
+                break
+
+            remaining = overall_end - now
+            if remaining <= 0:
+                for future in pending:
+                    future.cancel()
+                    name = futures[future]
+                    yield name, _timeout_marker(deadline, "overall deadline"), elapsed_ms(name)
+                break
+
+            # Wake up for the next completion, source expiry or the deadline
+            wake_after = [remaining] + [
+                source_timeout - (now - started_at[futures[f]])
+                for f in pending if futures[f] in started_at
+            ]
+            done, pending = wait(pending, timeout=max(min(wake_after), 0.01),
+                                 return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"status": "error", "error": f"Unexpected error: {str(e)}"}
+                yield name, result, elapsed_ms(name)
+    finally:
+        # Never block the caller on stragglers; their threads finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def summarize_fanout(task_names, sources: Dict[str, Dict], elapsed_ms: int,
+                     source_timeout: float = None, deadline: float = None) -> Dict:
+    """
+    Build the fan-out summary returned alongside the per-source results
+
+    Args:
+        task_names: Source names in the order they were submitted
+        sources: Per-source {'status', 'elapsed_ms'} keyed by source name
+        elapsed_ms: Total fan-out wall-clock time
+    """
+    statuses = [source["status"] for source in sources.values()]
+    return {
+        "total_sources": len(task_names),
+        "completed": sum(1 for status in statuses if status == "success"),
+        "failed": sum(1 for status in statuses if status not in ("success", "timeout")),
+        "timed_out": statuses.count("timeout"),
+        "elapsed_ms": elapsed_ms,
+        "source_timeout_seconds": source_timeout or DEFAULT_SOURCE_TIMEOUT,
+        "deadline_seconds": deadline or DEFAULT_DEADLINE,
+        "sources": {name: sources[name] for name in task_names if name in sources}
+    }
+
+def source_status(result) -> str:
+    """Status of a single source result (dict results carry their own 'status')"""
+    return result.get("status", "unknown") if isinstance(result, dict) else "unknown"
+
+def run_fanout(tasks: Dict[str, Callable[[], Dict]],
+               source_timeout: float = None,
+               deadline: float = None,
+               max_workers: int = None) -> Tuple[Dict[str, Dict], Dict]:
+    """
+    Run tasks concurrently and collect partial results
+
+    Returns:
+        Tuple of (results keyed by source name in task order, summary dict with
+        per-source status and timing)
+    """
+    start = time.monotonic()
+    results = {}
+    sources = {}
+
+    for name, result, elapsed in iter_fanout(tasks, source_timeout, deadline, max_workers):
+        results[name] = result
+        sources[name] = {"status": source_status(result), "elapsed_ms": elapsed}
+
+    summary = summarize_fanout(list(tasks), sources, int((time.monotonic() - start) * 1000),
+                               source_timeout, deadline)
+
+    return {name: results[name] for name in tasks if name in results}, summary
@@ -8,9 +8,73 @@ import requests
 import os
 from typing import Dict, List, Optional
 
+from serpapi_client import serpapi_get
+
 # Get API key from environment or use hardcoded fallback
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_finance_params(query: str, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for search_finance"""
+    params = {
+        "engine": "google_finance",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "num": num_results
+    }
+    
+    return params
+
+def parse_finance(data: Dict, query: str, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the search_finance result dict"""
+    # Extract market summary
+    market_summary = {}
+    if "market_summary" in data:
+        market_summary = {
+            "market_status": data["market_summary"].get("market_status", ""),
+            "market_time": data["market_summary"].get("market_time", ""),
+            "market_change": data["market_summary"].get("market_change", ""),
+            "market_change_percent": data["market_summary"].get("market_change_percent", "")
+        }
+    
+    # Extract news
+    news = []
+    if "news" in data:
+        for article in data["news"]:
+            news.append({
+                "title": article.get("title", ""),
+                "link": article.get("link", ""),
+                "snippet": article.get("snippet", ""),
+                "date": article.get("date", ""),
+                "source": article.get("source", "")
+            })
+    
+    # Extract stock data
+    stocks = []
+    if "stocks" in data:
+        for stock in data["stocks"]:
+            stocks.append({
+                "name": stock.get("name", ""),
+                "ticker": stock.get("ticker", ""),
+                "price": stock.get("price", ""),
+                "change": stock.get("change", ""),
+                "change_percent": stock.get("change_percent", ""),
+                "market_cap": stock.get("market_cap", ""),
+                "volume": stock.get("volume", "")
+            })
+    
+    return {
+        "status": "success",
+        "query": query,
+        "market_summary": market_summary,
+        "news": news,
+        "total_news": len(news),
+        "stocks": stocks,
+        "total_stocks": len(stocks),
+        "search_engine": "Google Finance",
+        "financial_focus": True,
+        "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
+    }
+
 def search_finance(query: str, num_results: int = 10) -> Dict:
     """
     Search Google Finance for financial information
@@ -23,67 +87,8 @@ def search_finance(query: str, num_results: int = 10) -> Dict:
         Dict with financial data and news
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_finance",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "num": num_results
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract market summary
-        market_summary = {}
-        if "market_summary" in data:
-            market_summary = {
-                "market_status": data["market_summary"].get("market_status", ""),
-                "market_time": data["market_summary"].get("market_time", ""),
-                "market_change": data["market_summary"].get("market_change", ""),
-                "market_change_percent": data["market_summary"].get("market_change_percent", "")
-            }
-        
-        # Extract news
-        news = []
-        if "news" in data:
-            for article in data["news"]:
-                news.append({
-                    "title": article.get("title", ""),
-                    "link": article.get("link", ""),
-                    "snippet": article.get("snippet", ""),
-                    "date": article.get("date", ""),
-                    "source": article.get("source", "")
-                })
-        
-        # Extract stock data
-        stocks = []
-        if "stocks" in data:
-            for stock in data["stocks"]:
-                stocks.append({
-                    "name": stock.get("name", ""),
-                    "ticker": stock.get("ticker", ""),
-                    "price": stock.get("price", ""),
-                    "change": stock.get("change", ""),
-                    "change_percent": stock.get("change_percent", ""),
-                    "market_cap": stock.get("market_cap", ""),
-                    "volume": stock.get("volume", "")
-                })
-        
-        return {
-            "status": "success",
-            "query": query,
-            "market_summary": market_summary,
-            "news": news,
-            "total_news": len(news),
-            "stocks": stocks,
-            "total_stocks": len(stocks),
-            "search_engine": "Google Finance",
-            "financial_focus": True,
-            "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
-        }
+        data = serpapi_get(build_finance_params(query, num_results))
+        return parse_finance(data, query, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -100,6 +105,40 @@ def search_finance(query: str, num_results: int = 10) -> Dict:
             "search_engine": "Google Finance"
         }
 
+def build_market_trends_params(category: str = "transportation") -> Dict:
+    """Build SerpApi request parameters for get_market_trends"""
+    params = {
+        "engine": "google_finance",
+        "q": f"{category} stocks market trends",
+        "api_key": SERPAPI_API_KEY,
+        "num": 20
+    }
+    
+    return params
+
+def parse_market_trends(data: Dict, category: str = "transportation") -> Dict:
+    """Convert a raw SerpApi response into the get_market_trends result dict"""
+    # Extract trending stocks
+    trending_stocks = []
+    if "stocks" in data:
+        for stock in data["stocks"][:10]:  # Top 10 trending
+            trending_stocks.append({
+                "name": stock.get("name", ""),
+                "ticker": stock.get("ticker", ""),
+                "price": stock.get("price", ""),
+                "change_percent": stock.get("change_percent", ""),
+                "volume": stock.get("volume", ""),
+                "market_cap": stock.get("market_cap", "")
+            })
+    
+    return {
+        "status": "success",
+        "category": category,
+        "trending_stocks": trending_stocks,
+        "total_trending": len(trending_stocks),
+        "search_engine": "Google Finance"
+    }
+
 def get_market_trends(category: str = "transportation") -> Dict:
     """
     Get market trends for a specific category
@@ -111,39 +150,8 @@ def get_market_trends(category: str = "transportation") -> Dict:
         Dict with market trend data
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_finance",
-            "q": f"{category} stocks market trends",
-            "api_key": SERPAPI_API_KEY,
-            "num": 20
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract trending stocks
-        trending_stocks = []
-        if "stocks" in data:
-            for stock in data["stocks"][:10]:  # Top 10 trending
-                trending_stocks.append({
-                    "name": stock.get("name", ""),
-                    "ticker": stock.get("ticker", ""),
-                    "price": stock.get("price", ""),
-                    "change_percent": stock.get("change_percent", ""),
-                    "volume": stock.get("volume", ""),
-                    "market_cap": stock.get("market_cap", "")
-                })
-        
-        return {
-            "status": "success",
-            "category": category,
-            "trending_stocks": trending_stocks,
-            "total_trending": len(trending_stocks),
-            "search_engine": "Google Finance"
-        }
+        data = serpapi_get(build_market_trends_params(category))
+        return parse_market_trends(data, category)
         
     except Exception as e:
         return {
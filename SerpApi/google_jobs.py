@@ -8,8 +8,60 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_jobs_params(query: str, location: str, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for search_jobs"""
+    params = {
+        "engine": "google_jobs",
+        "q": query,
+        "location": location,
+        "api_key": SERPAPI_API_KEY,
+        "hl": "en"
+    }
+    
+    return params
+
+def parse_jobs(data: Dict, query: str, location: str, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the search_jobs result dict"""
+    # Extract job listings
+    jobs = []
+    for item in data.get("jobs_results", [])[:num_results]:
+        # Extract salary info
+        detected_extensions = item.get("detected_extensions", {})
+        salary = detected_extensions.get("salary", "")
+        schedule = detected_extensions.get("schedule_type", "")
+        
+        jobs.append({
+            "job_title": item.get("title", ""),
+            "company_name": item.get("company_name", ""),
+            "location": item.get("location", ""),
+            "description": item.get("description", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "extensions": item.get("extensions", []),
+            "salary": salary,
+            "schedule_type": schedule,
+            "posted_at": item.get("detected_extensions", {}).get("posted_at", ""),
+            "work_from_home": detected_extensions.get("work_from_home", False),
+            "job_highlights": item.get("job_highlights", []),
+            "related_links": item.get("related_links", []),
+            "job_id": item.get("job_id", ""),
+            "apply_options": item.get("apply_options", [])
+        })
+    
+    result = {
+        "query": query,
+        "location": location,
+        "total_results": len(jobs),
+        "jobs": jobs,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_jobs(query: str, location: str, num_results: int = 10) -> Dict:
     """
     Search for job listings on Google Jobs
@@ -23,56 +75,8 @@ def search_jobs(query: str, location: str, num_results: int = 10) -> Dict:
         Dict with job listings including salary, company, requirements
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_jobs",
-            "q": query,
-            "location": location,
-            "api_key": SERPAPI_API_KEY,
-            "hl": "en"
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract job listings
-        jobs = []
-        for item in data.get("jobs_results", [])[:num_results]:
-            # Extract salary info
-            detected_extensions = item.get("detected_extensions", {})
-            salary = detected_extensions.get("salary", "")
-            schedule = detected_extensions.get("schedule_type", "")
-            
-            jobs.append({
-                "job_title": item.get("title", ""),
-                "company_name": item.get("company_name", ""),
-                "location": item.get("location", ""),
-                "description": item.get("description", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "extensions": item.get("extensions", []),
-                "salary": salary,
-                "schedule_type": schedule,
-                "posted_at": item.get("detected_extensions", {}).get("posted_at", ""),
-                "work_from_home": detected_extensions.get("work_from_home", False),
-                "job_highlights": item.get("job_highlights", []),
-                "related_links": item.get("related_links", []),
-                "job_id": item.get("job_id", ""),
-                "apply_options": item.get("apply_options", [])
-            })
-        
-        result = {
-            "query": query,
-            "location": location,
-            "total_results": len(jobs),
-            "jobs": jobs,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_jobs_params(query, location, num_results))
+        return parse_jobs(data, query, location, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -89,6 +93,39 @@ def search_jobs(query: str, location: str, num_results: int = 10) -> Dict:
             "error": f"Unexpected error: {str(e)}"
         }
 
+def build_job_details_params(job_id: str) -> Dict:
+    """Build SerpApi request parameters for get_job_details"""
+    params = {
+        "engine": "google_jobs_listing",
+        "q": job_id,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_job_details(data: Dict, job_id: str) -> Dict:
+    """Convert a raw SerpApi response into the get_job_details result dict"""
+    # Extract detailed job info
+    apply_options = []
+    for option in data.get("apply_options", []):
+        apply_options.append({
+            "title": option.get("title", ""),
+            "link": option.get("link", "")
+        })
+    
+    result = {
+        "job_title": data.get("title", ""),
+        "company_name": data.get("company_name", ""),
+        "location": data.get("location", ""),
+        "description": data.get("description", ""),
+        "highlights": data.get("job_highlights", []),
+        "apply_options": apply_options,
+        "related_jobs": data.get("related_jobs_link", ""),
+        "status": "success"
+    }
+    
+    return result
+
 def get_job_details(job_id: str) -> Dict:
     """
     Get detailed information for a specific job listing
@@ -100,39 +137,8 @@ def get_job_details(job_id: str) -> Dict:
         Dict with detailed job information
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_jobs_listing",
-            "q": job_id,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract detailed job info
-        apply_options = []
-        for option in data.get("apply_options", []):
-            apply_options.append({
-                "title": option.get("title", ""),
-                "link": option.get("link", "")
-            })
-        
-        result = {
-            "job_title": data.get("title", ""),
-            "company_name": data.get("company_name", ""),
-            "location": data.get("location", ""),
-            "description": data.get("description", ""),
-            "highlights": data.get("job_highlights", []),
-            "apply_options": apply_options,
-            "related_jobs": data.get("related_jobs_link", ""),
-            "status": "success"
-        }
-        
-        return result
+        data = serpapi_get(build_job_details_params(job_id))
+        return parse_job_details(data, job_id)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -8,8 +8,48 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_patents_params(query: str, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for search_patents"""
+    params = {
+        "engine": "google_patents",
+        "q": query,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_patents(data: Dict, query: str, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the search_patents result dict"""
+    # Extract patent results
+    patents = []
+    for item in data.get("organic_results", [])[:num_results]:
+        patents.append({
+            "title": item.get("title", ""),
+            "patent_id": item.get("patent_id", ""),
+            "patent_url": item.get("link", ""),
+            "inventor": item.get("inventor", ""),
+            "assignee": item.get("assignee", ""),
+            "publication_date": item.get("publication_date", ""),
+            "filing_date": item.get("filing_date", ""),
+            "abstract": item.get("snippet", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "total_results": len(patents),
+        "patents": patents,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_patents(query: str, num_results: int = 10) -> Dict:
     """
     Search for patents on Google Patents (moving equipment, packing technology)
@@ -22,44 +62,8 @@ def search_patents(query: str, num_results: int = 10) -> Dict:
         Dict with patent results including titles, inventors, dates
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_patents",
-            "q": query,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract patent results
-        patents = []
-        for item in data.get("organic_results", [])[:num_results]:
-            patents.append({
-                "title": item.get("title", ""),
-                "patent_id": item.get("patent_id", ""),
-                "patent_url": item.get("link", ""),
-                "inventor": item.get("inventor", ""),
-                "assignee": item.get("assignee", ""),
-                "publication_date": item.get("publication_date", ""),
-                "filing_date": item.get("filing_date", ""),
-                "abstract": item.get("snippet", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "total_results": len(patents),
-            "patents": patents,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_patents_params(query, num_results))
+        return parse_patents(data, query, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -8,8 +8,54 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_google_play_apps_params(query: str, country: str = "us") -> Dict:
+    """Build SerpApi request parameters for search_google_play_apps"""
+    params = {
+        "engine": "google_play",
+        "q": query,
+        "store": "apps",
+        "gl": country,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_google_play_apps(data: Dict, query: str, country: str = "us") -> Dict:
+    """Convert a raw SerpApi response into the search_google_play_apps result dict"""
+    # Extract app results
+    apps = []
+    for item in data.get("organic_results", []):
+        apps.append({
+            "app_name": item.get("title", ""),
+            "app_id": item.get("product_id", ""),
+            "developer": item.get("developer", ""),
+            "play_store_url": item.get("link", ""),
+            "rating": item.get("rating"),
+            "reviews_count": item.get("reviews"),
+            "price": item.get("price", "Free"),
+            "description": item.get("description", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "downloads": item.get("downloads", ""),
+            "category": item.get("category", ""),
+            "content_rating": item.get("content_rating", ""),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "country": country,
+        "total_results": len(apps),
+        "apps": apps,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_google_play_apps(query: str, country: str = "us") -> Dict:
     """
     Search for apps on Google Play Store (Android apps for moving services)
@@ -22,50 +68,8 @@ def search_google_play_apps(query: str, country: str = "us") -> Dict:
         Dict with Play Store results including ratings, reviews, downloads
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_play",
-            "q": query,
-            "store": "apps",
-            "gl": country,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract app results
-        apps = []
-        for item in data.get("organic_results", []):
-            apps.append({
-                "app_name": item.get("title", ""),
-                "app_id": item.get("product_id", ""),
-                "developer": item.get("developer", ""),
-                "play_store_url": item.get("link", ""),
-                "rating": item.get("rating"),
-                "reviews_count": item.get("reviews"),
-                "price": item.get("price", "Free"),
-                "description": item.get("description", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "downloads": item.get("downloads", ""),
-                "category": item.get("category", ""),
-                "content_rating": item.get("content_rating", ""),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "country": country,
-            "total_results": len(apps),
-            "apps": apps,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_google_play_apps_params(query, country))
+        return parse_google_play_apps(data, query, country)
         
     except requests.exceptions.RequestException as e:
         return {
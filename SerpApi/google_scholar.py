@@ -8,9 +8,67 @@ import requests
 import os
 from typing import Dict, List, Optional
 
+from serpapi_client import serpapi_get
+
 # Get API key from environment or use hardcoded fallback
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_scholar_params(query: str, num_results: int = 10, year_start: Optional[int] = None, year_end: Optional[int] = None) -> Dict:
+    """Build SerpApi request parameters for search_scholar"""
+    params = {
+        "engine": "google_scholar",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "num": num_results
+    }
+    
+    if year_start:
+        params["as_ylo"] = year_start
+    if year_end:
+        params["as_yhi"] = year_end
+    
+    return params
+
+def parse_scholar(data: Dict, query: str, num_results: int = 10, year_start: Optional[int] = None, year_end: Optional[int] = None) -> Dict:
+    """Convert a raw SerpApi response into the search_scholar result dict"""
+    # Extract organic results (papers)
+    papers = []
+    if "organic_results" in data:
+        for result in data["organic_results"]:
+            papers.append({
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+                "position": result.get("position", 0),
+                "authors": result.get("publication_info", {}).get("authors", []),
+                "year": result.get("publication_info", {}).get("summary", ""),
+                "citations": result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
+                "pdf_link": result.get("inline_links", {}).get("serpapi_scholar_link", ""),
+                "journal": result.get("publication_info", {}).get("summary", "").split(" - ")[-1] if result.get("publication_info", {}).get("summary") else ""
+            })
+    
+    # Extract related queries
+    related_queries = []
+    if "related_searches" in data:
+        for related in data["related_searches"]:
+            related_queries.append({
+                "query": related.get("query", ""),
+                "link": related.get("link", "")
+            })
+    
+    return {
+        "status": "success",
+        "query": query,
+        "total_papers": len(papers),
+        "papers": papers,
+        "related_queries": related_queries,
+        "total_related": len(related_queries),
+        "search_engine": "Google Scholar",
+        "academic_focus": True,
+        "year_range": f"{year_start}-{year_end}" if year_start and year_end else "All years",
+        "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
+    }
+
 def search_scholar(query: str, num_results: int = 10, year_start: Optional[int] = None, year_end: Optional[int] = None) -> Dict:
     """
     Search Google Scholar for academic papers
@@ -25,61 +83,8 @@ def search_scholar(query: str, num_results: int = 10, year_start: Optional[int]
         Dict with scholarly results and metadata
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_scholar",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "num": num_results
-        }
-        
-        if year_start:
-            params["as_ylo"] = year_start
-        if year_end:
-            params["as_yhi"] = year_end
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract organic results (papers)
-        papers = []
-        if "organic_results" in data:
-            for result in data["organic_results"]:
-                papers.append({
-                    "title": result.get("title", ""),
-                    "link": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                    "position": result.get("position", 0),
-                    "authors": result.get("publication_info", {}).get("authors", []),
-                    "year": result.get("publication_info", {}).get("summary", ""),
-                    "citations": result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
-                    "pdf_link": result.get("inline_links", {}).get("serpapi_scholar_link", ""),
-                    "journal": result.get("publication_info", {}).get("summary", "").split(" - ")[-1] if result.get("publication_info", {}).get("summary") else ""
-                })
-        
-        # Extract related queries
-        related_queries = []
-        if "related_searches" in data:
-            for related in data["related_searches"]:
-                related_queries.append({
-                    "query": related.get("query", ""),
-                    "link": related.get("link", "")
-                })
-        
-        return {
-            "status": "success",
-            "query": query,
-            "total_papers": len(papers),
-            "papers": papers,
-            "related_queries": related_queries,
-            "total_related": len(related_queries),
-            "search_engine": "Google Scholar",
-            "academic_focus": True,
-            "year_range": f"{year_start}-{year_end}" if year_start and year_end else "All years",
-            "api_response_time": data.get("search_metadata", {}).get("total_time_taken", 0)
-        }
+        data = serpapi_get(build_scholar_params(query, num_results, year_start, year_end))
+        return parse_scholar(data, query, num_results, year_start, year_end)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -96,6 +101,40 @@ def search_scholar(query: str, num_results: int = 10, year_start: Optional[int]
             "search_engine": "Google Scholar"
         }
 
+def build_scholar_author_params(author_name: str, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for get_scholar_author"""
+    params = {
+        "engine": "google_scholar_profiles",
+        "mauthors": author_name,
+        "api_key": SERPAPI_API_KEY,
+        "num": num_results
+    }
+    
+    return params
+
+def parse_scholar_author(data: Dict, author_name: str, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the get_scholar_author result dict"""
+    profiles = []
+    if "profiles" in data:
+        for profile in data["profiles"]:
+            profiles.append({
+                "name": profile.get("name", ""),
+                "affiliation": profile.get("affiliations", ""),
+                "interests": profile.get("interests", []),
+                "citations": profile.get("cited_by", {}).get("total", 0),
+                "h_index": profile.get("cited_by", {}).get("table", [{}])[0].get("h_index", 0),
+                "i10_index": profile.get("cited_by", {}).get("table", [{}])[0].get("i10_index", 0),
+                "profile_link": profile.get("link", "")
+            })
+    
+    return {
+        "status": "success",
+        "author_name": author_name,
+        "total_profiles": len(profiles),
+        "profiles": profiles,
+        "search_engine": "Google Scholar"
+    }
+
 def get_scholar_author(author_name: str, num_results: int = 10) -> Dict:
     """
     Search for a specific author on Google Scholar
@@ -108,39 +147,8 @@ def get_scholar_author(author_name: str, num_results: int = 10) -> Dict:
         Dict with author's papers and profile
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_scholar_profiles",
-            "mauthors": author_name,
-            "api_key": SERPAPI_API_KEY,
-            "num": num_results
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        profiles = []
-        if "profiles" in data:
-            for profile in data["profiles"]:
-                profiles.append({
-                    "name": profile.get("name", ""),
-                    "affiliation": profile.get("affiliations", ""),
-                    "interests": profile.get("interests", []),
-                    "citations": profile.get("cited_by", {}).get("total", 0),
-                    "h_index": profile.get("cited_by", {}).get("table", [{}])[0].get("h_index", 0),
-                    "i10_index": profile.get("cited_by", {}).get("table", [{}])[0].get("i10_index", 0),
-                    "profile_link": profile.get("link", "")
-                })
-        
-        return {
-            "status": "success",
-            "author_name": author_name,
-            "total_profiles": len(profiles),
-            "profiles": profiles,
-            "search_engine": "Google Scholar"
-        }
+        data = serpapi_get(build_scholar_author_params(author_name, num_results))
+        return parse_scholar_author(data, author_name, num_results)
         
     except Exception as e:
         return {
@@ -7,8 +7,63 @@ import os
 import requests
 from typing import Dict, Optional
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_google_search_params(query: str, location: str = None, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for google_search"""
+    params = {
+        "engine": "google",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "num": num_results
+    }
+    
+    if location:
+        params["location"] = location
+    
+    return params
+
+def parse_google_search(data: Dict, query: str, location: str = None, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the google_search result dict"""
+    # Extract organic results
+    organic_results = []
+    for item in data.get("organic_results", []):
+        organic_results.append({
+            "position": item.get("position", 0),
+            "title": item.get("title", ""),
+            "link": item.get("link", ""),
+            "displayed_link": item.get("displayed_link", ""),
+            "snippet": item.get("snippet", ""),
+            "date": item.get("date", "")
+        })
+    
+    # Extract ads
+    ads = []
+    for item in data.get("ads", []):
+        ads.append({
+            "position": item.get("position", 0),
+            "title": item.get("title", ""),
+            "link": item.get("link", ""),
+            "displayed_link": item.get("displayed_link", ""),
+            "snippet": item.get("snippet", "")
+        })
+    
+    result = {
+        "query": query,
+        "location": location,
+        "total_results": len(organic_results),
+        "organic_results": organic_results,
+        "ads": ads,
+        "featured_snippet": data.get("answer_box", {}),
+        "knowledge_graph": data.get("knowledge_graph", {}),
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def google_search(query: str, location: str = None, num_results: int = 10) -> Dict:
     """
     Perform Google search and get results
@@ -22,59 +77,8 @@ def google_search(query: str, location: str = None, num_results: int = 10) -> Di
         Dict with search results including organic results, ads, featured snippets
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "num": num_results
-        }
-        
-        if location:
-            params["location"] = location
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract organic results
-        organic_results = []
-        for item in data.get("organic_results", []):
-            organic_results.append({
-                "position": item.get("position", 0),
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "displayed_link": item.get("displayed_link", ""),
-                "snippet": item.get("snippet", ""),
-                "date": item.get("date", "")
-            })
-        
-        # Extract ads
-        ads = []
-        for item in data.get("ads", []):
-            ads.append({
-                "position": item.get("position", 0),
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "displayed_link": item.get("displayed_link", ""),
-                "snippet": item.get("snippet", "")
-            })
-        
-        result = {
-            "query": query,
-            "location": location,
-            "total_results": len(organic_results),
-            "organic_results": organic_results,
-            "ads": ads,
-            "featured_snippet": data.get("answer_box", {}),
-            "knowledge_graph": data.get("knowledge_graph", {}),
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_google_search_params(query, location, num_results))
+        return parse_google_search(data, query, location, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -7,7 +7,11 @@ NO MOCK DATA - ALL REAL API CALLS
 
 import os
 import sys
-from flask import Flask, jsonify, send_from_directory
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
 
 # Add parent directory to path to import SerpApi modules
@@ -59,12 +63,32 @@ from google_scholar import search_scholar, get_scholar_author
 from google_finance import search_finance, get_market_trends
 from marketing_analytics import get_marketing_analytics_summary
 
+# Import shared SERP snapshot (one google fetch for search, difficulty and SERP analysis)
+from serp_snapshot import snapshot_google_search, snapshot_keyword_difficulty, snapshot_serp_analysis
+
+# Import request coalescing for smart_api_call
+from singleflight import SingleFlight
+
+# Import two-tier response cache (in-process LRU + SQLite)
+from response_cache import ResponseCache, make_cache_key
+
+# Import per-engine rate limiter and credit budget
+from rate_limiter import configure_rate_limiter
+
+# Import per-engine circuit breaker state
+from resilience import breaker_states
+
+# Import concurrent fan-out helper
+from fanout import iter_fanout, run_fanout, source_status, summarize_fanout
+
 # Import Mapbox Miami Visualization
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '../Mapbox/SerpAPI_MAP'))
 from miami_data_visualization import get_miami_map_data
 
 # Import database manager
-from DB.db_manager import get_db
+from DB.db_manager import get_db, SEARCH_SOURCES
+from DB.export import TableExport
+from DB.write_queue import start_write_queue
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
@@ -73,6 +97,52 @@ CORS(app)  # Enable CORS for frontend access
 db = get_db()
 session_id = db.get_current_session("moving_companies", "Miami, FL")
 
+# Rate limits and credit budgets apply to every SerpApi request; usage comes from api_calls
+rate_limiter = configure_rate_limiter(usage_loader=db.get_credit_usage)
+
+# Cache windows: fresh data is served as-is, stale data is served immediately
+# while a background worker refreshes it, anything older is fetched inline
+CACHE_FRESH_MINUTES = 15
+CACHE_STALE_MINUTES = int(os.getenv('CACHE_STALE_MINUTES', '60'))
+
+# Responses keyed by endpoint, engine and parameters (kept for fresh + stale windows)
+response_cache = ResponseCache(db, ttl_seconds=(CACHE_FRESH_MINUTES + CACHE_STALE_MINUTES) * 60)
+
+# Upstream calls currently in flight, shared by identical concurrent requests
+in_flight_calls = SingleFlight()
+
+# API logging and result saving happen on a background writer (flushed at exit)
+write_queue = start_write_queue(db)
+
+# Background refreshes of stale cache entries
+revalidation_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="revalidate")
+revalidating_keys = set()
+revalidating_lock = threading.Lock()
+
+def schedule_revalidation(cache_key, refresh_function):
+    """
+    Refresh a stale cache entry in the background (at most once per key at a time)
+    
+    Returns:
+        True if a refresh is queued or already running for this key
+    """
+    with revalidating_lock:
+        if cache_key in revalidating_keys:
+            return True
+        revalidating_keys.add(cache_key)
+    
+    def refresh():
+        try:
+            in_flight_calls.do(cache_key, refresh_function)
+        except Exception as e:
+            print(f"Warning: Background refresh failed: {e}")
+        finally:
+            with revalidating_lock:
+                revalidating_keys.discard(cache_key)
+    
+    revalidation_executor.submit(refresh)
+    return True
+
 # Miami moving companies constants
 MIAMI_LOCATION = "Miami, FL"
 MIAMI_KEYWORD = "moving companies miami"
@@ -81,7 +151,47 @@ MIAMI_KEYWORD = "moving companies miami"
 # SMART CACHING WRAPPER
 # ============================================================================
 
-def smart_api_call(endpoint_name, api_function, *args, save_function=None, force_refresh=False, **kwargs):
+def cached_result(cached, **markers):
+    """Copy a cache entry's data and add the cache metadata the dashboard displays"""
+    from datetime import datetime
+    
+    result = dict(cached.data)
+    result['from_cache'] = True
+    result['cached_at'] = datetime.fromtimestamp(cached.created_at).isoformat(sep=' ')
+    result['age_minutes'] = int(cached.age_seconds // 60)
+    result.update(markers)
+    return result
+
+def log_and_save(endpoint_name, query, location, raw_result, save_function=None, response_time_ms=None):
+    """
+    Log an API call and save its rows (run on the write-behind queue)
+    
+    Returns:
+        The api_call_id of the logged call
+    """
+    api_call_id = db.log_api_call(
+        endpoint=endpoint_name,
+        query=query,
+        location=location,
+        status=raw_result.get('status', 'unknown'),
+        response_time_ms=response_time_ms,
+        error_message=raw_result.get('error'),
+        raw_response=raw_result
+    )
+    
+    # Save to database if function provided and successful
+    if save_function and raw_result.get('status') == 'success':
+        try:
+            # Nested transaction: a failed save is rolled back, the log entry is kept
+            with db.transaction():
+                save_function(raw_result, session_id, api_call_id)
+        except Exception as e:
+            print(f"Warning: Failed to save {endpoint_name} to DB: {e}")
+    
+    return api_call_id
+
+def smart_api_call(endpoint_name, api_function, *args, save_function=None, force_refresh=False,
+                   wait_for_write=False, **kwargs):
     """
     Smart wrapper that checks cache first, then calls API if needed
     Automatically saves results to database with timestamps
@@ -91,61 +201,154 @@ def smart_api_call(endpoint_name, api_function, *args, save_function=None, force
         api_function: The actual API function to call
         save_function: Optional DB save function
         force_refresh: If True, skip cache and call API
+        wait_for_write: If True, wait for the background DB write and add its
+            api_call_id to the result (otherwise the key is absent)
         *args, **kwargs: Arguments for the API function
         
+    Concurrent calls with the same endpoint and arguments are coalesced: one
+    upstream call is made and every caller receives its result (marked
+    coalesced=True for the callers that waited).
+    
+    Cached data older than CACHE_FRESH_MINUTES but within CACHE_STALE_MINUTES
+    more is returned immediately with stale=True while it is refreshed in the
+    background. When the credit budget is exhausted the newest cached copy is
+    returned regardless of age (marked budget_exhausted=True).
+    
     Returns:
-        Dict with result data plus metadata (from_cache, cached_at, etc.)
+        Dict with result data plus metadata (from_cache, cached_at, stale, etc.)
     """
-    from datetime import datetime
     import time
     
-    # Extract query and location from args for cache check
+    # Extract query and location from args for logging
     query = kwargs.get('query') or (args[0] if len(args) > 0 else MIAMI_KEYWORD)
     location = kwargs.get('location') or (args[1] if len(args) > 1 else MIAMI_LOCATION)
     
+    # Cache entries are keyed on endpoint, engine function and every argument
+    cache_key = make_cache_key(endpoint_name, api_function, args, kwargs)
+    
+    def call_and_store():
+        # Call API
+        start_time = time.time()
+        raw_result = api_function(*args, **kwargs)
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        
+        # Only the memory tier is filled here; its SQLite copy is written with the rest
+        cache_entry = None
+        if raw_result.get('status') == 'success':
+            cache_entry = response_cache.set(cache_key, dict(raw_result), endpoint_name, query, location,
+                                             memory_only=True)
+        
+        # Log the call, save its rows and cache it on the background writer, off the request path
+        def persist():
+            if cache_entry is not None:
+                response_cache.save_to_db(cache_key, cache_entry, endpoint_name, query, location)
+            return log_and_save(endpoint_name, query, location, raw_result, save_function, elapsed_ms)
+        
+        write = write_queue.submit(persist)
+        
+        # Add metadata to a copy; the queued write still needs the raw result
+        result = dict(raw_result)
+        result['from_cache'] = False
+        if wait_for_write:
+            result['api_call_id'] = write.result()
+        result['response_time_ms'] = elapsed_ms
+        
+        return result
+    
     # Check cache if not forcing refresh
     if not force_refresh:
-        freshness = db.get_data_freshness(endpoint_name, query, location)
-        if freshness['is_fresh']:
-            # Return cached data
-            cached = db.get_cached_data('api_calls', query, location, max_age_minutes=15)
-            if cached and cached.get('data'):
-                result = cached['data']
-                result['from_cache'] = True
-                result['cached_at'] = cached['cached_at']
-                result['age_minutes'] = freshness['age_minutes']
-                return result
-    
-    # Call API
-    start_time = time.time()
-    result = api_function(*args, **kwargs)
-    elapsed_ms = int((time.time() - start_time) * 1000)
-    
-    # Log API call
-    api_call_id = db.log_api_call(
-        endpoint=endpoint_name,
-        query=query,
-        location=location,
-        status=result.get('status', 'unknown'),
-        response_time_ms=elapsed_ms,
-        error_message=result.get('error'),
-        raw_response=result
-    )
+        cached = response_cache.get(cache_key)
+        if cached:
+            result = cached_result(cached, stale=cached.age_seconds >= CACHE_FRESH_MINUTES * 60)
+            if result['stale']:
+                # Serve the stale copy now and refresh it for the next caller
+                result['revalidating'] = schedule_revalidation(cache_key, call_and_store)
+            return result
     
-    # Save to database if function provided and successful
-    if save_function and result.get('status') == 'success':
-        try:
-            save_function(result, session_id, api_call_id)
-        except Exception as e:
-            print(f"Warning: Failed to save {endpoint_name} to DB: {e}")
+    # Out of credits: fall back to the newest cached copy, however old
+    if rate_limiter.budget.remaining() == 0:
+        cached = response_cache.get_latest(cache_key)
+        if cached:
+            return cached_result(cached, stale=True, budget_exhausted=True)
     
-    # Add metadata
-    result['from_cache'] = False
-    result['api_call_id'] = api_call_id
-    result['response_time_ms'] = elapsed_ms
+    # Identical concurrent requests share one upstream call instead of stampeding SerpApi
+    result, shared = in_flight_calls.do(cache_key, call_and_store)
+    if shared:
+        result = dict(result)
+        result['coalesced'] = True
     
     return result
 
+# ============================================================================
+# DASHBOARD SOURCES
+# Each source's standalone endpoint and /api/all-data call it through
+# smart_api_call with the same arguments, so both share one cache entry,
+# one DB save and the budget fallback.
+# Source name -> (endpoint name, engine function, arguments, save function)
+# ============================================================================
+
+DASHBOARD_SOURCES = {
+    # CORE SEARCH & RANKINGS (3)
+    'google_search': ("Google Search", snapshot_google_search,
+                      (MIAMI_KEYWORD, MIAMI_LOCATION, 10), db.save_search_results),
+    'local_pack': ("Local Pack (3-pack)", get_local_pack_results, ("moving companies", MIAMI_LOCATION), None),
+    'local_businesses': ("Local Businesses (Maps)", search_local_businesses,
+                         ("moving companies", MIAMI_LOCATION, 10), db.save_local_businesses),
+    
+    # KEYWORD RESEARCH (4)
+    'keyword_suggestions': ("Keyword Suggestions", get_keyword_suggestions, ("moving companies miami", "us"), None),
+    'autocomplete': ("Autocomplete", get_autocomplete_suggestions, ("moving companies mia", "us"), None),
+    'related_searches': ("Related Searches", get_related_searches, (MIAMI_KEYWORD, "United States"), None),
+    'people_also_ask': ("People Also Ask", get_people_also_ask, (MIAMI_KEYWORD,), None),
+    
+    # COMPETITIVE INTELLIGENCE (3)
+    'keyword_difficulty': ("Keyword Difficulty", snapshot_keyword_difficulty, (MIAMI_KEYWORD, MIAMI_LOCATION), None),
+    'serp_analysis': ("SERP Analysis", snapshot_serp_analysis, (MIAMI_KEYWORD, MIAMI_LOCATION), None),
+    'competitor_keywords': ("Competitor Keywords", get_competitor_keywords,
+                            ("movebuddha.com", "United States", 10), None),
+    
+    # MEDIA & CONTENT (3)
+    'image_search': ("Image Search", search_images, ("moving truck miami", 10), None),
+    'news_search': ("News Search", search_news, ("moving companies miami", MIAMI_LOCATION, "qdr:m", 5), None),
+    'shopping_search': ("Shopping Search", search_shopping, ("moving boxes supplies", MIAMI_LOCATION, 10), None),
+    
+    # JOB MARKET INTELLIGENCE (3)
+    'google_jobs': ("Google Jobs", search_jobs, ("mover", MIAMI_LOCATION, 10), db.save_job_listings),
+    'linkedin_jobs': ("LinkedIn Jobs", search_linkedin_jobs, ("mover operations", MIAMI_LOCATION, 10), None),
+    'search_trends': ("Search Trends", get_search_trends, ("moving companies", "US-FL", "today 3-m"), None),
+    
+    # REVIEW PLATFORMS (3)
+    'yelp_businesses': ("Yelp Business Search", search_yelp_businesses,
+                        ("moving companies", MIAMI_LOCATION, 10), db.save_yelp_businesses),
+    'tripadvisor': ("TripAdvisor Search", search_tripadvisor, ("storage facilities miami", MIAMI_LOCATION), None),
+    'keyword_volume': ("Keyword Search Volume", get_keyword_search_volume, (MIAMI_KEYWORD, "United States"), None),
+    
+    # APP STORES (2)
+    'apple_apps': ("Apple App Store", search_apple_apps, ("moving calculator cost estimator", "us"), None),
+    'google_play_apps': ("Google Play Store", search_google_play_apps, ("moving planner checklist", "us"), None),
+    
+    # ECOMMERCE & PRICING (3)
+    'amazon_products': ("Amazon Products", search_amazon_products, ("moving boxes supplies", "amazon.com"), None),
+    'walmart_products': ("Walmart Products", search_walmart_products, ("moving boxes packing supplies",), None),
+    'youtube_videos': ("YouTube Search", search_youtube,
+                       ("moving companies miami tips", 10), db.save_youtube_videos),
+    
+    # INNOVATION TRACKING (1)
+    'patents': ("Google Patents", search_patents, ("moving equipment packing innovation", 10), None)
+}
+
+def call_source(name, force_refresh=False):
+    """Fetch one dashboard source through smart_api_call"""
+    endpoint_name, api_function, args, save_function = DASHBOARD_SOURCES[name]
+    return smart_api_call(endpoint_name, api_function, *args,
+                          save_function=save_function, force_refresh=force_refresh)
+
+def source_response(name):
+    """JSON response for a source's standalone endpoint (?refresh=true skips the cache)"""
+    from flask import request
+    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
+    return jsonify(call_source(name, force_refresh))
+
 @app.route('/')
 def index():
     """Serve the main HTML dashboard"""
@@ -170,6 +373,15 @@ def api_status():
         'session_id': session_id,
         'database_path': db.db_path,
         'recent_api_calls': recent_calls,
+        'rate_limiter': rate_limiter.stats(),
+        'circuit_breakers': breaker_states(),
+        'write_queue': write_queue.stats(),
+        'response_cache': {
+            **response_cache.stats(),
+            'fresh_minutes': CACHE_FRESH_MINUTES,
+            'stale_minutes': CACHE_STALE_MINUTES,
+            'revalidating': len(revalidating_keys)
+        },
         'api_categories': {
             'search_rankings': 3,
             'keyword_research': 4,
@@ -200,11 +412,7 @@ def api_data_freshness():
         'Walmart Products'
     ]
     
-    freshness_data = {}
-    for endpoint in endpoints:
-        freshness_data[endpoint] = db.get_data_freshness(
-            endpoint, MIAMI_KEYWORD, MIAMI_LOCATION
-        )
+    freshness_data = db.get_data_freshness_batch(endpoints, MIAMI_KEYWORD, MIAMI_LOCATION)
     
     return jsonify({
         'location': MIAMI_LOCATION,
@@ -217,270 +425,127 @@ def api_data_freshness():
 @app.route('/api/google-search')
 def api_google_search():
     """Get Google search results for Miami moving companies (with smart caching)"""
-    from flask import request
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    
-    result = smart_api_call(
-        "Google Search",
-        google_search,
-        MIAMI_KEYWORD,
-        MIAMI_LOCATION,
-        10,
-        save_function=db.save_search_results,
-        force_refresh=force_refresh
-    )
-    return jsonify(result)
+    return source_response('google_search')
 
 @app.route('/api/keyword-suggestions')
 def api_keyword_suggestions():
     """Get keyword suggestions"""
-    result = get_keyword_suggestions(
-        seed_keyword="moving companies miami",
-        location="us"
-    )
-    return jsonify(result)
+    return source_response('keyword_suggestions')
 
 @app.route('/api/autocomplete')
 def api_autocomplete():
     """Get autocomplete suggestions"""
-    result = get_autocomplete_suggestions(
-        partial_keyword="moving companies mia",
-        location="us"
-    )
-    return jsonify(result)
+    return source_response('autocomplete')
 
 @app.route('/api/local-pack')
 def api_local_pack():
     """Get local 3-pack results"""
-    result = get_local_pack_results(
-        keyword="moving companies",
-        location=MIAMI_LOCATION
-    )
-    return jsonify(result)
+    return source_response('local_pack')
 
 @app.route('/api/local-businesses')
 def api_local_businesses():
     """Get local businesses from Google Maps (with smart caching)"""
-    from flask import request
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    
-    result = smart_api_call(
-        "Local Businesses (Maps)",
-        search_local_businesses,
-        "moving companies",
-        MIAMI_LOCATION,
-        10,
-        save_function=db.save_local_businesses,
-        force_refresh=force_refresh
-    )
-    return jsonify(result)
+    return source_response('local_businesses')
 
 @app.route('/api/people-also-ask')
 def api_people_also_ask():
     """Get People Also Ask questions"""
-    result = get_people_also_ask(
-        keyword=MIAMI_KEYWORD
-    )
-    return jsonify(result)
+    return source_response('people_also_ask')
 
 @app.route('/api/related-searches')
 def api_related_searches():
     """Get related search queries"""
-    result = get_related_searches(
-        query=MIAMI_KEYWORD,
-        location="United States"
-    )
-    return jsonify(result)
+    return source_response('related_searches')
 
 @app.route('/api/keyword-volume')
 def api_keyword_volume():
     """Get keyword search volume"""
-    result = get_keyword_search_volume(
-        keyword=MIAMI_KEYWORD,
-        location="United States"
-    )
-    return jsonify(result)
+    return source_response('keyword_volume')
 
 @app.route('/api/search-trends')
 def api_search_trends():
     """Get Google Trends data"""
-    result = get_search_trends(
-        keyword="moving companies",
-        location="US-FL",
-        date_range="today 3-m"
-    )
-    return jsonify(result)
+    return source_response('search_trends')
 
 @app.route('/api/keyword-difficulty')
 def api_keyword_difficulty():
     """Get keyword difficulty analysis"""
-    result = get_keyword_difficulty(
-        keyword=MIAMI_KEYWORD,
-        location="United States"
-    )
-    return jsonify(result)
+    return source_response('keyword_difficulty')
 
 @app.route('/api/serp-analysis')
 def api_serp_analysis():
     """Get SERP feature analysis"""
-    result = analyze_serp(
-        keyword=MIAMI_KEYWORD,
-        location=MIAMI_LOCATION
-    )
-    return jsonify(result)
+    return source_response('serp_analysis')
 
 @app.route('/api/competitor-keywords')
 def api_competitor_keywords():
     """Get competitor keyword analysis"""
-    result = get_competitor_keywords(
-        competitor_domain="movebuddha.com",
-        location="United States",
-        num_results=10
-    )
-    return jsonify(result)
+    return source_response('competitor_keywords')
 
 @app.route('/api/image-search')
 def api_image_search():
     """Get image search results"""
-    result = search_images(
-        query="moving truck miami",
-        num_results=10
-    )
-    return jsonify(result)
+    return source_response('image_search')
 
 @app.route('/api/news-search')
 def api_news_search():
     """Get news articles"""
-    result = search_news(
-        query="moving companies miami",
-        location=MIAMI_LOCATION,
-        date_range="qdr:m",
-        num_results=5
-    )
-    return jsonify(result)
+    return source_response('news_search')
 
 @app.route('/api/shopping-search')
 def api_shopping_search():
     """Get shopping results for moving supplies"""
-    result = search_shopping(
-        query="moving boxes supplies",
-        location=MIAMI_LOCATION,
-        num_results=10
-    )
-    return jsonify(result)
+    return source_response('shopping_search')
 
 @app.route('/api/yelp-businesses')
 def api_yelp_businesses():
     """Get Yelp business listings (with DB save)"""
-    from flask import request
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    
-    result = smart_api_call(
-        "Yelp Business Search",
-        search_yelp_businesses,
-        "moving companies",
-        MIAMI_LOCATION,
-        10,
-        save_function=db.save_yelp_businesses,
-        force_refresh=force_refresh
-    )
-    return jsonify(result)
+    return source_response('yelp_businesses')
 
 @app.route('/api/youtube-videos')
 def api_youtube_videos():
     """Get YouTube video search results (with DB save)"""
-    from flask import request
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    
-    result = smart_api_call(
-        "YouTube Search",
-        search_youtube,
-        "moving companies miami tips",
-        10,
-        save_function=db.save_youtube_videos,
-        force_refresh=force_refresh
-    )
-    return jsonify(result)
+    return source_response('youtube_videos')
 
 @app.route('/api/job-listings')
 def api_job_listings():
     """Get Google Jobs listings (with DB save)"""
-    from flask import request
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    
-    result = smart_api_call(
-        "Google Jobs",
-        search_jobs,
-        "mover",
-        MIAMI_LOCATION,
-        10,
-        save_function=db.save_job_listings,
-        force_refresh=force_refresh
-    )
-    return jsonify(result)
+    return source_response('google_jobs')
 
 @app.route('/api/tripadvisor')
 def api_tripadvisor():
     """Get TripAdvisor business listings (storage facilities)"""
-    result = search_tripadvisor(
-        query="storage facilities miami",
-        location=MIAMI_LOCATION
-    )
-    return jsonify(result)
+    return source_response('tripadvisor')
 
 @app.route('/api/linkedin-jobs')
 def api_linkedin_jobs():
     """Get LinkedIn job listings"""
-    result = search_linkedin_jobs(
-        query="mover operations",
-        location=MIAMI_LOCATION,
-        num_results=10
-    )
-    return jsonify(result)
+    return source_response('linkedin_jobs')
 
 @app.route('/api/apple-apps')
 def api_apple_apps():
     """Get Apple App Store apps (moving calculators)"""
-    result = search_apple_apps(
-        query="moving calculator cost estimator",
-        country="us"
-    )
-    return jsonify(result)
+    return source_response('apple_apps')
 
 @app.route('/api/google-play-apps')
 def api_google_play_apps():
     """Get Google Play Store apps (moving planners)"""
-    result = search_google_play_apps(
-        query="moving planner checklist",
-        country="us"
-    )
-    return jsonify(result)
+    return source_response('google_play_apps')
 
 @app.route('/api/patents')
 def api_patents():
     """Get Google Patents (moving equipment innovations)"""
-    result = search_patents(
-        query="moving equipment packing innovation",
-        num_results=10
-    )
-    return jsonify(result)
+    return source_response('patents')
 
 @app.route('/api/amazon-products')
 def api_amazon_products():
     """Get Amazon products (moving supplies)"""
-    result = search_amazon_products(
-        query="moving boxes supplies",
-        domain="amazon.com"
-    )
-    return jsonify(result)
+    return source_response('amazon_products')
 
 @app.route('/api/walmart-products')
 def api_walmart_products():
     """Get Walmart products (moving supplies comparison)"""
-    result = search_walmart_products(
-        query="moving boxes packing supplies"
-    )
-    return jsonify(result)
+    return source_response('walmart_products')
 
 @app.route('/api/keyword-volume-history')
 def api_keyword_volume_history():
@@ -491,16 +556,10 @@ def api_keyword_volume_history():
         date_ranges=["today 1-m", "today 3-m", "today 12-m"]
     )
     
-    # Save to database
+    # Save to database on the background writer
     if result.get('status') == 'success':
-        api_call_id = db.log_api_call(
-            endpoint="Keyword Volume History",
-            query=MIAMI_KEYWORD,
-            location="US-FL",
-            status='success',
-            raw_response=result
-        )
-        db.save_keyword_volume_history(result, session_id, api_call_id)
+        write_queue.submit(lambda: log_and_save("Keyword Volume History", MIAMI_KEYWORD, "US-FL",
+                                                result, db.save_keyword_volume_history))
     
     return jsonify(result)
 
@@ -529,16 +588,10 @@ def api_regional_interest():
         country="US"
     )
     
-    # Save to database
+    # Save to database on the background writer
     if result.get('status') == 'success':
-        api_call_id = db.log_api_call(
-            endpoint="Regional Interest",
-            query="moving companies",
-            location="US",
-            status='success',
-            raw_response=result
-        )
-        db.save_regional_interest(result, session_id, api_call_id)
+        write_queue.submit(lambda: log_and_save("Regional Interest", "moving companies", "US",
+                                                result, db.save_regional_interest))
     
     return jsonify(result)
 
@@ -560,55 +613,153 @@ def api_keyword_timeline():
         'total_points': len(timeline)
     })
 
+@app.route('/api/search')
+def api_search():
+    """
+    Full-text search across stored search results, questions, news, reviews and jobs
+
+    Query params:
+        q: Search text (all words must match, the last one as a prefix)
+        sources: Comma-separated subset of search_results, people_also_ask, news, reviews, jobs
+        limit: Maximum number of results (default 20, max 100)
+    """
+    from flask import request
+    text = request.args.get('q', '').strip()
+    sources = [s.strip() for s in request.args.get('sources', '').split(',') if s.strip()] or None
+    limit = min(request.args.get('limit', 20, type=int), 100)
+
+    if not text:
+        return jsonify({"status": "error", "error": "Missing search text (q)"}), 400
+    unknown = [s for s in sources or [] if s not in SEARCH_SOURCES]
+    if unknown:
+        return jsonify({
+            "status": "error",
+            "error": f"Unknown sources: {', '.join(unknown)} (available: {', '.join(SEARCH_SOURCES)})"
+        }), 400
+
+    start = time.monotonic()
+    results = db.search_text(text, sources, limit)
+
+    return jsonify({
+        'status': 'success',
+        'query': text,
+        'results': results,
+        'count': len(results),
+        'elapsed_ms': round((time.monotonic() - start) * 1000, 1)
+    })
+
+@app.route('/api/export/<table>')
+def api_export(table):
+    """
+    Stream a whole table (or a filtered part of it) as a file download
+    
+    Query params:
+        format: 'csv' (default), 'jsonl' or 'parquet'
+        compress: 'gzip' to gzip CSV / JSONL output
+        columns: Comma-separated columns (default: all)
+        since / until: created_at range, e.g. since=2025-01-01
+        after_id: Only rows with a higher id, for incremental nightly pulls
+        limit: Maximum number of rows
+        <column>=<value>: Only rows where the column equals the value
+    
+    Rows are read in batches from one read-only snapshot and written out as
+    they are read, so memory use stays flat and ingestion is never blocked.
+    """
+    from flask import request
+    
+    try:
+        export = TableExport(db.db_path, table, request.args.to_dict())
+    except ValueError as e:
+        return jsonify({"status": "error", "error": str(e)}), 400
+    
+    return Response(
+        stream_with_context(export.chunks()),
+        mimetype=export.mimetype,
+        headers={
+            'Content-Disposition': f'attachment; filename="{export.filename}"',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+def _all_data_tasks():
+    """Build the source name -> call mapping aggregated by /api/all-data"""
+    return {name: (lambda name=name: call_source(name)) for name in DASHBOARD_SOURCES}
+
 @app.route('/api/all-data')
 def api_all_data():
-    """Get ALL data at once (25+ APIs - may take 30-60 seconds)"""
-    data = {
-        # CORE SEARCH & RANKINGS (3)
-        'google_search': google_search(MIAMI_KEYWORD, MIAMI_LOCATION, 5),
-        'local_pack': get_local_pack_results("moving companies", MIAMI_LOCATION),
-        'local_businesses': search_local_businesses("moving companies", MIAMI_LOCATION, 5),
-        
-        # KEYWORD RESEARCH (4)
-        'keyword_suggestions': get_keyword_suggestions("moving companies miami", "us"),
-        'autocomplete': get_autocomplete_suggestions("moving companies mia", "us"),
-        'related_searches': get_related_searches(MIAMI_KEYWORD, "United States"),
-        'people_also_ask': get_people_also_ask(MIAMI_KEYWORD),
-        
-        # COMPETITIVE INTELLIGENCE (3)
-        'keyword_difficulty': get_keyword_difficulty(MIAMI_KEYWORD, "United States"),
-        'serp_analysis': analyze_serp(MIAMI_KEYWORD, MIAMI_LOCATION),
-        'competitor_keywords': get_competitor_keywords("movebuddha.com", "United States", 5),
-        
-        # MEDIA & CONTENT (3)
-        'image_search': search_images("moving truck miami", 5),
-        'news_search': search_news("moving companies miami", MIAMI_LOCATION, "qdr:m", 3),
-        'shopping_search': search_shopping("moving boxes", MIAMI_LOCATION, 5),
-        
-        # JOB MARKET INTELLIGENCE (3)
-        'google_jobs': search_jobs("mover", MIAMI_LOCATION, 5),
-        'linkedin_jobs': search_linkedin_jobs("mover operations", MIAMI_LOCATION, 5),
-        'search_trends': get_search_trends("moving companies", "US-FL", "today 3-m"),
-        
-        # REVIEW PLATFORMS (3)
-        'yelp_businesses': search_yelp_businesses("moving companies", MIAMI_LOCATION, 5),
-        'tripadvisor': search_tripadvisor("storage facilities miami", MIAMI_LOCATION),
-        'keyword_volume': get_keyword_search_volume(MIAMI_KEYWORD, "United States"),
-        
-        # APP STORES (2)
-        'apple_apps': search_apple_apps("moving calculator", "us"),
-        'google_play_apps': search_google_play_apps("moving planner", "us"),
-        
-        # ECOMMERCE & PRICING (3)
-        'amazon_products': search_amazon_products("moving boxes"),
-        'walmart_products': search_walmart_products("moving boxes"),
-        'youtube_videos': search_youtube("moving companies miami tips", 5),
-        
-        # INNOVATION TRACKING (1)
-        'patents': search_patents("moving equipment innovation", 5)
-    }
+    """
+    Get ALL data at once (25+ APIs fetched concurrently)
+    
+    Query params:
+        source_timeout: Seconds a single source may take (default: FANOUT_SOURCE_TIMEOUT)
+        deadline: Seconds before unfinished sources are returned as timeouts (default: FANOUT_DEADLINE)
+    
+    Sources that fail or time out are returned with status 'error' / 'timeout'
+    alongside everything that finished; per-source timing is under 'fanout'.
+    """
+    from flask import request
+    
+    data, summary = run_fanout(
+        _all_data_tasks(),
+        source_timeout=request.args.get('source_timeout', type=float),
+        deadline=request.args.get('deadline', type=float)
+    )
+    data['fanout'] = summary
     return jsonify(data)
 
+@app.route('/api/all-data/stream')
+def api_all_data_stream():
+    """
+    Stream ALL data source by source as each API call completes
+    
+    Query params:
+        format: 'ndjson' (default) or 'sse' for Server-Sent Events
+        source_timeout: Seconds a single source may take (default: FANOUT_SOURCE_TIMEOUT)
+        deadline: Seconds before unfinished sources are sent as timeouts (default: FANOUT_DEADLINE)
+    
+    Each source is sent as {"event": "source", "source", "status", "elapsed_ms", "data"}
+    in completion order, followed by one {"event": "complete", "fanout": summary}.
+    """
+    from flask import request
+    
+    use_sse = request.args.get('format', 'ndjson').lower() == 'sse'
+    source_timeout = request.args.get('source_timeout', type=float)
+    deadline = request.args.get('deadline', type=float)
+    tasks = _all_data_tasks()
+    
+    def frame(message):
+        payload = json.dumps(message, default=str)
+        if use_sse:
+            return f"event: {message['event']}\ndata: {payload}\n\n"
+        return payload + "\n"
+    
+    def generate():
+        start = time.monotonic()
+        sources = {}
+        for name, result, elapsed in iter_fanout(tasks, source_timeout, deadline):
+            sources[name] = {"status": source_status(result), "elapsed_ms": elapsed}
+            yield frame({
+                "event": "source",
+                "source": name,
+                "status": sources[name]["status"],
+                "elapsed_ms": elapsed,
+                "data": result
+            })
+        summary = summarize_fanout(list(tasks), sources, int((time.monotonic() - start) * 1000),
+                                   source_timeout, deadline)
+        yield frame({"event": "complete", "fanout": summary})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream' if use_sse else 'application/x-ndjson',
+        headers={
+            # Keep proxies from buffering the stream so each source arrives immediately
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
 # NEW SEARCH ENGINES & ANALYTICS ENDPOINTS
 
 @app.route('/api/bing-search')
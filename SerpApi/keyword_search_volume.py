@@ -7,8 +7,34 @@ import os
 import requests
 from typing import Dict, Optional
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_keyword_search_volume_params(keyword: str, location: str = "United States") -> Dict:
+    """Build SerpApi request parameters for get_keyword_search_volume"""
+    params = {
+        "engine": "google_trends",
+        "q": keyword,
+        "api_key": SERPAPI_API_KEY,
+        "data_type": "TIMESERIES",
+        "geo": location
+    }
+    
+    return params
+
+def parse_keyword_search_volume(data: Dict, keyword: str, location: str = "United States") -> Dict:
+    """Convert a raw SerpApi response into the get_keyword_search_volume result dict"""
+    # Extract relevant volume data
+    result = {
+        "keyword": keyword,
+        "location": location,
+        "status": "success",
+        "data": data
+    }
+    
+    return result
+
 def get_keyword_search_volume(keyword: str, location: str = "United States") -> Dict:
     """
     Get search volume for a keyword in a specific location
@@ -21,31 +47,8 @@ def get_keyword_search_volume(keyword: str, location: str = "United States") ->
         Dict with search volume data
     """
     try:
-        # SerpApi Google Trends endpoint for search volume
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_trends",
-            "q": keyword,
-            "api_key": SERPAPI_API_KEY,
-            "data_type": "TIMESERIES",
-            "geo": location
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract relevant volume data
-        result = {
-            "keyword": keyword,
-            "location": location,
-            "status": "success",
-            "data": data
-        }
-        
-        return result
+        data = serpapi_get(build_keyword_search_volume_params(keyword, location))
+        return parse_keyword_search_volume(data, keyword, location)
         
     except requests.exceptions.RequestException as e:
         return {
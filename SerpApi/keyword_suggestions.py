@@ -7,8 +7,39 @@ import os
 import requests
 from typing import Dict, List, Optional
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_keyword_suggestions_params(seed_keyword: str, location: str = None) -> Dict:
+    """Build SerpApi request parameters for get_keyword_suggestions"""
+    params = {
+        "engine": "google_autocomplete",
+        "q": seed_keyword,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    if location:
+        params["gl"] = location
+    
+    return params
+
+def parse_keyword_suggestions(data: Dict, seed_keyword: str, location: str = None) -> Dict:
+    """Convert a raw SerpApi response into the get_keyword_suggestions result dict"""
+    # Extract suggestions
+    suggestions = data.get("suggestions", [])
+    
+    result = {
+        "seed_keyword": seed_keyword,
+        "location": location,
+        "suggestions": [s.get("value") for s in suggestions if "value" in s],
+        "total_suggestions": len(suggestions),
+        "status": "success",
+        "raw_data": data
+    }
+    
+    return result
+
 def get_keyword_suggestions(seed_keyword: str, location: str = None) -> Dict:
     """
     Get keyword suggestions based on a seed keyword
@@ -21,35 +52,8 @@ def get_keyword_suggestions(seed_keyword: str, location: str = None) -> Dict:
         Dict with keyword suggestions
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_autocomplete",
-            "q": seed_keyword,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        if location:
-            params["gl"] = location
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract suggestions
-        suggestions = data.get("suggestions", [])
-        
-        result = {
-            "seed_keyword": seed_keyword,
-            "location": location,
-            "suggestions": [s.get("value") for s in suggestions if "value" in s],
-            "total_suggestions": len(suggestions),
-            "status": "success",
-            "raw_data": data
-        }
-        
-        return result
+        data = serpapi_get(build_keyword_suggestions_params(seed_keyword, location))
+        return parse_keyword_suggestions(data, seed_keyword, location)
         
     except requests.exceptions.RequestException as e:
         return {
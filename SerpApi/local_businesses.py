@@ -7,8 +7,58 @@ import os
 import requests
 from typing import Dict, List
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_local_businesses_params(query: str, location: str, num_results: int = 20) -> Dict:
+    """Build SerpApi request parameters for search_local_businesses"""
+    params = {
+        "engine": "google_maps",
+        "q": query,
+        "ll": "@25.7617,-80.1918,15z",  # Miami coordinates
+        "api_key": SERPAPI_API_KEY,
+        "type": "search",
+        "num": num_results
+    }
+    
+    return params
+
+def parse_local_businesses(data: Dict, query: str, location: str, num_results: int = 20) -> Dict:
+    """Convert a raw SerpApi response into the search_local_businesses result dict"""
+    # Extract local business results
+    businesses = []
+    for item in data.get("local_results", []):
+        businesses.append({
+            "position": item.get("position", 0),
+            "title": item.get("title", ""),
+            "place_id": item.get("place_id", ""),
+            "data_id": item.get("data_id", ""),
+            "rating": item.get("rating", 0),
+            "reviews": item.get("reviews", 0),
+            "price": item.get("price", ""),
+            "type": item.get("type", ""),
+            "types": item.get("types", []),
+            "address": item.get("address", ""),
+            "phone": item.get("phone", ""),
+            "website": item.get("website", ""),
+            "hours": item.get("hours", ""),
+            "service_options": item.get("service_options", {}),
+            "gps_coordinates": item.get("gps_coordinates", {}),
+            "thumbnail": item.get("thumbnail", "")
+        })
+    
+    result = {
+        "query": query,
+        "location": location,
+        "total_results": len(businesses),
+        "businesses": businesses,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_local_businesses(query: str, location: str, num_results: int = 20) -> Dict:
     """
     Search for local businesses in a specific area using Google Maps
@@ -22,55 +72,8 @@ def search_local_businesses(query: str, location: str, num_results: int = 20) ->
         Dict with local business results
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        # Use ll parameter with proper @ format for Google Maps
-        params = {
-            "engine": "google_maps",
-            "q": query,
-            "ll": "@25.7617,-80.1918,15z",  # Miami coordinates
-            "api_key": SERPAPI_API_KEY,
-            "type": "search",
-            "num": num_results
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract local business results
-        businesses = []
-        for item in data.get("local_results", []):
-            businesses.append({
-                "position": item.get("position", 0),
-                "title": item.get("title", ""),
-                "place_id": item.get("place_id", ""),
-                "data_id": item.get("data_id", ""),
-                "rating": item.get("rating", 0),
-                "reviews": item.get("reviews", 0),
-                "price": item.get("price", ""),
-                "type": item.get("type", ""),
-                "types": item.get("types", []),
-                "address": item.get("address", ""),
-                "phone": item.get("phone", ""),
-                "website": item.get("website", ""),
-                "hours": item.get("hours", ""),
-                "service_options": item.get("service_options", {}),
-                "gps_coordinates": item.get("gps_coordinates", {}),
-                "thumbnail": item.get("thumbnail", "")
-            })
-        
-        result = {
-            "query": query,
-            "location": location,
-            "total_results": len(businesses),
-            "businesses": businesses,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_local_businesses_params(query, location, num_results))
+        return parse_local_businesses(data, query, location, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -5,10 +5,12 @@ Combines data from multiple APIs to create marketing intelligence
 """
 
 import os
-import sqlite3
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+from DB.analytics_db import analytics_connection
+from DB.duckdb_mirror import get_mirror
+
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'DB', 'serpapi_data.db')
 
@@ -17,8 +19,20 @@ class MarketingAnalytics:
         self.db_path = DB_PATH
     
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """
+        Get a read-only connection for the analyses
+        
+        Uses the DuckDB mirror when SERPAPI_DUCKDB_MIRROR is set (synced at most
+        every SERPAPI_DUCKDB_SYNC_SECONDS), otherwise a SQLite snapshot
+        connection that never blocks or waits on ingestion.
+        """
+        mirror = get_mirror(self.db_path)
+        if mirror is not None:
+            try:
+                return mirror.cursor()
+            except Exception as e:
+                print(f"Warning: DuckDB mirror unavailable, using SQLite: {e}")
+        return analytics_connection(self.db_path)
     
     def get_market_penetration_analysis(self) -> Dict:
         """
@@ -261,37 +275,53 @@ class MarketingAnalytics:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Get shopping products
+            # Aggregate in the database instead of loading every product into Python
             cursor.execute("""
-                SELECT product_name, price, rating, source
+                SELECT COUNT(*),
+                       AVG(extracted_price),
+                       MIN(extracted_price),
+                       MAX(extracted_price),
+                       SUM(CASE WHEN extracted_price < 10 THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN extracted_price >= 10 AND extracted_price < 50 THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN extracted_price >= 50 THEN 1 ELSE 0 END)
                 FROM shopping_products 
-                WHERE price IS NOT NULL AND price > 0
-                ORDER BY price ASC
+                WHERE extracted_price IS NOT NULL AND extracted_price > 0
             """)
-            products = cursor.fetchall()
+            total_products, avg_price, min_price, max_price, budget, mid_range, premium = cursor.fetchone()
             
-            if not products:
+            if not total_products:
+                conn.close()
                 return {
                     "status": "success",
                     "analysis_type": "pricing_intelligence",
                     "message": "No product pricing data available"
                 }
             
-            # Calculate pricing metrics
-            prices = [float(p[1]) for p in products if p[1]]
-            avg_price = sum(prices) / len(prices) if prices else 0
-            min_price = min(prices) if prices else 0
-            max_price = max(prices) if prices else 0
+            cursor.execute("""
+                SELECT extracted_price
+                FROM shopping_products 
+                WHERE extracted_price IS NOT NULL AND extracted_price > 0
+                ORDER BY extracted_price ASC
+                LIMIT 1 OFFSET ?
+            """, (total_products // 2,))
+            median_price = cursor.fetchone()[0]
             
             # Price ranges
             price_ranges = {
-                "budget": len([p for p in prices if p < 10]),
-                "mid_range": len([p for p in prices if 10 <= p < 50]),
-                "premium": len([p for p in prices if p >= 50])
+                "budget": int(budget or 0),
+                "mid_range": int(mid_range or 0),
+                "premium": int(premium or 0)
             }
             
             # Top products by rating
-            top_rated = sorted(products, key=lambda x: x[2] or 0, reverse=True)[:5]
+            cursor.execute("""
+                SELECT title, price, rating, source
+                FROM shopping_products 
+                WHERE extracted_price IS NOT NULL AND extracted_price > 0
+                ORDER BY COALESCE(rating, 0) DESC, extracted_price ASC
+                LIMIT 5
+            """)
+            top_rated = cursor.fetchall()
             
             conn.close()
             
@@ -299,10 +329,10 @@ class MarketingAnalytics:
                 "status": "success",
                 "analysis_type": "pricing_intelligence",
                 "pricing_metrics": {
-                    "total_products": len(products),
+                    "total_products": total_products,
                     "average_price": round(avg_price, 2),
                     "price_range": f"${min_price:.2f} - ${max_price:.2f}",
-                    "median_price": round(sorted(prices)[len(prices)//2], 2) if prices else 0
+                    "median_price": round(median_price, 2)
                 },
                 "price_distribution": price_ranges,
                 "top_rated_products": [
@@ -0,0 +1,190 @@
+"""
+SerpApi - Lazy Pagination
+Generators that walk SerpApi result pages on demand, reusing each engine's
+build/parse functions, with optional background prefetch and early stopping
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+
+from serpapi_client import serpapi_get
+from google_search import build_google_search_params, parse_google_search
+from local_businesses import build_local_businesses_params, parse_local_businesses
+from yelp_search import build_yelp_businesses_params, parse_yelp_businesses
+from google_jobs import build_jobs_params, parse_jobs
+
+# Results per page for offset-paginated engines
+GOOGLE_PAGE_SIZE = 10
+GOOGLE_MAPS_PAGE_SIZE = 20
+YELP_PAGE_SIZE = 10
+
+# Safety cap on pages fetched by a single iterator
+DEFAULT_MAX_PAGES = 50
+
+NextParams = Callable[[Dict, Dict], Optional[Dict]]
+
+def iter_pages(params: Dict, next_params: NextParams, prefetch: bool = False,
+               max_pages: int = None) -> Iterator[Dict]:
+    """
+    Yield raw SerpApi pages, fetching each one only when the consumer asks for it
+
+    Args:
+        params: Request parameters for the first page
+        next_params: Given (params, data) of a page, return the params for the next
+            page or None when there are no more pages
+        prefetch: Fetch the next page in the background while the current one
+            is being consumed. The request starts as soon as the current page
+            is yielded and cannot be called off once it is running, so stopping
+            early (limit, stop_when, close()) still pays for one unread page.
+            Leave it off when the consumer usually stops within a page.
+        max_pages: Maximum number of pages to fetch (default: DEFAULT_MAX_PAGES)
+
+    Raises:
+        requests.exceptions.RequestException on network or HTTP errors
+    """
+    max_pages = max_pages or DEFAULT_MAX_PAGES
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") if prefetch else None
+    pending = None
+
+    try:
+        data = serpapi_get(params)
+        for page_number in range(1, max_pages + 1):
+            following = next_params(params, data) if page_number < max_pages else None
+            if following is not None and executor is not None:
+                pending = executor.submit(serpapi_get, following)
+
+            yield data
+
+            if following is None:
+                return
+            params = following
+            data = pending.result() if pending is not None else serpapi_get(params)
+            pending = None
+    finally:
+        # A prefetch that has not started yet is dropped; one already running
+        # completes in the background and its credit is spent
+        if executor is not None:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+def iter_items(pages: Iterator[Dict], extract: Callable[[Dict], List[Dict]],
+               limit: int = None, stop_when: Callable[[Dict], bool] = None) -> Iterator[Dict]:
+    """
+    Flatten pages into items, stopping (and fetching nothing further) early
+
+    Args:
+        pages: Page iterator from iter_pages()
+        extract: Returns the parsed items of one raw page
+        limit: Stop after this many items
+        stop_when: Stop after the first item for which this returns True
+    """
+    count = 0
+    try:
+        for data in pages:
+            for item in extract(data):
+                yield item
+                count += 1
+                if (limit is not None and count >= limit) or (stop_when is not None and stop_when(item)):
+                    return
+    finally:
+        pages.close()
+
+def until_domain(domain: str, field: str = "link") -> Callable[[Dict], bool]:
+    """Stop condition: the item's link (or other URL field) contains domain"""
+    return lambda item: domain in (item.get(field) or "")
+
+def _offset_pager(page_size: int, results_key: str) -> NextParams:
+    """Next-page builder for engines paginated with a 'start' offset"""
+    def next_params(params: Dict, data: Dict) -> Optional[Dict]:
+        if not data.get(results_key) or not data.get("serpapi_pagination", {}).get("next"):
+            return None
+        return {**params, "start": params.get("start", 0) + page_size}
+    return next_params
+
+def _jobs_pager(params: Dict, data: Dict) -> Optional[Dict]:
+    """Next-page builder for google_jobs, which paginates with next_page_token"""
+    token = data.get("serpapi_pagination", {}).get("next_page_token")
+    if not data.get("jobs_results") or not token:
+        return None
+    return {**params, "next_page_token": token}
+
+# ============================================================================
+# ENGINE ITERATORS
+# ============================================================================
+
+def iter_google_results(query: str, location: str = None, limit: int = None,
+                        stop_when: Callable[[Dict], bool] = None,
+                        prefetch: bool = False, max_pages: int = None) -> Iterator[Dict]:
+    """
+    Iterate Google organic results across pages
+
+    Yields:
+        Organic result dicts shaped like google_search()['organic_results']
+    """
+    params = build_google_search_params(query, location, GOOGLE_PAGE_SIZE)
+    pages = iter_pages(params, _offset_pager(GOOGLE_PAGE_SIZE, "organic_results"), prefetch, max_pages)
+    return iter_items(
+        pages,
+        lambda data: parse_google_search(data, query, location)["organic_results"],
+        limit, stop_when
+    )
+
+def iter_local_businesses(query: str, location: str, limit: int = None,
+                          stop_when: Callable[[Dict], bool] = None,
+                          prefetch: bool = False, max_pages: int = None) -> Iterator[Dict]:
+    """
+    Iterate Google Maps local listings across pages
+
+    Yields:
+        Business dicts shaped like search_local_businesses()['businesses']
+    """
+    params = build_local_businesses_params(query, location, GOOGLE_MAPS_PAGE_SIZE)
+    pages = iter_pages(params, _offset_pager(GOOGLE_MAPS_PAGE_SIZE, "local_results"), prefetch, max_pages)
+    return iter_items(
+        pages,
+        lambda data: parse_local_businesses(data, query, location)["businesses"],
+        limit, stop_when
+    )
+
+def iter_yelp_businesses(query: str, location: str, limit: int = None,
+                         stop_when: Callable[[Dict], bool] = None,
+                         prefetch: bool = False, max_pages: int = None) -> Iterator[Dict]:
+    """
+    Iterate Yelp business listings across pages
+
+    Yields:
+        Business dicts shaped like search_yelp_businesses()['businesses']
+    """
+    params = build_yelp_businesses_params(query, location)
+    pages = iter_pages(params, _offset_pager(YELP_PAGE_SIZE, "organic_results"), prefetch, max_pages)
+    return iter_items(
+        pages,
+        lambda data: parse_yelp_businesses(
+            data, query, location, len(data.get("organic_results", []))
+        )["businesses"],
+        limit, stop_when
+    )
+
+def iter_jobs(query: str, location: str, limit: int = None,
+              stop_when: Callable[[Dict], bool] = None,
+              prefetch: bool = False, max_pages: int = None) -> Iterator[Dict]:
+    """
+    Iterate Google Jobs listings across pages
+
+    Yields:
+        Job dicts shaped like search_jobs()['jobs']
+    """
+    params = build_jobs_params(query, location)
+    pages = iter_pages(params, _jobs_pager, prefetch, max_pages)
+    return iter_items(
+        pages,
+        lambda data: parse_jobs(data, query, location, len(data.get("jobs_results", [])))["jobs"],
+        limit, stop_when
+    )
+
+if __name__ == "__main__":
+    # Example usage
+    print("Testing lazy pagination...")
+    for business in iter_local_businesses("moving companies", "Miami, FL", limit=45, prefetch=True):
+        print(f"{business['position']}. {business['title']}")
@@ -7,8 +7,44 @@ import os
 import requests
 from typing import Dict, List
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_people_also_ask_params(keyword: str) -> Dict:
+    """Build SerpApi request parameters for get_people_also_ask"""
+    params = {
+        "engine": "google",
+        "q": keyword,
+        "api_key": SERPAPI_API_KEY,
+        "num": 10
+    }
+    
+    return params
+
+def parse_people_also_ask(data: Dict, keyword: str) -> Dict:
+    """Convert a raw SerpApi response into the get_people_also_ask result dict"""
+    # Extract People Also Ask data
+    paa = data.get("related_questions", [])
+    
+    questions_list = []
+    for item in paa:
+        questions_list.append({
+            "question": item.get("question", ""),
+            "answer": item.get("snippet", ""),
+            "title": item.get("title", ""),
+            "link": item.get("link", "")
+        })
+    
+    result = {
+        "keyword": keyword,
+        "total_questions": len(questions_list),
+        "questions": questions_list,
+        "status": "success"
+    }
+    
+    return result
+
 def get_people_also_ask(keyword: str) -> Dict:
     """
     Get People Also Ask questions related to a keyword
@@ -20,40 +56,8 @@ def get_people_also_ask(keyword: str) -> Dict:
         Dict with People Also Ask questions and answers
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google",
-            "q": keyword,
-            "api_key": SERPAPI_API_KEY,
-            "num": 10
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract People Also Ask data
-        paa = data.get("related_questions", [])
-        
-        questions_list = []
-        for item in paa:
-            questions_list.append({
-                "question": item.get("question", ""),
-                "answer": item.get("snippet", ""),
-                "title": item.get("title", ""),
-                "link": item.get("link", "")
-            })
-        
-        result = {
-            "keyword": keyword,
-            "total_questions": len(questions_list),
-            "questions": questions_list,
-            "status": "success"
-        }
-        
-        return result
+        data = serpapi_get(build_people_also_ask_params(keyword))
+        return parse_people_also_ask(data, keyword)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -0,0 +1,314 @@
+"""
+SerpApi - Rate Limiter & Credit Budget
+Process-wide per-engine token buckets plus daily/monthly credit budgets,
+enforced for every request made through the shared clients
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+# Limiter defaults (override via environment)
+DEFAULT_RATE_PER_SECOND = float(os.getenv('SERPAPI_RATE_PER_SECOND', '5'))
+DEFAULT_BURST = int(os.getenv('SERPAPI_RATE_BURST', '10'))
+DEFAULT_MAX_WAIT = float(os.getenv('SERPAPI_RATE_MAX_WAIT', '30'))
+DEFAULT_DAILY_CREDITS = int(os.getenv('SERPAPI_DAILY_CREDITS', '0'))  # 0 = unlimited
+DEFAULT_MONTHLY_CREDITS = int(os.getenv('SERPAPI_MONTHLY_CREDITS', '0'))  # 0 = unlimited
+DEFAULT_USAGE_SYNC_SECONDS = float(os.getenv('SERPAPI_USAGE_SYNC_SECONDS', '60'))
+
+def _parse_engine_rates(spec: str) -> Dict[str, float]:
+    """Parse 'google=5,google_maps=2' into {'google': 5.0, 'google_maps': 2.0}"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        engine, _, rate = item.partition('=')
+        rates[engine.strip()] = float(rate)
+    return rates
+
+# Per-engine requests/second overrides, e.g. SERPAPI_ENGINE_RATES="google=5,google_maps=2"
+DEFAULT_ENGINE_RATES = _parse_engine_rates(os.getenv('SERPAPI_ENGINE_RATES', ''))
+
+class RateLimitError(requests.exceptions.RequestException):
+    """Request refused locally before reaching SerpApi"""
+
+class RateLimited(RateLimitError):
+    """The engine's request rate would have required waiting longer than allowed"""
+
+class BudgetExceeded(RateLimitError):
+    """The daily or monthly SerpApi credit budget is used up"""
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking
+
+    reserve() takes a token immediately and returns how long the caller must
+    wait before using it, so sync callers can time.sleep() and async callers
+    can asyncio.sleep() on the same bucket. Waiting callers are served in
+    reservation order.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1, max_wait: float = None) -> Optional[float]:
+        """
+        Reserve tokens
+
+        Returns:
+            Seconds to wait before proceeding, or None if that would exceed max_wait
+            (in which case nothing is reserved)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    def refund(self, tokens: float = 1):
+        """Give back tokens of a reservation that will not be used"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+class CreditBudget:
+    """
+    Daily and monthly credit budgets
+
+    Usage is what the usage loader last reported (normally
+    SUM(api_credits_used) from api_calls, which includes other processes)
+    plus what this process has spent since that load. Each sync folds this
+    process's spending into the logged figure and restarts the count, so
+    several processes sharing a budget cannot hide each other's calls. The
+    loader runs outside the lock; callers arriving meanwhile use the
+    previous figures. Without a loader, usage is this process's spending.
+    """
+
+    def __init__(self, daily_limit: int = None, monthly_limit: int = None,
+                 usage_loader: Callable[[datetime], int] = None,
+                 sync_seconds: float = None):
+        """
+        Args:
+            daily_limit: Credits allowed per calendar day (0/None = unlimited)
+            monthly_limit: Credits allowed per calendar month (0/None = unlimited)
+            usage_loader: Callable returning credits used since a given datetime
+            sync_seconds: How often usage is re-read through usage_loader
+        """
+        self.daily_limit = daily_limit if daily_limit is not None else DEFAULT_DAILY_CREDITS
+        self.monthly_limit = monthly_limit if monthly_limit is not None else DEFAULT_MONTHLY_CREDITS
+        self.usage_loader = usage_loader
+        self.sync_seconds = sync_seconds or DEFAULT_USAGE_SYNC_SECONDS
+
+        self._lock = threading.Lock()
+        self._day = self._month = None
+        # Credits charged since usage was last loaded
+        self._unsynced_day = self._unsynced_month = 0
+        self._logged_day = self._logged_month = 0
+        self._synced_at = 0.0
+        self._syncing = False
+
+    def _roll_windows(self, now: datetime):
+        """Reset counters when a new day or month starts"""
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        month_start = day_start.replace(day=1)
+        if self._day != day_start:
+            self._day, self._unsynced_day, self._logged_day = day_start, 0, 0
+            self._synced_at = 0.0
+        if self._month != month_start:
+            self._month, self._unsynced_month, self._logged_month = month_start, 0, 0
+            self._synced_at = 0.0
+
+    def _sync(self):
+        """Re-read logged usage if it is older than sync_seconds (call without holding the lock)"""
+        with self._lock:
+            self._roll_windows(datetime.now())
+            if (self.usage_loader is None or self._syncing
+                    or time.monotonic() - self._synced_at < self.sync_seconds):
+                return
+            self._syncing = True
+            day, month = self._day, self._month
+            # Charges made before the load are in its figures; later ones are not
+            charged_day, charged_month = self._unsynced_day, self._unsynced_month
+
+        logged = None
+        try:
+            logged = (self.usage_loader(day), self.usage_loader(month))
+        except Exception as e:
+            print(f"Warning: Could not load SerpApi credit usage: {e}")
+
+        with self._lock:
+            self._syncing = False
+            # A window that rolled over while loading is re-read on the next call
+            if (self._day, self._month) == (day, month):
+                if logged is not None:
+                    self._logged_day, self._logged_month = logged
+                    self._unsynced_day -= charged_day
+                    self._unsynced_month -= charged_month
+                self._synced_at = time.monotonic()
+
+    def _used(self):
+        return (self._logged_day + self._unsynced_day,
+                self._logged_month + self._unsynced_month)
+
+    def charge(self, credits: int = 1):
+        """
+        Spend credits, refusing if either budget would be exceeded
+
+        Raises:
+            BudgetExceeded if the daily or monthly budget cannot cover the request
+        """
+        self._sync()
+        with self._lock:
+            self._roll_windows(datetime.now())
+            used_day, used_month = self._used()
+
+            if self.daily_limit and used_day + credits > self.daily_limit:
+                raise BudgetExceeded(f"Daily SerpApi credit budget exhausted ({used_day}/{self.daily_limit})")
+            if self.monthly_limit and used_month + credits > self.monthly_limit:
+                raise BudgetExceeded(f"Monthly SerpApi credit budget exhausted ({used_month}/{self.monthly_limit})")
+
+            self._unsynced_day += credits
+            self._unsynced_month += credits
+
+    def remaining(self) -> Optional[int]:
+        """Credits left under the tighter budget (None when unlimited)"""
+        self._sync()
+        with self._lock:
+            self._roll_windows(datetime.now())
+            used_day, used_month = self._used()
+        left = [limit - used for limit, used in ((self.daily_limit, used_day),
+                                                 (self.monthly_limit, used_month)) if limit]
+        return max(0, min(left)) if left else None
+
+    def stats(self) -> Dict:
+        remaining = self.remaining()
+        with self._lock:
+            used_day, used_month = self._used()
+        return {
+            'daily_limit': self.daily_limit or None,
+            'monthly_limit': self.monthly_limit or None,
+            'used_today': used_day,
+            'used_this_month': used_month,
+            'remaining': remaining
+        }
+
+class RateLimiter:
+    """
+    Per-engine token buckets in front of a shared credit budget
+
+    Every SerpApi request costs one credit regardless of engine, so there is a
+    single budget; request rates are limited per engine.
+    """
+
+    def __init__(self, default_rate: float = None, burst: int = None,
+                 engine_rates: Dict[str, float] = None, max_wait: float = None,
+                 budget: CreditBudget = None):
+        self.default_rate = default_rate or DEFAULT_RATE_PER_SECOND
+        self.burst = burst or DEFAULT_BURST
+        self.engine_rates = dict(DEFAULT_ENGINE_RATES if engine_rates is None else engine_rates)
+        self.max_wait = max_wait if max_wait is not None else DEFAULT_MAX_WAIT
+        self.budget = budget or CreditBudget()
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'waited': 0, 'rate_limited': 0, 'budget_refused': 0}
+
+    def _bucket(self, engine: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(engine)
+            if bucket is None:
+                rate = self.engine_rates.get(engine, self.default_rate)
+                bucket = self._buckets[engine] = TokenBucket(rate, self.burst)
+            return bucket
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def reserve(self, engine: str, credits: int = 1, max_wait: float = None) -> float:
+        """
+        Admit one request for an engine
+
+        Returns:
+            Seconds the caller must wait before sending the request
+
+        Raises:
+            RateLimited if the wait would exceed max_wait
+            BudgetExceeded if the credit budget is used up
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        bucket = self._bucket(engine or 'unknown')
+        wait = bucket.reserve(1, max_wait)
+        if wait is None:
+            self._count('rate_limited')
+            raise RateLimited(f"SerpApi rate limit for engine '{engine}' would require waiting over {max_wait:g}s")
+
+        try:
+            self.budget.charge(credits)
+        except BudgetExceeded:
+            # The request is not sent, so it must not use up the engine's rate
+            bucket.refund(1)
+            self._count('budget_refused')
+            raise
+
+        self._count('requests')
+        if wait > 0:
+            self._count('waited')
+        return wait
+
+    def acquire(self, engine: str, credits: int = 1, max_wait: float = None):
+        """Admit one request, sleeping until the engine's rate allows it"""
+        wait = self.reserve(engine, credits, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._counters)
+            engines = {engine: {'rate_per_second': bucket.rate,
+                                'tokens_available': round(bucket.available, 2)}
+                       for engine, bucket in self._buckets.items()}
+        stats['default_rate_per_second'] = self.default_rate
+        stats['max_wait_seconds'] = self.max_wait
+        stats['engines'] = engines
+        stats['budget'] = self.budget.stats()
+        return stats
+
+# Singleton instance
+_limiter_instance = None
+_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """Get shared rate limiter instance"""
+    global _limiter_instance
+    if _limiter_instance is None:
+        with _limiter_lock:
+            if _limiter_instance is None:
+                _limiter_instance = RateLimiter()
+    return _limiter_instance
+
+def configure_rate_limiter(usage_loader: Callable[[datetime], int] = None,
+                           daily_limit: int = None, monthly_limit: int = None,
+                           **limiter_options) -> RateLimiter:
+    """Replace the shared limiter, e.g. to feed the credit budget from api_calls"""
+    global _limiter_instance
+    budget = CreditBudget(daily_limit, monthly_limit, usage_loader)
+    with _limiter_lock:
+        _limiter_instance = RateLimiter(budget=budget, **limiter_options)
+    return _limiter_instance
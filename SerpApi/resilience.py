@@ -0,0 +1,143 @@
+"""
+SerpApi - Retry & Circuit Breaker
+Jittered exponential backoff for transient upstream failures and a
+per-engine circuit breaker that fails fast while an engine is down
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+# Retry defaults (override via environment)
+DEFAULT_MAX_RETRIES = int(os.getenv('SERPAPI_MAX_RETRIES', '2'))
+DEFAULT_BACKOFF_BASE = float(os.getenv('SERPAPI_BACKOFF_BASE', '0.5'))
+DEFAULT_BACKOFF_MAX = float(os.getenv('SERPAPI_BACKOFF_MAX', '8'))
+
+# Circuit breaker defaults (override via environment)
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv('SERPAPI_BREAKER_THRESHOLD', '5'))
+DEFAULT_RESET_TIMEOUT = float(os.getenv('SERPAPI_BREAKER_RESET', '30'))
+
+# HTTP statuses worth retrying: rate limited or a transient server-side failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """The engine's circuit breaker is open; the request was not sent"""
+
+def is_retryable_status(status: int) -> bool:
+    return status in RETRYABLE_STATUSES
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None,
+                  base: float = None, cap: float = None) -> float:
+    """
+    Seconds to wait before retry number attempt (0-based)
+
+    Uses "full jitter" (uniform between 0 and base * 2^attempt, capped) so
+    concurrent callers do not retry in lockstep. A numeric Retry-After header
+    from SerpApi takes precedence when present.
+    """
+    cap = cap or DEFAULT_BACKOFF_MAX
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, (base or DEFAULT_BACKOFF_BASE) * (2 ** attempt)))
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; open -> half-open
+    after reset_timeout, when a single probe request is let through. A successful
+    probe closes the breaker, a failed one reopens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = None, reset_timeout: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or DEFAULT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or DEFAULT_RESET_TIMEOUT
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error = None
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Admit a request or fail fast
+
+        Raises:
+            CircuitOpenError while the breaker is open (or a probe is already running)
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(
+                        f"Circuit open for engine '{self.name}' after {self._failures} failures "
+                        f"(last error: {self._last_error})"
+                    )
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(f"Circuit half-open for engine '{self.name}'; probe in progress")
+                self._probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Exception = None):
+        with self._lock:
+            self._failures += 1
+            self._last_error = str(error) if error else None
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self):
+        """End a call that neither succeeded nor counts as an engine failure"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def state(self) -> Dict:
+        with self._lock:
+            state = {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'last_error': self._last_error
+            }
+            if self._state == self.OPEN:
+                state['retry_in_seconds'] = round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 1)
+            return state
+
+# Breakers by engine name
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(engine: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for an engine"""
+    engine = engine or 'unknown'
+    with _breakers_lock:
+        breaker = _breakers.get(engine)
+        if breaker is None:
+            breaker = _breakers[engine] = CircuitBreaker(engine)
+        return breaker
+
+def breaker_states() -> Dict[str, Dict]:
+    """State of every engine's circuit breaker (for /api/status)"""
+    with _breakers_lock:
+        breakers = list(_breakers.items())
+    return {engine: breaker.state() for engine, breaker in breakers}
@@ -0,0 +1,217 @@
+"""
+SerpApi - Response Cache
+Two-tier cache for API responses: an in-process LRU in front of the SQLite
+response_cache table, keyed by endpoint, engine function and all parameters
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+# Cache defaults (override via environment)
+DEFAULT_TTL_SECONDS = float(os.getenv('RESPONSE_CACHE_TTL', '900'))
+DEFAULT_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '512'))
+DEFAULT_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+class CacheEntry(NamedTuple):
+    """A cached response and when it was stored"""
+    data: Dict
+    created_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+def make_cache_key(endpoint: str, function: Callable, args: tuple, kwargs: Dict) -> str:
+    """
+    Build a cache key from everything that determines an API response
+
+    The engine function's module and name are part of the key, so two endpoints
+    called with the same query string never share an entry.
+    """
+    function_name = f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', repr(function))}"
+    payload = json.dumps([endpoint, function_name, list(args), sorted(kwargs.items())],
+                         default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """
+    In-process LRU with TTL and size-based eviction, backed by SQLite
+
+    Memory hits cost a dict lookup; memory misses fall through to the
+    response_cache table and are promoted back into memory. Entries older than
+    ttl_seconds are never returned from either tier.
+    """
+
+    def __init__(self, db=None, ttl_seconds: float = None, max_entries: int = None,
+                 max_bytes: int = None):
+        """
+        Args:
+            db: SerpApiDB used as the persistent tier (None keeps the cache in memory only)
+            ttl_seconds: Maximum age of a returned entry
+            max_entries: Maximum number of entries held in memory
+            max_bytes: Maximum total JSON size of entries held in memory
+        """
+        self.db = db
+        self.ttl_seconds = ttl_seconds or DEFAULT_TTL_SECONDS
+        self.max_entries = max_entries or DEFAULT_MAX_ENTRIES
+        self.max_bytes = max_bytes or DEFAULT_MAX_BYTES
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            'memory_hits': 0,
+            'db_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'db_errors': 0
+        }
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _remember(self, key: str, entry: CacheEntry, size: int):
+        """Insert into the memory tier and evict least recently used entries"""
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (entry, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._counters['evictions'] += 1
+
+    def _from_memory(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, size = item
+            if entry.age_seconds >= self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def get(self, key: str, max_age_seconds: float = None) -> Optional[CacheEntry]:
+        """
+        Look up a response
+
+        Args:
+            key: Key from make_cache_key()
+            max_age_seconds: Only return entries younger than this (default: ttl_seconds)
+
+        Returns:
+            CacheEntry or None on a miss
+        """
+        max_age = min(max_age_seconds or self.ttl_seconds, self.ttl_seconds)
+
+        entry = self._from_memory(key)
+        if entry is not None:
+            # The memory tier always holds the newest copy, so the DB cannot do better
+            if entry.age_seconds < max_age:
+                self._count('memory_hits')
+                return entry
+        elif self.db is not None:
+            try:
+                cached = self.db.get_cached_response(key)
+            except Exception as e:
+                print(f"Warning: Response cache lookup failed: {e}")
+                self._count('db_errors')
+                cached = None
+
+            if cached:
+                entry = CacheEntry(cached['data'], cached['created_at'])
+                if entry.age_seconds < self.ttl_seconds:
+                    self._remember(key, entry, len(json.dumps(entry.data, default=str)))
+                if entry.age_seconds < max_age:
+                    self._count('db_hits')
+                    return entry
+
+        self._count('misses')
+        return None
+
+    def get_latest(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the newest stored copy regardless of age
+
+        Used as a last resort when a fresh call is not possible (e.g. the
+        credit budget is exhausted); not counted as a hit or miss.
+        """
+        with self._lock:
+            item = self._entries.get(key)
+        if item is not None:
+            return item[0]
+
+        if self.db is not None:
+            try:
+                cached = self.db.get_cached_response(key)
+            except Exception as e:
+                print(f"Warning: Response cache lookup failed: {e}")
+                self._count('db_errors')
+                return None
+            if cached:
+                return CacheEntry(cached['data'], cached['created_at'])
+
+        return None
+
+    def set(self, key: str, data: Dict, endpoint: str, query: str = None,
+            location: str = None, memory_only: bool = False) -> CacheEntry:
+        """
+        Store a response in both tiers
+
+        Args:
+            memory_only: Skip the persistent tier; the caller writes it later
+                with save_to_db() (e.g. from the write-behind queue)
+        """
+        entry = CacheEntry(data, time.time())
+        serialized = json.dumps(data, default=str)
+        self._remember(key, entry, len(serialized))
+        self._count('stores')
+
+        if not memory_only:
+            self.save_to_db(key, entry, endpoint, query, location)
+
+        return entry
+
+    def save_to_db(self, key: str, entry: CacheEntry, endpoint: str, query: str = None,
+                   location: str = None):
+        """Write an entry returned by set() to the persistent tier"""
+        if self.db is None:
+            return
+        try:
+            self.db.save_cached_response(key, endpoint, query, location, entry.data, entry.created_at)
+        except Exception as e:
+            print(f"Warning: Response cache store failed: {e}")
+            self._count('db_errors')
+
+    def clear_memory(self):
+        """Drop every entry from the in-process tier"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory-tier occupancy"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._entries)
+            stats['memory_bytes'] = self._bytes
+
+        lookups = stats['memory_hits'] + stats['db_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['db_hits']) / lookups, 3) if lookups else None
+        stats['ttl_seconds'] = self.ttl_seconds
+        stats['max_entries'] = self.max_entries
+        stats['max_bytes'] = self.max_bytes
+        return stats
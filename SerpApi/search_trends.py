@@ -7,8 +7,45 @@ import os
 import requests
 from typing import Dict, Optional
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_search_trends_params(keyword: str, location: str = "US", date_range: str = "today 12-m") -> Dict:
+    """Build SerpApi request parameters for get_search_trends"""
+    params = {
+        "engine": "google_trends",
+        "q": keyword,
+        "api_key": SERPAPI_API_KEY,
+        "data_type": "TIMESERIES",
+        "geo": location,
+        "date": date_range
+    }
+    
+    return params
+
+def parse_search_trends(data: Dict, keyword: str, location: str = "US", date_range: str = "today 12-m") -> Dict:
+    """Convert a raw SerpApi response into the get_search_trends result dict"""
+    # Extract interest over time
+    interest_over_time = data.get("interest_over_time", {})
+    timeline_data = interest_over_time.get("timeline_data", [])
+    
+    # Extract related queries
+    related_queries = data.get("related_queries", {})
+    
+    result = {
+        "keyword": keyword,
+        "location": location,
+        "date_range": date_range,
+        "interest_over_time": timeline_data,
+        "related_queries_rising": related_queries.get("rising", []),
+        "related_queries_top": related_queries.get("top", []),
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def get_search_trends(keyword: str, location: str = "US", date_range: str = "today 12-m") -> Dict:
     """
     Get search trends for a keyword using Google Trends
@@ -22,41 +59,8 @@ def get_search_trends(keyword: str, location: str = "US", date_range: str = "tod
         Dict with search trend data
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_trends",
-            "q": keyword,
-            "api_key": SERPAPI_API_KEY,
-            "data_type": "TIMESERIES",
-            "geo": location,
-            "date": date_range
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract interest over time
-        interest_over_time = data.get("interest_over_time", {})
-        timeline_data = interest_over_time.get("timeline_data", [])
-        
-        # Extract related queries
-        related_queries = data.get("related_queries", {})
-        
-        result = {
-            "keyword": keyword,
-            "location": location,
-            "date_range": date_range,
-            "interest_over_time": timeline_data,
-            "related_queries_rising": related_queries.get("rising", []),
-            "related_queries_top": related_queries.get("top", []),
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_search_trends_params(keyword, location, date_range))
+        return parse_search_trends(data, keyword, location, date_range)
         
     except requests.exceptions.RequestException as e:
         return {
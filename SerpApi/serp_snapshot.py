@@ -0,0 +1,189 @@
+"""
+SerpApi - SERP Snapshot
+Fetch the raw Google results page once per (keyword, location, num) and run
+the organic-results, keyword-difficulty and SERP-feature analyzers over it
+"""
+
+import os
+import threading
+import time
+import requests
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from serpapi_client import serpapi_get
+from google_search import build_google_search_params, parse_google_search
+from keyword_difficulty import parse_keyword_difficulty
+from serp_analysis import parse_serp_analysis
+
+# Difficulty and SERP analysis both read the top 100 results
+SNAPSHOT_NUM = 100
+
+# How long a fetched page is reused, in seconds (override via environment)
+DEFAULT_SNAPSHOT_TTL = float(os.getenv('SERP_SNAPSHOT_TTL', '300'))
+# Most pages kept at once; the least recently used go first
+DEFAULT_SNAPSHOT_MAX_ENTRIES = int(os.getenv('SERP_SNAPSHOT_MAX_ENTRIES', '256'))
+
+class SerpSnapshotCache:
+    """
+    In-process cache of raw engine=google responses
+
+    Concurrent callers asking for the same page wait on a per-key lock, so a
+    page is fetched from SerpApi at most once per TTL window. A key's lock
+    exists only while callers use it. At most max_entries pages are kept;
+    expired pages are dropped on every insert.
+    """
+
+    def __init__(self, ttl_seconds: float = None, max_entries: int = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else DEFAULT_SNAPSHOT_TTL
+        self.max_entries = max_entries or DEFAULT_SNAPSHOT_MAX_ENTRIES
+        self._snapshots = OrderedDict()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _key_lock(self, key: Tuple):
+        """Hold the key's lock; it is dropped when its last user (holder or waiter) leaves"""
+        with self._lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+    def _fresh(self, key: Tuple) -> Optional[Dict]:
+        with self._lock:
+            entry = self._snapshots.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._snapshots.move_to_end(key)
+                return entry[1]
+            return None
+
+    def _store(self, key: Tuple, data: Dict):
+        """Insert a page, dropping expired and least recently used pages"""
+        now = time.monotonic()
+        with self._lock:
+            self._snapshots[key] = (now, data)
+            self._snapshots.move_to_end(key)
+            for expired in [k for k, (fetched_at, _) in self._snapshots.items()
+                            if now - fetched_at >= self.ttl_seconds]:
+                del self._snapshots[expired]
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+
+    def get(self, keyword: str, location: str = None, num: int = SNAPSHOT_NUM) -> Dict:
+        """
+        Get the raw SERP for a keyword, fetching it only if no fresh copy exists
+
+        Raises:
+            requests.exceptions.RequestException on network or HTTP errors
+        """
+        key = (keyword, location, num)
+        data = self._fresh(key)
+        if data is not None:
+            return data
+
+        with self._key_lock(key):
+            data = self._fresh(key)
+            if data is None:
+                data = serpapi_get(build_google_search_params(keyword, location, num))
+                self._store(key, data)
+            return data
+
+    def clear(self):
+        """Drop all cached pages (locks in use go away once their callers finish)"""
+        with self._lock:
+            self._snapshots.clear()
+
+# Singleton instance
+_snapshot_cache = SerpSnapshotCache()
+
+def get_snapshot_cache() -> SerpSnapshotCache:
+    """Get shared SERP snapshot cache instance"""
+    return _snapshot_cache
+
+def _top_results(data: Dict, num_results: int) -> Dict:
+    """Trim a snapshot to what a smaller num request would have returned"""
+    organic_results = data.get("organic_results", [])
+    if len(organic_results) <= num_results:
+        return data
+    return {**data, "organic_results": organic_results[:num_results]}
+
+def _error(keyword_field: str, keyword: str, location: str, error: str) -> Dict:
+    return {
+        keyword_field: keyword,
+        "location": location,
+        "status": "error",
+        "error": error
+    }
+
+def snapshot_google_search(query: str, location: str = None, num_results: int = 10) -> Dict:
+    """
+    google_search() served from the shared SERP snapshot
+
+    Requests for more than SNAPSHOT_NUM results fetch their own page.
+    """
+    try:
+        num = max(num_results, SNAPSHOT_NUM)
+        data = _snapshot_cache.get(query, location, num)
+        return parse_google_search(_top_results(data, num_results), query, location, num_results)
+
+    except requests.exceptions.RequestException as e:
+        return _error("query", query, location, str(e))
+    except Exception as e:
+        return _error("query", query, location, f"Unexpected error: {str(e)}")
+
+def snapshot_keyword_difficulty(keyword: str, location: str = None) -> Dict:
+    """get_keyword_difficulty() served from the shared SERP snapshot"""
+    try:
+        data = _snapshot_cache.get(keyword, location)
+        return parse_keyword_difficulty(data, keyword, location)
+
+    except requests.exceptions.RequestException as e:
+        return _error("keyword", keyword, location, str(e))
+    except Exception as e:
+        return _error("keyword", keyword, location, f"Unexpected error: {str(e)}")
+
+def snapshot_serp_analysis(keyword: str, location: str = None) -> Dict:
+    """analyze_serp() served from the shared SERP snapshot"""
+    try:
+        data = _snapshot_cache.get(keyword, location)
+        return parse_serp_analysis(data, keyword, location)
+
+    except requests.exceptions.RequestException as e:
+        return _error("keyword", keyword, location, str(e))
+    except Exception as e:
+        return _error("keyword", keyword, location, f"Unexpected error: {str(e)}")
+
+def analyze_keyword_serp(keyword: str, location: str = None, num_results: int = 10) -> Dict:
+    """
+    Run all three SERP analyzers over a single fetched page
+
+    Args:
+        keyword: The keyword to analyze
+        location: Optional location for localized results
+        num_results: Number of organic results in the google_search section
+
+    Returns:
+        Dict with 'google_search', 'keyword_difficulty' and 'serp_analysis' results
+    """
+    return {
+        "google_search": snapshot_google_search(keyword, location, num_results),
+        "keyword_difficulty": snapshot_keyword_difficulty(keyword, location),
+        "serp_analysis": snapshot_serp_analysis(keyword, location)
+    }
+
+if __name__ == "__main__":
+    # Example usage
+    print("Testing SERP Snapshot...")
+    result = analyze_keyword_serp("moving companies miami", "Miami, Florida, United States", 5)
+    for name, section in result.items():
+        print(f"{name}: {section.get('status')}")
@@ -0,0 +1,570 @@
+"""
+SerpApi - Async Search Functions
+Awaitable counterparts of the engine functions served by the dashboard
+Same result dicts as the sync modules, run on aiohttp with bounded concurrency
+Requires: pip install aiohttp
+"""
+
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from serpapi_client import SERPAPI_URL, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from rate_limiter import RateLimitError, get_rate_limiter
+from resilience import DEFAULT_MAX_RETRIES, CircuitOpenError, backoff_delay, get_breaker, is_retryable_status
+
+from google_search import build_google_search_params, parse_google_search
+from keyword_suggestions import build_keyword_suggestions_params, parse_keyword_suggestions
+from autocomplete_suggestions import build_autocomplete_suggestions_params, parse_autocomplete_suggestions
+from local_pack_results import build_local_pack_results_params, parse_local_pack_results
+from local_businesses import build_local_businesses_params, parse_local_businesses
+from people_also_ask import build_people_also_ask_params, parse_people_also_ask
+from related_searches import build_related_searches_params, parse_related_searches
+from keyword_search_volume import build_keyword_search_volume_params, parse_keyword_search_volume
+from search_trends import build_search_trends_params, parse_search_trends
+from keyword_difficulty import build_keyword_difficulty_params, parse_keyword_difficulty
+from serp_analysis import build_serp_analysis_params, parse_serp_analysis
+from competitor_keywords import build_competitor_keywords_params, parse_competitor_keywords
+from image_search import build_images_params, parse_images
+from news_search import build_news_params, parse_news
+from shopping_search import build_shopping_params, parse_shopping
+from yelp_search import build_yelp_businesses_params, parse_yelp_businesses
+from youtube_search import build_youtube_params, parse_youtube
+from google_jobs import build_jobs_params, parse_jobs
+from tripadvisor_search import build_tripadvisor_params, parse_tripadvisor
+from linkedin_jobs import build_linkedin_jobs_params, parse_linkedin_jobs
+from apple_app_store import build_apple_apps_params, parse_apple_apps
+from google_play_store import build_google_play_apps_params, parse_google_play_apps
+from google_patents import build_patents_params, parse_patents
+from amazon_product import build_amazon_products_params, parse_amazon_products
+from walmart_product import build_walmart_products_params, parse_walmart_products
+from keyword_volume_tracker import (
+    DEFAULT_DATE_RANGES,
+    build_keyword_volume_period_params, parse_keyword_volume_period, parse_keyword_volume_history,
+    build_multi_keyword_comparison_params, parse_multi_keyword_comparison,
+    build_regional_interest_params, parse_regional_interest
+)
+from bing_search import build_bing_params, parse_bing, build_bing_autocomplete_params, parse_bing_autocomplete
+from duckduckgo_search import (
+    build_duckduckgo_params, parse_duckduckgo,
+    build_duckduckgo_instant_answers_params, parse_duckduckgo_instant_answers
+)
+from google_scholar import build_scholar_params, parse_scholar, build_scholar_author_params, parse_scholar_author
+from google_finance import build_finance_params, parse_finance, build_market_trends_params, parse_market_trends
+
+# Maximum number of in-flight SerpApi requests per client
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('SERPAPI_ASYNC_CONCURRENCY', '50'))
+
+class AsyncSerpApiClient:
+    """
+    aiohttp-based SerpApi client with a bounded concurrency semaphore
+
+    The underlying session is bound to the event loop that first uses it; a
+    new session is opened transparently if the client is reused from a
+    different loop (e.g. successive asyncio.run() calls). Retries and circuit
+    breakers are shared with the sync client (see resilience.py).
+    """
+
+    def __init__(self, max_concurrency: int = None, connect_timeout: float = None,
+                 read_timeout: float = None, max_retries: int = None):
+        self.max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout or DEFAULT_CONNECT_TIMEOUT,
+            sock_read=read_timeout or DEFAULT_READ_TIMEOUT
+        )
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Open the session and semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is not loop:
+            await self._close_stale_session()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._session
+
+    async def _close_stale_session(self):
+        """Close the session opened on another event loop before replacing it"""
+        session, session_loop = self._session, self._loop
+        self._session = None
+        if session_loop.is_running():
+            # Still serving another thread: close it on its own loop
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        try:
+            # With the old loop closed this only releases the connector
+            await session.close()
+        except Exception as e:
+            print(f"Warning: Could not close previous aiohttp session: {e}")
+            session.detach()
+
+    async def get(self, params: Dict) -> Dict:
+        """
+        Perform a SerpApi search and return the decoded JSON body
+
+        Raises:
+            aiohttp.ClientError or asyncio.TimeoutError on network or HTTP errors
+            rate_limiter.RateLimitError or resilience.CircuitOpenError when the
+            request is refused locally
+        """
+        engine = params.get("engine")
+        breaker = get_breaker(engine)
+        breaker.before_call()
+
+        try:
+            data = await self._send(engine, params)
+        except BaseException as e:
+            # Every exit settles the breaker, cancellation included; otherwise a
+            # half-open probe stays in flight for good
+            if _is_engine_failure(e):
+                breaker.record_failure(e)
+            else:
+                breaker.release()
+            raise
+
+        breaker.record_success()
+        return data
+
+    async def _send(self, engine: str, params: Dict) -> Dict:
+        """Send a request with retries and decode the body (the breaker is settled by get())"""
+        session = await self._ensure_session()
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            # Every attempt is a billed request, retries included
+            wait = get_rate_limiter().reserve(engine)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                async with self._semaphore:
+                    async with session.get(SERPAPI_URL, params=_encode_params(params)) as response:
+                        if is_retryable_status(response.status) and retries_left:
+                            retry_after = response.headers.get("Retry-After")
+                        else:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+            except (aiohttp.ServerTimeoutError, asyncio.TimeoutError):
+                # Timeouts are not retried; the caller already waited the full timeout
+                raise
+            except aiohttp.ClientConnectionError:
+                if not retries_left:
+                    raise
+                retry_after = None
+
+            await asyncio.sleep(backoff_delay(attempt, retry_after))
+
+    async def close(self):
+        """Close the underlying session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+def _is_engine_failure(error: BaseException) -> bool:
+    """Whether an error from AsyncSerpApiClient.get counts against the engine's circuit breaker"""
+    if isinstance(error, RateLimitError):
+        # Refused locally; nothing was sent
+        return False
+    if isinstance(error, aiohttp.ClientResponseError):
+        # Other 4xx responses are request problems, not engine failures
+        return is_retryable_status(error.status)
+    # Network, timeout and payload errors, and bodies that are not JSON
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError, ValueError))
+
+def _encode_params(params: Dict) -> Dict:
+    """Encode params the way requests does (drop None, stringify scalars)"""
+    return {key: str(value) for key, value in params.items() if value is not None}
+
+# Shared client instance
+_async_client = None
+
+def get_async_client() -> AsyncSerpApiClient:
+    """Get shared async SerpApi client instance"""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncSerpApiClient()
+    return _async_client
+
+async def _search(params: Dict, parse: Callable[[Dict], Dict], error_fields: Dict,
+                  request_error_prefix: str = "", error_prefix: str = "Unexpected error: ") -> Dict:
+    """Fetch one SerpApi page and parse it, mirroring the sync modules' error dicts"""
+    try:
+        data = await get_async_client().get(params)
+        return parse(data)
+    except (aiohttp.ClientError, asyncio.TimeoutError, RateLimitError, CircuitOpenError) as e:
+        return {**error_fields, "status": "error", "error": f"{request_error_prefix}{str(e)}"}
+    except Exception as e:
+        return {**error_fields, "status": "error", "error": f"{error_prefix}{str(e)}"}
+
+# ============================================================================
+# CORE SEARCH & KEYWORD RESEARCH
+# ============================================================================
+
+async def google_search_async(query: str, location: str = None, num_results: int = 10) -> Dict:
+    """Async counterpart of google_search.google_search"""
+    return await _search(
+        build_google_search_params(query, location, num_results),
+        lambda data: parse_google_search(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def get_keyword_suggestions_async(seed_keyword: str, location: str = None) -> Dict:
+    """Async counterpart of keyword_suggestions.get_keyword_suggestions"""
+    return await _search(
+        build_keyword_suggestions_params(seed_keyword, location),
+        lambda data: parse_keyword_suggestions(data, seed_keyword, location),
+        {"seed_keyword": seed_keyword, "location": location}
+    )
+
+async def get_autocomplete_suggestions_async(partial_keyword: str, location: str = None) -> Dict:
+    """Async counterpart of autocomplete_suggestions.get_autocomplete_suggestions"""
+    return await _search(
+        build_autocomplete_suggestions_params(partial_keyword, location),
+        lambda data: parse_autocomplete_suggestions(data, partial_keyword, location),
+        {"partial_keyword": partial_keyword, "location": location}
+    )
+
+async def get_local_pack_results_async(keyword: str, location: str) -> Dict:
+    """Async counterpart of local_pack_results.get_local_pack_results"""
+    return await _search(
+        build_local_pack_results_params(keyword, location),
+        lambda data: parse_local_pack_results(data, keyword, location),
+        {"keyword": keyword, "location": location}
+    )
+
+async def search_local_businesses_async(query: str, location: str, num_results: int = 20) -> Dict:
+    """Async counterpart of local_businesses.search_local_businesses"""
+    return await _search(
+        build_local_businesses_params(query, location, num_results),
+        lambda data: parse_local_businesses(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def get_people_also_ask_async(keyword: str) -> Dict:
+    """Async counterpart of people_also_ask.get_people_also_ask"""
+    return await _search(
+        build_people_also_ask_params(keyword),
+        lambda data: parse_people_also_ask(data, keyword),
+        {"keyword": keyword}
+    )
+
+async def get_related_searches_async(query: str, location: str = None) -> Dict:
+    """Async counterpart of related_searches.get_related_searches"""
+    return await _search(
+        build_related_searches_params(query, location),
+        lambda data: parse_related_searches(data, query, location),
+        {"query": query, "location": location}
+    )
+
+async def get_keyword_search_volume_async(keyword: str, location: str = "United States") -> Dict:
+    """Async counterpart of keyword_search_volume.get_keyword_search_volume"""
+    return await _search(
+        build_keyword_search_volume_params(keyword, location),
+        lambda data: parse_keyword_search_volume(data, keyword, location),
+        {"keyword": keyword, "location": location}
+    )
+
+async def get_search_trends_async(keyword: str, location: str = "US", date_range: str = "today 12-m") -> Dict:
+    """Async counterpart of search_trends.get_search_trends"""
+    return await _search(
+        build_search_trends_params(keyword, location, date_range),
+        lambda data: parse_search_trends(data, keyword, location, date_range),
+        {"keyword": keyword, "location": location}
+    )
+
+# ============================================================================
+# COMPETITIVE INTELLIGENCE
+# ============================================================================
+
+async def get_keyword_difficulty_async(keyword: str, location: str = None) -> Dict:
+    """Async counterpart of keyword_difficulty.get_keyword_difficulty"""
+    return await _search(
+        build_keyword_difficulty_params(keyword, location),
+        lambda data: parse_keyword_difficulty(data, keyword, location),
+        {"keyword": keyword, "location": location}
+    )
+
+async def analyze_serp_async(keyword: str, location: str = None) -> Dict:
+    """Async counterpart of serp_analysis.analyze_serp"""
+    return await _search(
+        build_serp_analysis_params(keyword, location),
+        lambda data: parse_serp_analysis(data, keyword, location),
+        {"keyword": keyword, "location": location}
+    )
+
+async def get_competitor_keywords_async(competitor_domain: str, location: str = "United States",
+                                        num_results: int = 100) -> Dict:
+    """Async counterpart of competitor_keywords.get_competitor_keywords"""
+    return await _search(
+        build_competitor_keywords_params(competitor_domain, location, num_results),
+        lambda data: parse_competitor_keywords(data, competitor_domain, location, num_results),
+        {"competitor_domain": competitor_domain, "location": location}
+    )
+
+# ============================================================================
+# MEDIA & CONTENT
+# ============================================================================
+
+async def search_images_async(query: str, num_results: int = 20) -> Dict:
+    """Async counterpart of image_search.search_images"""
+    return await _search(
+        build_images_params(query, num_results),
+        lambda data: parse_images(data, query, num_results),
+        {"query": query}
+    )
+
+async def search_news_async(query: str, location: str = None, date_range: str = None,
+                            num_results: int = 20) -> Dict:
+    """Async counterpart of news_search.search_news"""
+    return await _search(
+        build_news_params(query, location, date_range, num_results),
+        lambda data: parse_news(data, query, location, date_range, num_results),
+        {"query": query, "location": location}
+    )
+
+async def search_shopping_async(query: str, location: str = None, num_results: int = 20) -> Dict:
+    """Async counterpart of shopping_search.search_shopping"""
+    return await _search(
+        build_shopping_params(query, location, num_results),
+        lambda data: parse_shopping(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def search_youtube_async(query: str, num_results: int = 10) -> Dict:
+    """Async counterpart of youtube_search.search_youtube"""
+    return await _search(
+        build_youtube_params(query, num_results),
+        lambda data: parse_youtube(data, query, num_results),
+        {"query": query}
+    )
+
+# ============================================================================
+# REVIEWS, JOBS & APPS
+# ============================================================================
+
+async def search_yelp_businesses_async(query: str, location: str, num_results: int = 10) -> Dict:
+    """Async counterpart of yelp_search.search_yelp_businesses"""
+    return await _search(
+        build_yelp_businesses_params(query, location, num_results),
+        lambda data: parse_yelp_businesses(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def search_tripadvisor_async(query: str, location: str = None) -> Dict:
+    """Async counterpart of tripadvisor_search.search_tripadvisor"""
+    return await _search(
+        build_tripadvisor_params(query, location),
+        lambda data: parse_tripadvisor(data, query, location),
+        {"query": query, "location": location}
+    )
+
+async def search_jobs_async(query: str, location: str, num_results: int = 10) -> Dict:
+    """Async counterpart of google_jobs.search_jobs"""
+    return await _search(
+        build_jobs_params(query, location, num_results),
+        lambda data: parse_jobs(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def search_linkedin_jobs_async(query: str, location: str, num_results: int = 10) -> Dict:
+    """Async counterpart of linkedin_jobs.search_linkedin_jobs"""
+    return await _search(
+        build_linkedin_jobs_params(query, location, num_results),
+        lambda data: parse_linkedin_jobs(data, query, location, num_results),
+        {"query": query, "location": location}
+    )
+
+async def search_apple_apps_async(query: str, country: str = "us") -> Dict:
+    """Async counterpart of apple_app_store.search_apple_apps"""
+    return await _search(
+        build_apple_apps_params(query, country),
+        lambda data: parse_apple_apps(data, query, country),
+        {"query": query, "country": country}
+    )
+
+async def search_google_play_apps_async(query: str, country: str = "us") -> Dict:
+    """Async counterpart of google_play_store.search_google_play_apps"""
+    return await _search(
+        build_google_play_apps_params(query, country),
+        lambda data: parse_google_play_apps(data, query, country),
+        {"query": query, "country": country}
+    )
+
+# ============================================================================
+# ECOMMERCE & INNOVATION
+# ============================================================================
+
+async def search_patents_async(query: str, num_results: int = 10) -> Dict:
+    """Async counterpart of google_patents.search_patents"""
+    return await _search(
+        build_patents_params(query, num_results),
+        lambda data: parse_patents(data, query, num_results),
+        {"query": query}
+    )
+
+async def search_amazon_products_async(query: str, domain: str = "amazon.com") -> Dict:
+    """Async counterpart of amazon_product.search_amazon_products"""
+    return await _search(
+        build_amazon_products_params(query, domain),
+        lambda data: parse_amazon_products(data, query, domain),
+        {"query": query, "domain": domain}
+    )
+
+async def search_walmart_products_async(query: str) -> Dict:
+    """Async counterpart of walmart_product.search_walmart_products"""
+    return await _search(
+        build_walmart_products_params(query),
+        lambda data: parse_walmart_products(data, query),
+        {"query": query}
+    )
+
+# ============================================================================
+# KEYWORD VOLUME TRACKING
+# ============================================================================
+
+async def get_keyword_volume_history_async(keyword: str, location: str = "US",
+                                           date_ranges: List[str] = None) -> Dict:
+    """Async counterpart of keyword_volume_tracker.get_keyword_volume_history (periods fetched concurrently)"""
+    if date_ranges is None:
+        date_ranges = DEFAULT_DATE_RANGES
+
+    client = get_async_client()
+    error_fields = {"keyword": keyword, "location": location}
+    try:
+        pages = await asyncio.gather(*[
+            client.get(build_keyword_volume_period_params(keyword, location, date_range))
+            for date_range in date_ranges
+        ])
+        all_data = [parse_keyword_volume_period(data, date_range)
+                    for data, date_range in zip(pages, date_ranges)]
+        return parse_keyword_volume_history(all_data, keyword, location)
+    except (aiohttp.ClientError, asyncio.TimeoutError, RateLimitError, CircuitOpenError) as e:
+        return {**error_fields, "status": "error", "error": str(e)}
+    except Exception as e:
+        return {**error_fields, "status": "error", "error": f"Unexpected error: {str(e)}"}
+
+async def get_multi_keyword_comparison_async(keywords: List[str], location: str = "US",
+                                             date_range: str = "today 3-m") -> Dict:
+    """Async counterpart of keyword_volume_tracker.get_multi_keyword_comparison"""
+    return await _search(
+        build_multi_keyword_comparison_params(keywords, location, date_range),
+        lambda data: parse_multi_keyword_comparison(data, keywords, location, date_range),
+        {"keywords": keywords, "location": location}
+    )
+
+async def get_regional_interest_async(keyword: str, country: str = "US") -> Dict:
+    """Async counterpart of keyword_volume_tracker.get_regional_interest"""
+    return await _search(
+        build_regional_interest_params(keyword, country),
+        lambda data: parse_regional_interest(data, keyword, country),
+        {"keyword": keyword, "country": country}
+    )
+
+# ============================================================================
+# ALTERNATIVE SEARCH ENGINES & FINANCE
+# ============================================================================
+
+async def search_bing_async(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Async counterpart of bing_search.search_bing"""
+    return await _search(
+        build_bing_params(query, num_results, location),
+        lambda data: parse_bing(data, query, num_results, location),
+        {"query": query, "search_engine": "Bing"},
+        request_error_prefix="Request failed: "
+    )
+
+async def get_bing_autocomplete_async(query: str, location: str = "Miami, FL") -> Dict:
+    """Async counterpart of bing_search.get_bing_autocomplete"""
+    return await _search(
+        build_bing_autocomplete_params(query, location),
+        lambda data: parse_bing_autocomplete(data, query, location),
+        {"query": query, "search_engine": "Bing"},
+        request_error_prefix="Error getting autocomplete: ",
+        error_prefix="Error getting autocomplete: "
+    )
+
+async def search_duckduckgo_async(query: str, num_results: int = 10, location: str = "Miami, FL") -> Dict:
+    """Async counterpart of duckduckgo_search.search_duckduckgo"""
+    return await _search(
+        build_duckduckgo_params(query, num_results, location),
+        lambda data: parse_duckduckgo(data, query, num_results, location),
+        {"query": query, "search_engine": "DuckDuckGo"},
+        request_error_prefix="Request failed: "
+    )
+
+async def get_duckduckgo_instant_answers_async(query: str) -> Dict:
+    """Async counterpart of duckduckgo_search.get_duckduckgo_instant_answers"""
+    return await _search(
+        build_duckduckgo_instant_answers_params(query),
+        lambda data: parse_duckduckgo_instant_answers(data, query),
+        {"query": query, "search_engine": "DuckDuckGo"},
+        request_error_prefix="Error getting instant answers: ",
+        error_prefix="Error getting instant answers: "
+    )
+
+async def search_scholar_async(query: str, num_results: int = 10, year_start: Optional[int] = None,
+                               year_end: Optional[int] = None) -> Dict:
+    """Async counterpart of google_scholar.search_scholar"""
+    return await _search(
+        build_scholar_params(query, num_results, year_start, year_end),
+        lambda data: parse_scholar(data, query, num_results, year_start, year_end),
+        {"query": query, "search_engine": "Google Scholar"},
+        request_error_prefix="Request failed: "
+    )
+
+async def get_scholar_author_async(author_name: str, num_results: int = 10) -> Dict:
+    """Async counterpart of google_scholar.get_scholar_author"""
+    return await _search(
+        build_scholar_author_params(author_name, num_results),
+        lambda data: parse_scholar_author(data, author_name, num_results),
+        {"author_name": author_name, "search_engine": "Google Scholar"},
+        request_error_prefix="Error searching author: ",
+        error_prefix="Error searching author: "
+    )
+
+async def search_finance_async(query: str, num_results: int = 10) -> Dict:
+    """Async counterpart of google_finance.search_finance"""
+    return await _search(
+        build_finance_params(query, num_results),
+        lambda data: parse_finance(data, query, num_results),
+        {"query": query, "search_engine": "Google Finance"},
+        request_error_prefix="Request failed: "
+    )
+
+async def get_market_trends_async(category: str = "transportation") -> Dict:
+    """Async counterpart of google_finance.get_market_trends"""
+    return await _search(
+        build_market_trends_params(category),
+        lambda data: parse_market_trends(data, category),
+        {"category": category, "search_engine": "Google Finance"},
+        request_error_prefix="Error getting market trends: ",
+        error_prefix="Error getting market trends: "
+    )
+
+if __name__ == "__main__":
+    # Fan out a keyword x location grid on one event loop
+    async def _demo():
+        keywords = ["moving companies", "movers", "storage units"]
+        locations = ["Miami, FL", "Orlando, FL", "Tampa, FL"]
+        async with get_async_client():
+            results = await asyncio.gather(*[
+                google_search_async(keyword, location, 10)
+                for keyword in keywords for location in locations
+            ])
+        for result in results:
+            print(f"{result['query']} @ {result['location']}: {result['status']} "
+                  f"({result.get('total_results', 0)} results)")
+
+    asyncio.run(_demo())
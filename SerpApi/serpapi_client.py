@@ -0,0 +1,147 @@
+"""
+SerpApi - Shared HTTP Client
+One pooled keep-alive session used by every SerpApi engine module
+"""
+
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
+
+from rate_limiter import RateLimitError, get_rate_limiter
+from resilience import DEFAULT_MAX_RETRIES, backoff_delay, get_breaker, is_retryable_status
+
+SERPAPI_URL = "https://serpapi.com/search"
+
+# Connection pool and timeout defaults (override via environment)
+DEFAULT_POOL_SIZE = int(os.getenv('SERPAPI_POOL_SIZE', '25'))
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv('SERPAPI_CONNECT_TIMEOUT', '5'))
+DEFAULT_READ_TIMEOUT = float(os.getenv('SERPAPI_READ_TIMEOUT', '30'))
+
+class SerpApiClient:
+    """
+    Thread-safe SerpApi client backed by a single requests.Session
+
+    Connections to serpapi.com are kept alive and reused across calls, so only
+    the first request on each pooled connection pays the TCP+TLS handshake.
+    Connection errors and retryable statuses (429/5xx) are retried with
+    jittered backoff, and each engine has a circuit breaker that fails fast
+    while the engine keeps failing.
+    """
+
+    def __init__(self, pool_size: int = None, connect_timeout: float = None,
+                 read_timeout: float = None, max_retries: int = None):
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = (
+            connect_timeout or DEFAULT_CONNECT_TIMEOUT,
+            read_timeout or DEFAULT_READ_TIMEOUT
+        )
+
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, params: Dict, timeout: Optional[Tuple[float, float]] = None,
+            url: str = SERPAPI_URL) -> Dict:
+        """
+        Perform a GET against SerpApi and return the decoded JSON body
+
+        Args:
+            params: Query parameters (engine, q, api_key, ...)
+            timeout: Optional (connect, read) timeout overriding the defaults
+            url: Endpoint URL (default: the SerpApi search endpoint)
+
+        Returns:
+            Dict with the raw SerpApi response
+
+        Raises:
+            requests.exceptions.RequestException on network or HTTP errors
+            (including rate_limiter.RateLimitError and resilience.CircuitOpenError
+            when the request is refused locally)
+        """
+        engine = params.get("engine")
+        breaker = get_breaker(engine)
+        breaker.before_call()
+
+        try:
+            data = self._send(engine, params, timeout or self.timeout, url)
+        except BaseException as e:
+            # Every exit settles the breaker; otherwise a half-open probe stays in flight for good
+            if _is_engine_failure(e):
+                breaker.record_failure(e)
+            else:
+                breaker.release()
+            raise
+
+        breaker.record_success()
+        return data
+
+    def _send(self, engine: str, params: Dict, timeout: Tuple[float, float], url: str) -> Dict:
+        """Send a request with retries and decode the body (the breaker is settled by get())"""
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            # Every attempt is a billed request, retries included
+            get_rate_limiter().acquire(engine)
+
+            try:
+                response = self.session.get(url, params=params, timeout=timeout)
+            except requests.exceptions.ConnectionError:
+                if retries_left:
+                    time.sleep(backoff_delay(attempt))
+                    continue
+                raise
+            # Read timeouts are not retried; the caller already waited the full timeout
+
+            if is_retryable_status(response.status_code) and retries_left:
+                time.sleep(backoff_delay(attempt, response.headers.get("Retry-After")))
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+def _is_engine_failure(error: BaseException) -> bool:
+    """Whether an error from SerpApiClient.get counts against the engine's circuit breaker"""
+    if isinstance(error, RateLimitError):
+        # Refused locally; nothing was sent
+        return False
+    if isinstance(error, requests.exceptions.HTTPError):
+        # Other 4xx responses are request problems, not engine failures
+        return error.response is None or is_retryable_status(error.response.status_code)
+    # Network and protocol errors, and bodies that are not JSON
+    return isinstance(error, (requests.exceptions.RequestException, ValueError))
+
+# Singleton instance
+_client_instance = None
+_client_lock = threading.Lock()
+
+def get_client() -> SerpApiClient:
+    """Get shared SerpApi client instance"""
+    global _client_instance
+    if _client_instance is None:
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = SerpApiClient()
+    return _client_instance
+
+def configure_client(pool_size: int = None, connect_timeout: float = None,
+                     read_timeout: float = None, max_retries: int = None) -> SerpApiClient:
+    """Replace the shared client with one using the given pool size, timeouts and retries"""
+    global _client_instance
+    with _client_lock:
+        old_client = _client_instance
+        _client_instance = SerpApiClient(pool_size, connect_timeout, read_timeout, max_retries)
+    if old_client is not None:
+        old_client.close()
+    return _client_instance
+
+def serpapi_get(params: Dict, timeout: Optional[Tuple[float, float]] = None) -> Dict:
+    """Perform a SerpApi search through the shared pooled client"""
+    return get_client().get(params, timeout=timeout)
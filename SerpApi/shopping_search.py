@@ -7,8 +7,56 @@ import os
 import requests
 from typing import Dict, Optional
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_shopping_params(query: str, location: str = None, num_results: int = 20) -> Dict:
+    """Build SerpApi request parameters for search_shopping"""
+    params = {
+        "engine": "google_shopping",
+        "q": query,
+        "api_key": SERPAPI_API_KEY,
+        "num": num_results
+    }
+    
+    if location:
+        params["location"] = location
+    
+    return params
+
+def parse_shopping(data: Dict, query: str, location: str = None, num_results: int = 20) -> Dict:
+    """Convert a raw SerpApi response into the search_shopping result dict"""
+    # Extract shopping results
+    shopping_results = []
+    for item in data.get("shopping_results", []):
+        shopping_results.append({
+            "position": item.get("position", 0),
+            "title": item.get("title", ""),
+            "link": item.get("link", ""),
+            "product_link": item.get("product_link", ""),
+            "product_id": item.get("product_id", ""),
+            "source": item.get("source", ""),
+            "price": item.get("price", ""),
+            "extracted_price": item.get("extracted_price", 0),
+            "rating": item.get("rating", 0),
+            "reviews": item.get("reviews", 0),
+            "thumbnail": item.get("thumbnail", ""),
+            "delivery": item.get("delivery", ""),
+            "extensions": item.get("extensions", [])
+        })
+    
+    result = {
+        "query": query,
+        "location": location,
+        "total_results": len(shopping_results),
+        "products": shopping_results,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_shopping(query: str, location: str = None, num_results: int = 20) -> Dict:
     """
     Search for shopping/product results on Google Shopping
@@ -22,52 +70,8 @@ def search_shopping(query: str, location: str = None, num_results: int = 20) ->
         Dict with shopping results
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "google_shopping",
-            "q": query,
-            "api_key": SERPAPI_API_KEY,
-            "num": num_results
-        }
-        
-        if location:
-            params["location"] = location
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract shopping results
-        shopping_results = []
-        for item in data.get("shopping_results", []):
-            shopping_results.append({
-                "position": item.get("position", 0),
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "product_link": item.get("product_link", ""),
-                "product_id": item.get("product_id", ""),
-                "source": item.get("source", ""),
-                "price": item.get("price", ""),
-                "extracted_price": item.get("extracted_price", 0),
-                "rating": item.get("rating", 0),
-                "reviews": item.get("reviews", 0),
-                "thumbnail": item.get("thumbnail", ""),
-                "delivery": item.get("delivery", ""),
-                "extensions": item.get("extensions", [])
-            })
-        
-        result = {
-            "query": query,
-            "location": location,
-            "total_results": len(shopping_results),
-            "products": shopping_results,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_shopping_params(query, location, num_results))
+        return parse_shopping(data, query, location, num_results)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -8,8 +8,52 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_tripadvisor_params(query: str, location: str = None) -> Dict:
+    """Build SerpApi request parameters for search_tripadvisor"""
+    params = {
+        "engine": "tripadvisor",
+        "q": query,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    if location:
+        params["location"] = location
+    
+    return params
+
+def parse_tripadvisor(data: Dict, query: str, location: str = None) -> Dict:
+    """Convert a raw SerpApi response into the search_tripadvisor result dict"""
+    # Extract business results
+    businesses = []
+    for item in data.get("organic_results", []):
+        businesses.append({
+            "business_name": item.get("title", ""),
+            "tripadvisor_url": item.get("link", ""),
+            "rating": item.get("rating"),
+            "reviews_count": item.get("reviews"),
+            "address": item.get("address", ""),
+            "phone": item.get("phone", ""),
+            "description": item.get("description", ""),
+            "category": item.get("category", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "location": location,
+        "total_results": len(businesses),
+        "businesses": businesses,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_tripadvisor(query: str, location: str = None) -> Dict:
     """
     Search for businesses on TripAdvisor (useful for storage facilities, moving services)
@@ -22,48 +66,8 @@ def search_tripadvisor(query: str, location: str = None) -> Dict:
         Dict with TripAdvisor business results including ratings, reviews
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "tripadvisor",
-            "q": query,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        if location:
-            params["location"] = location
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract business results
-        businesses = []
-        for item in data.get("organic_results", []):
-            businesses.append({
-                "business_name": item.get("title", ""),
-                "tripadvisor_url": item.get("link", ""),
-                "rating": item.get("rating"),
-                "reviews_count": item.get("reviews"),
-                "address": item.get("address", ""),
-                "phone": item.get("phone", ""),
-                "description": item.get("description", ""),
-                "category": item.get("category", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "location": location,
-            "total_results": len(businesses),
-            "businesses": businesses,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_tripadvisor_params(query, location))
+        return parse_tripadvisor(data, query, location)
         
     except requests.exceptions.RequestException as e:
         return {
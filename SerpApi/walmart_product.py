@@ -8,8 +8,54 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_walmart_products_params(query: str) -> Dict:
+    """Build SerpApi request parameters for search_walmart_products"""
+    params = {
+        "engine": "walmart",
+        "query": query,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_walmart_products(data: Dict, query: str) -> Dict:
+    """Convert a raw SerpApi response into the search_walmart_products result dict"""
+    # Extract product results
+    products = []
+    for item in data.get("organic_results", []):
+        # Extract primary offer
+        primary_offer = item.get("primary_offer", {})
+        
+        products.append({
+            "product_name": item.get("title", ""),
+            "product_id": item.get("us_item_id", ""),
+            "product_url": item.get("product_page_url", ""),
+            "rating": item.get("rating"),
+            "reviews_count": item.get("reviews"),
+            "price": primary_offer.get("offer_price"),
+            "was_price": primary_offer.get("list_price"),
+            "savings": primary_offer.get("savings"),
+            "in_stock": primary_offer.get("in_stock", False),
+            "shipping": primary_offer.get("shipping_options", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            "seller": item.get("seller_name", "Walmart"),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "total_results": len(products),
+        "products": products,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_walmart_products(query: str) -> Dict:
     """
     Search for products on Walmart (moving boxes, packing supplies)
@@ -21,50 +67,8 @@ def search_walmart_products(query: str) -> Dict:
         Dict with Walmart product results including prices, ratings, availability
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "walmart",
-            "query": query,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract product results
-        products = []
-        for item in data.get("organic_results", []):
-            # Extract primary offer
-            primary_offer = item.get("primary_offer", {})
-            
-            products.append({
-                "product_name": item.get("title", ""),
-                "product_id": item.get("us_item_id", ""),
-                "product_url": item.get("product_page_url", ""),
-                "rating": item.get("rating"),
-                "reviews_count": item.get("reviews"),
-                "price": primary_offer.get("offer_price"),
-                "was_price": primary_offer.get("list_price"),
-                "savings": primary_offer.get("savings"),
-                "in_stock": primary_offer.get("in_stock", False),
-                "shipping": primary_offer.get("shipping_options", ""),
-                "thumbnail": item.get("thumbnail", ""),
-                "seller": item.get("seller_name", "Walmart"),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "total_results": len(products),
-            "products": products,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_walmart_products_params(query))
+        return parse_walmart_products(data, query)
         
     except requests.exceptions.RequestException as e:
         return {
@@ -8,8 +8,57 @@ import os
 import requests
 from typing import Dict
 
+from serpapi_client import serpapi_get
+
 SERPAPI_API_KEY = os.getenv('SERPAPI_API_KEY', '850faf17d2e379f54ffdd1e300daaa7bdb1dee8abdc2536f1de3430d137e563c')
 
+def build_youtube_params(query: str, num_results: int = 10) -> Dict:
+    """Build SerpApi request parameters for search_youtube"""
+    params = {
+        "engine": "youtube",
+        "search_query": query,
+        "api_key": SERPAPI_API_KEY
+    }
+    
+    return params
+
+def parse_youtube(data: Dict, query: str, num_results: int = 10) -> Dict:
+    """Convert a raw SerpApi response into the search_youtube result dict"""
+    # Extract video results
+    videos = []
+    for item in data.get("video_results", [])[:num_results]:
+        # Extract channel info
+        channel = item.get("channel", {})
+        
+        # Extract view count (parse from string like "1.2M views")
+        views_str = item.get("views", "0")
+        
+        videos.append({
+            "video_id": item.get("link", "").split("v=")[-1] if "v=" in item.get("link", "") else "",
+            "title": item.get("title", ""),
+            "video_url": item.get("link", ""),
+            "thumbnail_url": item.get("thumbnail", {}).get("static", ""),
+            "channel_name": channel.get("name", ""),
+            "channel_url": channel.get("link", ""),
+            "channel_thumbnail": channel.get("thumbnail", ""),
+            "channel_verified": channel.get("verified", False),
+            "description": item.get("description", ""),
+            "views": views_str,
+            "published_date": item.get("published_date", ""),
+            "duration": item.get("length", ""),
+            "position": item.get("position", 0)
+        })
+    
+    result = {
+        "query": query,
+        "total_results": len(videos),
+        "videos": videos,
+        "status": "success",
+        "search_metadata": data.get("search_metadata", {})
+    }
+    
+    return result
+
 def search_youtube(query: str, num_results: int = 10) -> Dict:
     """
     Search for videos on YouTube
@@ -22,53 +71,8 @@ def search_youtube(query: str, num_results: int = 10) -> Dict:
         Dict with YouTube video results including views, likes, engagement
     """
     try:
-        url = "https://serpapi.com/search"
-        
-        params = {
-            "engine": "youtube",
-            "search_query": query,
-            "api_key": SERPAPI_API_KEY
-        }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract video results
-        videos = []
-        for item in data.get("video_results", [])[:num_results]:
-            # Extract channel info
-            channel = item.get("channel", {})
-            
-            # Extract view count (parse from string like "1.2M views")
-            views_str = item.get("views", "0")
-            
-            videos.append({
-                "video_id": item.get("link", "").split("v=")[-1] if "v=" in item.get("link", "") else "",
-                "title": item.get("title", ""),
-                "video_url": item.get("link", ""),
-                "thumbnail_url": item.get("thumbnail", {}).get("static", ""),
-                "channel_name": channel.get("name", ""),
-                "channel_url": channel.get("link", ""),
-                "channel_thumbnail": channel.get("thumbnail", ""),
-                "channel_verified": channel.get("verified", False),
-                "description": item.get("description", ""),
-                "views": views_str,
-                "published_date": item.get("published_date", ""),
-                "duration": item.get("length", ""),
-                "position": item.get("position", 0)
-            })
-        
-        result = {
-            "query": query,
-            "total_results": len(videos),
-            "videos": videos,
-            "status": "success",
-            "search_metadata": data.get("search_metadata", {})
-        }
-        
-        return result
+        data = serpapi_get(build_youtube_params(query, num_results))
+        return parse_youtube(data, query, num_results)
         
     except requests.exceptions.RequestException as e:
         return {